@@ -9,6 +9,7 @@ from parallel_web_tools.core import (
     ParseError,
     ProcessorType,
     SourceType,
+    arun_research,
     cancel_monitor,
     create_monitor,
     enrich_batch,
@@ -78,4 +79,5 @@ __all__ = [
     "update_monitor",
     # Research
     "run_research",
+    "arun_research",
 ]
@@ -1,5 +1,6 @@
 """CLI commands for Parallel."""
 
+import asyncio
 import csv
 import json
 import logging
@@ -7,6 +8,7 @@ import os
 import sys
 import tempfile
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, NoReturn
 
@@ -25,6 +27,7 @@ from parallel_web_tools.core import (
     MONITOR_TYPES,
     RESEARCH_PROCESSORS,
     ReauthenticationRequired,
+    arun_research,
     cancel_findall_run,
     cancel_monitor,
     create_findall_run,
@@ -154,7 +157,7 @@ DEFAULT_RESEARCH_OUTPUT_DIR = "parallel-research"
 # =============================================================================
 
 
-def _extract_api_message(error: Exception) -> str:
+def _extract_api_message(error: BaseException) -> str:
     """Extract a clean error message from API exceptions."""
     # SDK errors often embed a dict repr; try to extract the inner message
     body = getattr(error, "body", None)
@@ -241,6 +244,16 @@ def _exit_research_interrupted(run_id: str | None) -> NoReturn:
     sys.exit(EXIT_INTERRUPTED)
 
 
+def _exit_research_batch_interrupted(run_ids: list[str]) -> NoReturn:
+    """Print a resume hint for every task created before Ctrl-C and exit."""
+    if not run_ids:
+        _exit_research_interrupted(None)
+    console.print("\n[bold yellow]Interrupted.[/bold yellow] Created tasks are still running on the server.")
+    for run_id in run_ids:
+        console.print(f"[dim]Resume with: parallel-cli research poll {run_id}[/dim]")
+    sys.exit(EXIT_INTERRUPTED)
+
+
 def _exit_research_timeout(error: TimeoutError, output_json: bool, suggest_poll: bool = True) -> NoReturn:
     """Format a research timeout for human or JSON output and exit."""
     if output_json:
@@ -1930,6 +1943,12 @@ def research():
 )
 @click.option("--timeout", type=int, default=3600, show_default=True, help="Max wait time in seconds")
 @click.option("--poll-interval", type=int, default=45, show_default=True, help="Seconds between status checks")
+@click.option(
+    "--max-poll-interval",
+    type=int,
+    default=None,
+    help="Back off between status checks (1.25x per check) up to this many seconds",
+)
 @click.option("--no-wait", is_flag=True, help="Return immediately after creating task (don't save or poll)")
 @click.option("--dry-run", is_flag=True, help="Show what would be executed without making API calls")
 @click.option(
@@ -1966,6 +1985,7 @@ def research_run(
     processor: str,
     timeout: int,
     poll_interval: int,
+    max_poll_interval: int | None,
     no_wait: bool,
     dry_run: bool,
     use_text: bool,
@@ -2116,6 +2136,7 @@ def research_run(
                 processor=processor,
                 timeout=timeout,
                 poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
                 on_status=on_status,
                 source="cli",
                 previous_interaction_id=previous_interaction_id,
@@ -2137,6 +2158,138 @@ def research_run(
         _handle_error(e, output_json=output_json)
 
 
+@research.command(name="run-batch")
+@click.argument("queries_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "--processor",
+    "-p",
+    type=click.Choice(list(RESEARCH_PROCESSORS.keys())),
+    default="pro-fast",
+    show_default=True,
+    help="Processor tier (higher = more thorough but slower)",
+)
+@click.option("--timeout", type=int, default=3600, show_default=True, help="Max wait time in seconds per task")
+@click.option("--poll-interval", type=int, default=45, show_default=True, help="Seconds between status checks")
+@click.option(
+    "--max-poll-interval",
+    type=int,
+    default=None,
+    help="Back off between status checks (1.25x per check) up to this many seconds",
+)
+@click.option(
+    "--text",
+    "use_text",
+    is_flag=True,
+    help="Return markdown reports (text schema) instead of the default structured JSON.",
+)
+@click.option(
+    "-o",
+    "--output-dir",
+    type=click.Path(file_okay=False),
+    default=DEFAULT_RESEARCH_OUTPUT_DIR,
+    show_default=True,
+    help="Directory to write each task's <run_id>.json (and .md with --text)",
+)
+@click.option("--force", is_flag=True, help="Overwrite existing output files")
+@click.option("--json", "output_json", is_flag=True, help="Also print each result as JSON to stdout")
+def research_run_batch(
+    queries_file: str,
+    processor: str,
+    timeout: int,
+    poll_interval: int,
+    max_poll_interval: int | None,
+    use_text: bool,
+    output_dir: str,
+    force: bool,
+    output_json: bool,
+):
+    """Run deep research on every query in a file, concurrently.
+
+    QUERIES_FILE has one research question per line; blank lines and lines
+    starting with # are skipped. All tasks are created and awaited together on
+    one event loop, then each result is saved as in `research run`. With
+    --json, one JSON array holds a document per query, in file order.
+
+    \b
+    Examples:
+      parallel-cli research run-batch questions.txt
+      parallel-cli research run-batch questions.txt --text -o reports/
+    """
+    with open(queries_file) as f:
+        queries = [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+    if not queries:
+        raise click.UsageError(f"No queries found in {queries_file}.")
+
+    output_schema = "text" if use_text else "auto"
+    created_run_ids: list[str] = []
+
+    def on_status(status: str, run_id: str):
+        if status == "created":
+            created_run_ids.append(run_id)
+        if not output_json:
+            console.print(f"[dim]{run_id}: {status}[/dim]")
+
+    async def run_all() -> list[Any]:
+        return await asyncio.gather(
+            *(
+                arun_research(
+                    query,
+                    processor=processor,
+                    timeout=timeout,
+                    poll_interval=poll_interval,
+                    max_poll_interval=max_poll_interval,
+                    on_status=on_status,
+                    source="cli",
+                    output_schema=output_schema,
+                )
+                for query in queries
+            ),
+            return_exceptions=True,
+        )
+
+    if not output_json:
+        console.print(f"[bold cyan]Starting {len(queries)} research tasks with processor: {processor}[/bold cyan]")
+        console.print(f"[dim]Each may take {RESEARCH_PROCESSORS[processor]}[/dim]\n")
+
+    try:
+        results = asyncio.run(run_all())
+    except KeyboardInterrupt:
+        _exit_research_batch_interrupted(created_run_ids)
+
+    failures = 0
+    documents: list[dict[str, Any]] = []
+    for query, result in zip(queries, results, strict=True):
+        if isinstance(result, BaseException):
+            error, message = result, _extract_api_message(result)
+        else:
+            try:
+                documents.append(
+                    _save_and_display_research(
+                        result, f"{output_dir}{os.sep}", output_json, force=force, emit_json=False
+                    )
+                )
+                continue
+            except click.ClickException as e:
+                # e.g. refusing to overwrite one result must not drop the others
+                error, message = e, e.format_message()
+            except OSError as e:
+                # Both the output dir and the /tmp fallback were unwritable
+                error, message = e, str(e)
+        failures += 1
+        if output_json:
+            documents.append({"error": {"message": message, "type": type(error).__name__, "query": query}})
+        else:
+            label = query[:60] + "..." if len(query) > 60 else query
+            console.print(f"[bold red]Failed: {label}: {message}[/bold red]")
+
+    if output_json:
+        print(json.dumps(documents, indent=2, default=str))
+    if failures:
+        if not output_json:
+            console.print(f"[bold red]{failures} of {len(queries)} research tasks failed[/bold red]")
+        sys.exit(EXIT_API_ERROR)
+
+
 @research.command(name="status")
 @click.argument("run_id")
 @click.option("--json", "output_json", is_flag=True, help="Output as JSON")
@@ -2177,6 +2330,12 @@ def research_status(run_id: str, output_json: bool):
 @click.argument("run_id")
 @click.option("--timeout", type=int, default=3600, show_default=True, help="Max wait time in seconds")
 @click.option("--poll-interval", type=int, default=45, show_default=True, help="Seconds between status checks")
+@click.option(
+    "--max-poll-interval",
+    type=int,
+    default=None,
+    help="Back off between status checks (1.25x per check) up to this many seconds",
+)
 @click.option(
     "-o",
     "--output",
@@ -2194,6 +2353,7 @@ def research_poll(
     run_id: str,
     timeout: int,
     poll_interval: int,
+    max_poll_interval: int | None,
     output_base: str | None,
     force: bool,
     output_json: bool,
@@ -2230,6 +2390,7 @@ def research_poll(
             run_id,
             timeout=timeout,
             poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
             on_status=on_status,
             source="cli",
         )
@@ -2317,24 +2478,44 @@ def _content_to_markdown(content: Any, level: int = 1) -> str:
     - Dicts with other keys: converts to headings and nested content
     - Lists: converts to bullet points or numbered lists
     """
+    lines: list[str] = []
+    _append_markdown(content, level, lines)
+    # A lone line is returned as-is, like a bare {"text": ...} value always was
+    return lines[0] if len(lines) == 1 else "\n".join(lines)
+
+
+@lru_cache(maxsize=256)
+def _markdown_title(key: str) -> str:
+    """Convert a field name to a heading title (e.g. "quantum_computing_summary" -> "Quantum Computing Summary")."""
+    return key.replace("_", " ").title()
+
+
+def _append_markdown(content: Any, level: int, lines: list[str]) -> None:
+    """Append the markdown lines for ``content`` to ``lines``.
+
+    Nested content is appended to the same list, so the whole report is joined
+    once instead of once per nesting level. Content that renders to nothing
+    still takes one (empty) line, as a nested section did before.
+    """
     if content is None:
-        return ""
+        lines.append("")
+        return
 
     if isinstance(content, str):
-        return content
+        lines.append(content)
+        return
 
+    start = len(lines)
     if isinstance(content, dict):
         # Check for {text: "..."} structure
         if "text" in content and len(content) == 1:
-            return content["text"]
+            lines.append(content["text"])
+            return
 
         # Convert dict to markdown sections
-        lines = []
+        heading = "#" * min(level, 6)
         for key, value in content.items():
-            # Convert key to title (e.g., "quantum_computing_summary" -> "Quantum Computing Summary")
-            title = key.replace("_", " ").title()
-            heading = "#" * min(level, 6)
-            lines.append(f"{heading} {title}\n")
+            lines.append(f"{heading} {_markdown_title(key)}\n")
 
             # Recursively convert value
             if isinstance(value, str):
@@ -2343,28 +2524,26 @@ def _content_to_markdown(content: Any, level: int = 1) -> str:
                 for item in value:
                     if isinstance(item, dict):
                         # For complex items, render as sub-content
-                        lines.append(_content_to_markdown(item, level + 1))
+                        _append_markdown(item, level + 1, lines)
                     else:
                         lines.append(f"- {item}")
             elif isinstance(value, dict):
-                lines.append(_content_to_markdown(value, level + 1))
+                _append_markdown(value, level + 1, lines)
             else:
                 lines.append(str(value))
 
             lines.append("")  # Blank line after section
-
-        return "\n".join(lines)
-
-    if isinstance(content, list):
-        lines = []
+    elif isinstance(content, list):
         for item in content:
             if isinstance(item, dict):
-                lines.append(_content_to_markdown(item, level))
+                _append_markdown(item, level, lines)
             else:
                 lines.append(f"- {item}")
-        return "\n".join(lines)
+    else:
+        lines.append(str(content))
 
-    return str(content)
+    if len(lines) == start:
+        lines.append("")
 
 
 def _resolve_research_base_path(output_base: str | None, run_id: str) -> Path:
@@ -2398,11 +2577,14 @@ def _save_and_display_research(
     output_base: str | None,
     output_json: bool,
     force: bool = False,
-):
+    emit_json: bool = True,
+) -> dict[str, Any]:
     """Save the research result to disk and display a summary.
 
     Always writes {base}.json. Writes {base}.md as well when the task used
     text schema (a markdown report). Auto-schema results stay JSON-only.
+    Returns the saved metadata document; with output_json it is also printed
+    unless emit_json is False (so callers can combine several into one).
 
     Without --force, refuses to overwrite existing files. On write failure
     (e.g. permission denied), falls back to /tmp/{run_id}.{ext} so the result
@@ -2480,8 +2662,9 @@ def _save_and_display_research(
         _write_outputs(fallback_json, fallback_md)
 
     if output_json:
-        print(json.dumps(output_data, indent=2, default=str))
-        return
+        if emit_json:
+            print(json.dumps(output_data, indent=2, default=str))
+        return output_data
 
     console.print("\n[bold green]Research Complete![/bold green]")
     console.print(f"[dim]Task: {run_id}[/dim]")
@@ -2499,6 +2682,7 @@ def _save_and_display_research(
     interaction_id = result.get("interaction_id")
     if interaction_id:
         console.print(f"[dim]Use '--previous-interaction-id {interaction_id}' to continue this research[/dim]")
+    return output_data
 
 
 # =============================================================================
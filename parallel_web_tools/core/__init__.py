@@ -3,6 +3,7 @@
 from parallel_web_tools.core.auth import (
     DeviceCodeInfo,
     ReauthenticationRequired,
+    create_async_client,
     create_client,
     get_api_key,
     get_async_client,
@@ -57,6 +58,7 @@ from parallel_web_tools.core.monitor import (
 from parallel_web_tools.core.research import (
     RESEARCH_PROCESSORS,
     OutputSchemaType,
+    arun_research,
     create_research_task,
     get_research_result,
     get_research_status,
@@ -92,6 +94,7 @@ __all__ = [
     # Auth
     "DeviceCodeInfo",
     "ReauthenticationRequired",
+    "create_async_client",
     "create_client",
     "get_api_key",
     "get_async_client",
@@ -134,6 +137,7 @@ __all__ = [
     # Research
     "RESEARCH_PROCESSORS",
     "OutputSchemaType",
+    "arun_research",
     "create_research_task",
     "get_research_result",
     "get_research_status",
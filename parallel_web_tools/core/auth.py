@@ -582,6 +582,15 @@ def create_client(api_key: str | None = None, source: ClientSource = "python") -
     )
 
 
+def create_async_client(api_key: str | None = None, source: ClientSource = "python") -> AsyncParallel:
+    """Create a configured async Parallel client, resolving the API key if not provided."""
+    return AsyncParallel(
+        base_url=get_api_url(),
+        api_key=resolve_api_key(api_key),
+        default_headers=get_default_headers(source),
+    )
+
+
 def get_client(force_login: bool = False, source: ClientSource = "python") -> Parallel:
     """Get a configured Parallel client with interactive device-flow fallback."""
     return Parallel(
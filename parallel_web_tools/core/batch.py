@@ -6,9 +6,12 @@ import json
 import logging
 import time
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Literal, overload
+
+from parallel import Parallel
 
 from parallel_web_tools.core.auth import create_client
 from parallel_web_tools.core.user_agent import ClientSource
@@ -16,6 +19,10 @@ from parallel_web_tools.core.user_agent import ClientSource
 # Base URL for viewing task groups on the platform
 PLATFORM_BASE = "https://platform.parallel.ai"
 
+# Extra seconds the HTTP read waits beyond api_timeout, so the server-side wait
+# ends first (the SDK's own read timeout defaults to 600s)
+RESULT_TIMEOUT_MARGIN = 30
+
 
 def build_output_schema(output_columns: list[str]) -> dict[str, Any]:
     """Build a JSON schema from output column descriptions."""
@@ -40,6 +47,28 @@ def build_output_schema(output_columns: list[str]) -> dict[str, Any]:
     }
 
 
+@lru_cache(maxsize=128)
+def _output_property_names(output_columns: tuple[str, ...]) -> tuple[str, ...]:
+    """Return the result column names for a set of output descriptions, cached by columns."""
+    return tuple(build_output_schema(list(output_columns))["properties"])
+
+
+def _to_string_value(value: Any) -> str | None:
+    """Render an enrichment value as a string column value (non-strings as JSON)."""
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, default=str)
+
+
+@lru_cache(maxsize=128)
+def _build_task_spec(output_columns: tuple[str, ...]) -> Any:
+    """Build the TaskSpecParam for a set of output columns, cached by columns."""
+    from parallel.types import JsonSchemaParam, TaskSpecParam
+
+    output_schema = build_output_schema(list(output_columns))
+    return TaskSpecParam(output_schema=JsonSchemaParam(type="json", json_schema=output_schema))
+
+
 def _parse_content(content) -> dict[str, Any]:
     """Parse API response content into a dictionary."""
     if isinstance(content, dict):
@@ -100,6 +129,7 @@ def enrich_batch(
     include_basis: bool = True,
     source: ClientSource = "python",
     previous_interaction_id: str | None = None,
+    client: Parallel | None = None,
 ) -> list[dict[str, Any]]:
     """Enrich multiple inputs using the Parallel Task Group API.
 
@@ -113,19 +143,21 @@ def enrich_batch(
         include_basis: Whether to include citations
         source: Client source identifier for User-Agent (default: python)
         previous_interaction_id: Interaction ID from a previous task to reuse as context.
+        client: Optional client to reuse across calls (e.g. one per chunk loop), so
+            its connection pool is shared. The caller owns it; it is not closed here.
 
     Returns:
         List of result dictionaries in same order as inputs.
     """
-    from parallel.types import JsonSchemaParam, RunInputParam, TaskSpecParam
+    from parallel.types import RunInputParam
 
     if not inputs:
         return []
 
     try:
-        client = create_client(api_key, source)
-        output_schema = build_output_schema(output_columns)
-        task_spec = TaskSpecParam(output_schema=JsonSchemaParam(type="json", json_schema=output_schema))
+        if client is None:
+            client = create_client(api_key, source)
+        task_spec = _build_task_spec(tuple(output_columns))
 
         # Create task group
         task_group = client.task_group.create()
@@ -196,18 +228,38 @@ def enrich_single(
     source: ClientSource = "python",
     previous_interaction_id: str | None = None,
 ) -> dict[str, Any]:
-    """Enrich a single input using the Parallel API."""
-    results = enrich_batch(
-        [input_data],
-        output_columns,
-        api_key=api_key,
-        processor=processor,
-        timeout=timeout,
-        include_basis=include_basis,
-        source=source,
-        previous_interaction_id=previous_interaction_id,
-    )
-    return results[0] if results else {"error": "No result"}
+    """Enrich a single input using the Parallel API.
+
+    Uses a single task run rather than a one-run task group, so there is no group
+    to create or poll; the result call blocks until the run finishes.
+    """
+    try:
+        client = create_client(api_key, source)
+
+        create_kwargs: dict[str, Any] = {
+            "input": input_data,
+            "processor": processor,
+            "task_spec": _build_task_spec(tuple(output_columns)),
+        }
+        if previous_interaction_id:
+            create_kwargs["previous_interaction_id"] = previous_interaction_id
+        task_run = client.task_run.create(**create_kwargs)
+
+        output = client.task_run.result(
+            task_run.run_id, api_timeout=timeout, timeout=timeout + RESULT_TIMEOUT_MARGIN
+        ).output
+        content = getattr(output, "content", None)
+        if content is None:
+            return {"error": "No result"}
+        result = _parse_content(content)
+        if include_basis:
+            result["basis"] = extract_basis(output)
+        return result
+
+    except Exception as e:
+        logger = logging.getLogger(__name__)
+        logger.exception(f"enrich_single failed: {e}")
+        return {"error": str(e)}
 
 
 def create_task_group(
@@ -217,6 +269,7 @@ def create_task_group(
     processor: str = "core-fast",
     source: ClientSource = "python",
     previous_interaction_id: str | None = None,
+    client: Parallel | None = None,
 ) -> dict[str, Any]:
     """Create a task group and add runs without waiting for completion.
 
@@ -227,6 +280,7 @@ def create_task_group(
         processor: Parallel processor (default: core-fast).
         source: Client source identifier for User-Agent.
         previous_interaction_id: Interaction ID from a previous task to reuse as context.
+        client: Optional client to use instead of creating one. The caller owns it.
 
     Returns:
         Dict with taskgroup_id, url, and num_runs.
@@ -235,7 +289,8 @@ def create_task_group(
 
     logger = logging.getLogger(__name__)
 
-    client = create_client(source=source)
+    if client is None:
+        client = create_client(source=source)
 
     # Build task spec from Pydantic models
     task_spec = TaskSpecParam(
@@ -371,6 +426,35 @@ def poll_task_group(
     return results
 
 
+@overload
+def run_tasks(
+    input_data: list[dict[str, Any]],
+    InputModel,
+    OutputModel,
+    processor: str = ...,
+    source: ClientSource = ...,
+    timeout: int = ...,
+    previous_interaction_id: str | None = ...,
+    stream: Literal[False] = ...,
+    client: Parallel | None = ...,
+) -> list[Any]: ...
+
+
+@overload
+def run_tasks(
+    input_data: list[dict[str, Any]],
+    InputModel,
+    OutputModel,
+    processor: str = ...,
+    source: ClientSource = ...,
+    timeout: int = ...,
+    previous_interaction_id: str | None = ...,
+    *,
+    stream: Literal[True],
+    client: Parallel | None = ...,
+) -> Iterator[dict[str, Any]]: ...
+
+
 def run_tasks(
     input_data: list[dict[str, Any]],
     InputModel,
@@ -379,7 +463,9 @@ def run_tasks(
     source: ClientSource = "python",
     timeout: int = 3600,
     previous_interaction_id: str | None = None,
-) -> list[Any]:
+    stream: bool = False,
+    client: Parallel | None = None,
+) -> list[Any] | Iterator[dict[str, Any]]:
     """Run batch tasks using Pydantic models for schema.
 
     Uses the Parallel SDK's task group API with proper SSE handling.
@@ -387,21 +473,36 @@ def run_tasks(
     Args:
         timeout: Max seconds to wait for completion (default: 3600 = 1 hour).
         previous_interaction_id: Interaction ID from a previous task to reuse as context.
+        stream: If True, return an iterator that yields each result as its event is
+            read from the run stream, instead of collecting them into a list. The
+            task group is still created and awaited before this function returns.
+        client: Optional client to reuse, e.g. across repeated calls from one worker.
+            The caller owns it; otherwise one client is created for this call.
     """
     logger = logging.getLogger(__name__)
 
     batch_id = str(uuid.uuid4())
     logger.info(f"Generated batch_id: {batch_id}")
 
+    # One client creates the group and polls it, so both share a connection pool
+    if client is None:
+        client = create_client(source=source)
+
     # Create task group and add runs
     tg_info = create_task_group(
-        input_data, InputModel, OutputModel, processor, source, previous_interaction_id=previous_interaction_id
+        input_data,
+        InputModel,
+        OutputModel,
+        processor,
+        source,
+        previous_interaction_id=previous_interaction_id,
+        client=client,
     )
     taskgroup_id = tg_info["taskgroup_id"]
 
     # Wait for completion
-    client = create_client(source=source)
     poll_start = time.time()
+    poll_interval = 1.0
     while time.time() - poll_start < timeout:
         status = client.task_group.retrieve(taskgroup_id)
         status_counts = status.status.task_run_status_counts or {}
@@ -411,12 +512,25 @@ def run_tasks(
             logger.info("All tasks completed!")
             break
 
-        time.sleep(2)
+        # Back off so long-running groups are polled less often, capped at 30s
+        time.sleep(poll_interval)
+        poll_interval = min(poll_interval * 1.5, 30.0)
     else:
         logger.warning(f"Timed out after {timeout}s waiting for task group {taskgroup_id}")
 
+    results = _iter_task_results(client, taskgroup_id, InputModel, OutputModel, batch_id)
+    return results if stream else list(results)
+
+
+def _iter_task_results(client, taskgroup_id: str, InputModel, OutputModel, batch_id: str) -> Iterator[dict[str, Any]]:
+    """Yield validated result rows as the task group's run events are streamed."""
+    logger = logging.getLogger(__name__)
+
+    # Every row of a batch shares one batch_id and insertion timestamp
+    batch_fields = {"batch_id": batch_id, "insertion_timestamp": datetime.now(timezone.utc).isoformat()}
+
     # Get results using SDK's streaming (handles SSE properly)
-    results = []
+    count = 0
     runs_stream = client.task_group.get_runs(taskgroup_id, include_input=True, include_output=True)
 
     for event in runs_stream:
@@ -425,16 +539,14 @@ def run_tasks(
                 input_val = InputModel.model_validate(event.input.input if event.input else {})
                 content = _parse_content(event.output.content)
                 output_val = OutputModel.model_validate(content)
-                results.append(
-                    {
-                        **input_val.model_dump(),
-                        **output_val.model_dump(),
-                        "batch_id": batch_id,
-                        "insertion_timestamp": datetime.now(timezone.utc).isoformat(),
-                    }
-                )
             except Exception as e:
                 logger.warning(f"Failed to parse result: {e}")
-
-    logger.info(f"Successfully processed {len(results)} entities.")
-    return results
+                continue
+            count += 1
+            yield {
+                **input_val.model_dump(),
+                **output_val.model_dump(),
+                **batch_fields,
+            }
+
+    logger.info(f"Successfully processed {count} entities.")
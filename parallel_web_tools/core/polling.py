@@ -5,12 +5,16 @@ Used internally by research and findall modules. Not part of the public API.
 
 from __future__ import annotations
 
+import asyncio
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 TERMINAL_STATUSES = ("completed", "failed", "cancelled")
 
+# Growth factor applied to the poll interval each round when max_poll_interval is set
+POLL_BACKOFF_FACTOR = 1.25
+
 
 def poll_until(
     *,
@@ -20,7 +24,9 @@ def poll_until(
     format_error: Callable[[Any, str], str],
     on_poll: Callable[[Any], None] | None = None,
     timeout: int = 3600,
-    poll_interval: int = 30,
+    poll_interval: float = 30,
+    max_poll_interval: float | None = None,
+    initial_delay: float = 0,
     timeout_message: str = "Task timed out",
     terminal_statuses: tuple[str, ...] = TERMINAL_STATUSES,
 ) -> Any:
@@ -34,6 +40,11 @@ def poll_until(
         on_poll: Optional callback invoked with the response on each iteration.
         timeout: Maximum wait time in seconds.
         poll_interval: Seconds between status checks.
+        max_poll_interval: Optional cap for exponential backoff. When set, the wait
+            starts at poll_interval and grows by POLL_BACKOFF_FACTOR per check up to
+            this many seconds; when None, every wait is poll_interval.
+        initial_delay: Seconds to wait before the first status check, for tasks
+            known not to finish sooner. Default 0 checks immediately.
         timeout_message: Message for the TimeoutError if the deadline is exceeded.
         terminal_statuses: Tuple of statuses that indicate the task is done.
 
@@ -45,6 +56,10 @@ def poll_until(
         RuntimeError: If the task fails or is cancelled.
     """
     deadline = time.time() + timeout
+    delay = poll_interval
+
+    if initial_delay > 0:
+        time.sleep(min(initial_delay, timeout))
 
     while time.time() < deadline:
         response = retrieve()
@@ -59,6 +74,53 @@ def poll_until(
 
             raise RuntimeError(format_error(response, status))
 
-        time.sleep(poll_interval)
+        time.sleep(delay)
+        if max_poll_interval is not None:
+            delay = min(delay * POLL_BACKOFF_FACTOR, max_poll_interval)
+
+    raise TimeoutError(timeout_message)
+
+
+async def apoll_until(
+    *,
+    retrieve: Callable[[], Awaitable[Any]],
+    extract_status: Callable[[Any], str],
+    fetch_result: Callable[[], Awaitable[Any]],
+    format_error: Callable[[Any, str], str],
+    on_poll: Callable[[Any], None] | None = None,
+    timeout: int = 3600,
+    poll_interval: float = 30,
+    max_poll_interval: float | None = None,
+    initial_delay: float = 0,
+    timeout_message: str = "Task timed out",
+    terminal_statuses: tuple[str, ...] = TERMINAL_STATUSES,
+) -> Any:
+    """Async counterpart of :func:`poll_until`, waiting with ``asyncio.sleep``.
+
+    ``retrieve`` and ``fetch_result`` are coroutine functions; all other arguments
+    behave as in :func:`poll_until`. Many polls can share one event loop.
+    """
+    deadline = time.time() + timeout
+    delay = poll_interval
+
+    if initial_delay > 0:
+        await asyncio.sleep(min(initial_delay, timeout))
+
+    while time.time() < deadline:
+        response = await retrieve()
+        status = extract_status(response)
+
+        if on_poll:
+            on_poll(response)
+
+        if status in terminal_statuses:
+            if status == "completed":
+                return await fetch_result()
+
+            raise RuntimeError(format_error(response, status))
+
+        await asyncio.sleep(delay)
+        if max_poll_interval is not None:
+            delay = min(delay * POLL_BACKOFF_FACTOR, max_poll_interval)
 
     raise TimeoutError(timeout_message)
@@ -8,11 +8,15 @@ and returns analyst-grade intelligence reports.
 
 from __future__ import annotations
 
+import copy
+import threading
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Future
 from typing import Any, Literal
 
-from parallel_web_tools.core.auth import create_client
-from parallel_web_tools.core.polling import poll_until
+from parallel_web_tools.core.auth import create_async_client, create_client
+from parallel_web_tools.core.polling import TERMINAL_STATUSES, apoll_until, poll_until
 from parallel_web_tools.core.user_agent import ClientSource
 
 # Output schema types supported for deep research
@@ -46,6 +50,75 @@ RESEARCH_PROCESSORS = {
     "ultra8x": "5min-2hr - most challenging research, fresher data",
 }
 
+# Lower bound of each RESEARCH_PROCESSORS latency range, in seconds
+_MIN_LATENCY_SECONDS = {
+    "lite-fast": 10,
+    "base-fast": 15,
+    "core-fast": 15,
+    "core2x-fast": 15,
+    "pro-fast": 30,
+    "ultra-fast": 60,
+    "ultra2x-fast": 60,
+    "ultra4x-fast": 60,
+    "ultra8x-fast": 60,
+    "lite": 10,
+    "base": 15,
+    "core": 60,
+    "core2x": 60,
+    "pro": 120,
+    "ultra": 300,
+    "ultra2x": 300,
+    "ultra4x": 300,
+    "ultra8x": 300,
+}
+
+# Longest wait before the first status check, so a run that fails right away is
+# still reported promptly on processors whose minimum latency is minutes
+_MAX_INITIAL_DELAY = 30
+
+# Status and result dicts of runs in a terminal state, keyed by ("status"|"result", api_key, run_id)
+# so a run is only served back to the credentials that fetched it. A finished run never
+# changes, so repeat lookups in this process skip the API call; the least recently used
+# entries are evicted past _TERMINAL_CACHE_MAXSIZE.
+_TERMINAL_CACHE_MAXSIZE = 256
+_terminal_cache: OrderedDict[tuple[str, str | None, str], dict[str, Any]] = OrderedDict()
+_terminal_cache_lock = threading.Lock()
+
+# Status requests currently on the wire, so concurrent lookups of one run share a call
+_inflight_status: dict[tuple[str | None, str], Future[dict[str, Any]]] = {}
+_inflight_status_lock = threading.Lock()
+
+
+def _get_cached(kind: str, run_id: str, api_key: str | None) -> dict[str, Any] | None:
+    """Return a deep copy of a cached terminal status/result, or None if not cached."""
+    key = (kind, api_key, run_id)
+    with _terminal_cache_lock:
+        cached = _terminal_cache.get(key)
+        if cached is not None:
+            _terminal_cache.move_to_end(key)
+    # Deep copies, so a caller mutating the nested output can't corrupt the cache
+    return copy.deepcopy(cached) if cached is not None else None
+
+
+def _store_cached(kind: str, run_id: str, api_key: str | None, value: dict[str, Any]) -> None:
+    """Cache a terminal status/result for later lookups of the same run."""
+    key = (kind, api_key, run_id)
+    with _terminal_cache_lock:
+        _terminal_cache[key] = copy.deepcopy(value)
+        _terminal_cache.move_to_end(key)
+        while len(_terminal_cache) > _TERMINAL_CACHE_MAXSIZE:
+            _terminal_cache.popitem(last=False)
+
+
+def _min_latency_seconds(processor: str) -> int:
+    """Return the documented minimum latency of a research processor in seconds (0 if unknown)."""
+    return _MIN_LATENCY_SECONDS.get(processor, 0)
+
+
+def _initial_poll_delay(processor: str) -> int:
+    """Return the wait before the first status check: the processor's minimum latency, capped."""
+    return min(_min_latency_seconds(processor), _MAX_INITIAL_DELAY)
+
 
 def _serialize_output(output: Any) -> dict[str, Any]:
     """Serialize SDK output object to a dictionary.
@@ -92,6 +165,26 @@ def _build_task_spec(output_schema: OutputSchemaType, text_description: str | No
     return None
 
 
+def _build_create_kwargs(
+    query: str,
+    processor: str,
+    previous_interaction_id: str | None,
+    output_schema: OutputSchemaType,
+    text_description: str | None,
+) -> dict[str, Any]:
+    """Build the task_run.create keyword arguments for a research query."""
+    create_kwargs: dict[str, Any] = {
+        "input": query[:15000],
+        "processor": processor,
+    }
+    if previous_interaction_id:
+        create_kwargs["previous_interaction_id"] = previous_interaction_id
+    task_spec = _build_task_spec(output_schema, text_description)
+    if task_spec is not None:
+        create_kwargs["task_spec"] = task_spec
+    return create_kwargs
+
+
 def create_research_task(
     query: str,
     processor: str = "pro-fast",
@@ -120,15 +213,7 @@ def create_research_task(
     """
     client = create_client(api_key, source)
 
-    create_kwargs: dict[str, Any] = {
-        "input": query[:15000],
-        "processor": processor,
-    }
-    if previous_interaction_id:
-        create_kwargs["previous_interaction_id"] = previous_interaction_id
-    task_spec = _build_task_spec(output_schema, text_description)
-    if task_spec is not None:
-        create_kwargs["task_spec"] = task_spec
+    create_kwargs = _build_create_kwargs(query, processor, previous_interaction_id, output_schema, text_description)
 
     task = client.task_run.create(**create_kwargs)
 
@@ -155,17 +240,49 @@ def get_research_status(
         source: Client source identifier for User-Agent.
 
     Returns:
-        Dict with status, interaction_id, and other task info.
+        Dict with status, interaction_id, and other task info. Once a task is
+        completed, failed or cancelled its status is cached for this process.
+        Concurrent calls for the same run_id share a single API request.
     """
+    if (cached := _get_cached("status", run_id, api_key)) is not None:
+        return cached
+
+    inflight_key = (api_key, run_id)
+    with _inflight_status_lock:
+        inflight = _inflight_status.get(inflight_key)
+        if inflight is None:
+            future: Future[dict[str, Any]] = Future()
+            _inflight_status[inflight_key] = future
+    if inflight is not None:
+        return dict(inflight.result())
+
+    try:
+        info = _fetch_research_status(run_id, api_key, source)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(info)
+        return dict(info)
+    finally:
+        with _inflight_status_lock:
+            _inflight_status.pop(inflight_key, None)
+
+
+def _fetch_research_status(run_id: str, api_key: str | None, source: ClientSource) -> dict[str, Any]:
+    """Retrieve a research task's status from the API, caching it if terminal."""
     client = create_client(api_key, source)
     status = client.task_run.retrieve(run_id=run_id)
 
-    return {
+    info = {
         "run_id": run_id,
         "interaction_id": getattr(status, "interaction_id", run_id),
         "status": status.status,
         "result_url": f"{PLATFORM_BASE}/play/deep-research/{run_id}",
     }
+    if status.status in TERMINAL_STATUSES:
+        _store_cached("status", run_id, api_key, info)
+    return info
 
 
 def get_research_result(
@@ -181,20 +298,56 @@ def get_research_result(
         source: Client source identifier for User-Agent.
 
     Returns:
-        Dict with output data and metadata.
+        Dict with output data and metadata. Results are cached for this process,
+        since a completed task's output never changes.
     """
+    if (cached := _get_cached("result", run_id, api_key)) is not None:
+        return cached
+
     client = create_client(api_key, source)
     result = client.task_run.result(run_id=run_id)
 
     output = result.output if hasattr(result, "output") else {}
     output_data = _serialize_output(output)
 
-    return {
+    result_dict = {
         "run_id": run_id,
         "result_url": f"{PLATFORM_BASE}/play/deep-research/{run_id}",
         "status": "completed",
         "output": output_data,
     }
+    _store_cached("result", run_id, api_key, result_dict)
+    return result_dict
+
+
+def _completed_result(
+    run_id: str,
+    interaction_id: str | None,
+    result_url: str,
+    result: Any,
+    output_schema: OutputSchemaType | None,
+) -> dict[str, Any]:
+    """Build the result dict returned once a polled research task completes."""
+    output = result.output if hasattr(result, "output") else {}
+    result_dict: dict[str, Any] = {
+        "run_id": run_id,
+        "interaction_id": interaction_id or run_id,
+        "result_url": result_url,
+        "status": "completed",
+        "output": _serialize_output(output),
+    }
+    # Note: this `output_schema` is the *requested* schema (caller intent),
+    # not the SDK's `TaskRunJsonOutput.output_schema` (which is server-set
+    # and only present for auto-mode runs).
+    if output_schema is not None:
+        result_dict["output_schema"] = output_schema
+    return result_dict
+
+
+def _format_research_error(response: Any, status: str) -> str:
+    """Format the RuntimeError message for a failed or cancelled research task."""
+    error = getattr(response, "error", None) or f"Task {status}"
+    return f"Research {status}: {error}"
 
 
 def _poll_until_complete(
@@ -206,6 +359,8 @@ def _poll_until_complete(
     on_status: Callable[[str, str], None] | None,
     interaction_id: str | None = None,
     output_schema: OutputSchemaType | None = None,
+    max_poll_interval: int | None = None,
+    initial_delay: float = 0,
 ) -> dict[str, Any]:
     """Poll a research task until completion and return the result.
 
@@ -219,6 +374,8 @@ def _poll_until_complete(
         interaction_id: Known interaction ID (updated from poll responses).
         output_schema: Schema the task was created with, included in the result
             so callers don't need to infer it from response shape.
+        max_poll_interval: Optional cap for backing off the poll interval.
+        initial_delay: Seconds to wait before the first status check.
 
     Returns:
         Dict with content and metadata.
@@ -242,25 +399,7 @@ def _poll_until_complete(
 
     def fetch_result():
         result = client.task_run.result(run_id=run_id)
-        output = result.output if hasattr(result, "output") else {}
-        output_data = _serialize_output(output)
-        result_dict: dict[str, Any] = {
-            "run_id": run_id,
-            "interaction_id": poll_state["interaction_id"] or run_id,
-            "result_url": result_url,
-            "status": "completed",
-            "output": output_data,
-        }
-        # Note: this `output_schema` is the *requested* schema (caller intent),
-        # not the SDK's `TaskRunJsonOutput.output_schema` (which is server-set
-        # and only present for auto-mode runs).
-        if output_schema is not None:
-            result_dict["output_schema"] = output_schema
-        return result_dict
-
-    def format_error(response, status):
-        error = getattr(response, "error", None) or f"Task {status}"
-        return f"Research {status}: {error}"
+        return _completed_result(run_id, poll_state["interaction_id"], result_url, result, output_schema)
 
     def _on_poll(response):
         if on_status:
@@ -270,10 +409,12 @@ def _poll_until_complete(
         retrieve=retrieve,
         extract_status=extract_status,
         fetch_result=fetch_result,
-        format_error=format_error,
+        format_error=_format_research_error,
         on_poll=_on_poll,
         timeout=timeout,
         poll_interval=poll_interval,
+        max_poll_interval=max_poll_interval,
+        initial_delay=initial_delay,
         timeout_message=f"Research task {run_id} timed out after {timeout} seconds",
     )
 
@@ -289,11 +430,15 @@ def run_research(
     previous_interaction_id: str | None = None,
     output_schema: OutputSchemaType = "auto",
     text_description: str | None = None,
+    max_poll_interval: int | None = None,
 ) -> dict[str, Any]:
     """Run deep research and wait for results.
 
     This is the main entry point for running research. It creates a task,
-    polls for completion, and returns the result.
+    polls for completion, and returns the result. The first status check waits
+    for the processor's minimum expected latency (see RESEARCH_PROCESSORS), since
+    the task cannot have finished any sooner, but at most 30 seconds so early
+    failures are still reported promptly.
 
     Args:
         query: Research question or topic (max 15,000 chars).
@@ -308,6 +453,9 @@ def run_research(
         output_schema: "auto" (default; API-chosen structured output) or
             "text" (markdown report with inline citations).
         text_description: Optional steering description for text-schema reports.
+        max_poll_interval: Optional cap in seconds for exponential backoff. When set,
+            the wait between checks starts at poll_interval and grows 1.25x per check
+            up to this cap; when None (default), every wait is poll_interval.
 
     Returns:
         Dict with content and metadata, including the requested output_schema.
@@ -318,15 +466,7 @@ def run_research(
     """
     client = create_client(api_key, source)
 
-    create_kwargs: dict[str, Any] = {
-        "input": query[:15000],
-        "processor": processor,
-    }
-    if previous_interaction_id:
-        create_kwargs["previous_interaction_id"] = previous_interaction_id
-    task_spec = _build_task_spec(output_schema, text_description)
-    if task_spec is not None:
-        create_kwargs["task_spec"] = task_spec
+    create_kwargs = _build_create_kwargs(query, processor, previous_interaction_id, output_schema, text_description)
 
     task = client.task_run.create(**create_kwargs)
     run_id = task.run_id
@@ -345,9 +485,74 @@ def run_research(
         on_status,
         interaction_id=interaction_id,
         output_schema=output_schema,
+        max_poll_interval=max_poll_interval,
+        initial_delay=_initial_poll_delay(processor),
     )
 
 
+async def arun_research(
+    query: str,
+    processor: str = "pro-fast",
+    api_key: str | None = None,
+    timeout: int = 3600,
+    poll_interval: int = 45,
+    on_status: Callable[[str, str], None] | None = None,
+    source: ClientSource = "python",
+    previous_interaction_id: str | None = None,
+    output_schema: OutputSchemaType = "auto",
+    text_description: str | None = None,
+    max_poll_interval: int | None = None,
+) -> dict[str, Any]:
+    """Run deep research and wait for results without blocking a thread.
+
+    Async counterpart of :func:`run_research` with the same arguments and result.
+    It uses the async Parallel client and ``asyncio.sleep`` between status
+    checks, so many research tasks can be awaited together (e.g. with
+    ``asyncio.gather``) on one event loop.
+
+    Raises:
+        TimeoutError: If the task doesn't complete within timeout.
+        RuntimeError: If the task fails or is cancelled.
+    """
+    create_kwargs = _build_create_kwargs(query, processor, previous_interaction_id, output_schema, text_description)
+
+    async with create_async_client(api_key, source) as client:
+        task = await client.task_run.create(**create_kwargs)
+        run_id = task.run_id
+        result_url = f"{PLATFORM_BASE}/play/deep-research/{run_id}"
+        poll_state = {"interaction_id": getattr(task, "interaction_id", run_id)}
+
+        if on_status:
+            on_status("created", run_id)
+
+        async def retrieve():
+            response = await client.task_run.retrieve(run_id=run_id)
+            if getattr(response, "interaction_id", None):
+                poll_state["interaction_id"] = response.interaction_id
+            return response
+
+        async def fetch_result():
+            result = await client.task_run.result(run_id=run_id)
+            return _completed_result(run_id, poll_state["interaction_id"], result_url, result, output_schema)
+
+        def _on_poll(response):
+            if on_status:
+                on_status(response.status, run_id)
+
+        return await apoll_until(
+            retrieve=retrieve,
+            extract_status=lambda response: response.status,
+            fetch_result=fetch_result,
+            format_error=_format_research_error,
+            on_poll=_on_poll,
+            timeout=timeout,
+            poll_interval=poll_interval,
+            max_poll_interval=max_poll_interval,
+            initial_delay=_initial_poll_delay(processor),
+            timeout_message=f"Research task {run_id} timed out after {timeout} seconds",
+        )
+
+
 def poll_research(
     run_id: str,
     api_key: str | None = None,
@@ -355,6 +560,7 @@ def poll_research(
     poll_interval: int = 45,
     on_status: Callable[[str, str], None] | None = None,
     source: ClientSource = "python",
+    max_poll_interval: int | None = None,
 ) -> dict[str, Any]:
     """Resume polling an existing research task.
 
@@ -369,6 +575,8 @@ def poll_research(
         poll_interval: Seconds between status checks.
         on_status: Optional callback called with (status, run_id) on each poll.
         source: Client source identifier for User-Agent.
+        max_poll_interval: Optional cap in seconds for backing off the poll interval
+            (see run_research).
 
     Returns:
         Dict with content and metadata including interaction_id.
@@ -379,4 +587,6 @@ def poll_research(
     if on_status:
         on_status("polling", run_id)
 
-    return _poll_until_complete(client, run_id, result_url, timeout, poll_interval, on_status)
+    return _poll_until_complete(
+        client, run_id, result_url, timeout, poll_interval, on_status, max_poll_interval=max_poll_interval
+    )
@@ -3,7 +3,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
 
 T = TypeVar("T")
 
@@ -32,3 +37,49 @@ class EnrichmentResult(Generic[T]):
 
     run_id: str | None = None
     """Optional run ID (e.g., findall_id) for debugging or reporting."""
+
+    def to_arrow(self) -> pa.Table:
+        """Materialize the result as a pyarrow Table.
+
+        Works for any result exposing the Arrow C stream interface, such as
+        DuckDB relations and Polars DataFrames, and skips the pandas round
+        trip of ``fetchdf()``. Requires pyarrow.
+        """
+        import pyarrow as pa
+
+        return pa.table(self.result)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Materialize the result as a pandas DataFrame via Arrow.
+
+        Requires pyarrow and pandas.
+        """
+        return self.to_arrow().to_pandas()
+
+    def to_polars(self) -> pl.DataFrame:
+        """Materialize the result as a Polars DataFrame via Arrow.
+
+        Polars adopts the Arrow buffers without copying them, so string
+        columns are not re-created as Python objects. Polars results are
+        returned as-is. Requires polars.
+        """
+        import polars as pl
+
+        if isinstance(self.result, pl.DataFrame):
+            return self.result
+        return pl.DataFrame(self.to_arrow())
+
+    def errors_table(self) -> pa.Table:
+        """Return the error details as a columnar pyarrow Table.
+
+        The table has an int64 ``row`` column and a string ``error`` column,
+        one entry per failed row. Requires pyarrow.
+        """
+        import pyarrow as pa
+
+        return pa.table(
+            {
+                "row": pa.array([e.get("row") for e in self.errors], type=pa.int64()),
+                "error": pa.array([e.get("error") for e in self.errors], type=pa.string()),
+            }
+        )
@@ -24,18 +24,47 @@ Example:
 from __future__ import annotations
 
 import time
+import uuid
 from collections.abc import Callable
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from typing import TYPE_CHECKING, Any, Literal
 
 import duckdb
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from parallel_web_tools.core import EnrichmentResult, build_output_schema, enrich_batch
+from parallel_web_tools.core import EnrichmentResult, enrich_batch
+from parallel_web_tools.core.batch import _output_property_names, _to_string_value
 from parallel_web_tools.core.sql_utils import quote_identifier
 
 if TYPE_CHECKING:
     DuckDBEnrichmentResult = EnrichmentResult[duckdb.DuckDBPyRelation]
 
 
+def _combine_small_chunks(table: pa.Table, max_chunks: int = 4) -> pa.Table:
+    """Merge a heavily chunked table into contiguous arrays.
+
+    DuckDB scans an Arrow table made of a few large batches much faster than
+    one split into many small batches, so compact before handing it over.
+    """
+    if any(column.num_chunks > max_chunks for column in table.columns):
+        return table.combine_chunks()
+    return table
+
+
+def _string_array(column: pa.ChunkedArray | pa.Array) -> pa.Array:
+    """Return an input column as a contiguous string array (NULLs preserved).
+
+    Non-string values go through Python ``str()`` so they are sent exactly as
+    they would be formatted in Python (e.g. ``True`` rather than ``true``).
+    """
+    array = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    if pa.types.is_string(array.type) or pa.types.is_large_string(array.type):
+        return array
+    return pa.array([None if value is None else str(value) for value in array.to_pylist()], type=pa.string())
+
+
 def enrich_table(
     conn: duckdb.DuckDBPyConnection,
     source_table: str,
@@ -47,6 +76,9 @@ def enrich_table(
     timeout: int = 600,
     include_basis: bool = False,
     progress_callback: Callable[[int, int], None] | None = None,
+    batch_size: int | None = None,
+    enrich_fn: Callable[..., list[dict[str, Any]]] | None = None,
+    progress_granularity: Literal["row", "batch"] = "row",
 ) -> EnrichmentResult:
     """
     Enrich a DuckDB table using the Parallel API.
@@ -71,6 +103,15 @@ def enrich_table(
         timeout: Timeout in seconds for the enrichment. Default is 600 (10 min).
         include_basis: Whether to include basis/citations in results. Default is False.
         progress_callback: Optional callback function(completed, total) for progress updates.
+        batch_size: Optional number of rows to enrich per chunk. When set, the source is
+            streamed through Arrow and enriched one chunk at a time instead of all at
+            once, bounding the Python-side memory for large tables. The source is scanned
+            only once, so progress totals count the rows read so far rather than the
+            final row count.
+        enrich_fn: Optional replacement for ``enrich_batch``, called with the same
+            keyword arguments for each chunk. Useful for injecting a fake in tests.
+        progress_granularity: "row" (default) calls progress_callback once per row;
+            "batch" calls it once per enriched chunk (once overall without batch_size).
 
     Returns:
         EnrichmentResult containing:
@@ -96,7 +137,14 @@ def enrich_table(
         >>>
         >>> print(result.result.fetchdf())
     """
-    start_time = time.time()
+    # Monotonic clock, so the elapsed time is immune to wall-clock adjustments
+    start_time = time.perf_counter()
+    enrich_fn = enrich_fn or enrich_batch
+    if progress_granularity not in ("row", "batch"):
+        raise ValueError(f"progress_granularity must be 'row' or 'batch', got {progress_granularity!r}")
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    row_progress = progress_callback if progress_granularity == "row" else None
 
     # Read source data
     source_cols = list(input_columns.values())
@@ -108,112 +156,139 @@ def enrich_table(
     else:
         query = f"SELECT {select_cols} FROM {quote_identifier(source_table)}"
 
-    rows = conn.execute(query).fetchall()
-    col_names = [desc[0] for desc in conn.description]
-
-    if not rows:
-        # Return empty result
-        schema = build_output_schema(output_columns)
-        prop_names = list(schema["properties"].keys())
-        empty_cols = ", ".join(f"NULL::VARCHAR AS {name}" for name in prop_names)
-        if include_basis:
-            empty_cols += ", NULL::VARCHAR AS _basis"
-        empty_query = f"SELECT {select_cols}, {empty_cols} FROM {quote_identifier(source_table)} WHERE 1=0"
-        rel = conn.sql(empty_query)
-
-        return EnrichmentResult(
-            result=rel,
-            success_count=0,
-            error_count=0,
-            errors=[],
-            elapsed_time=time.time() - start_time,
-        )
+    # Resolve the result column names once per distinct output spec
+    prop_names = _output_property_names(tuple(output_columns))
 
-    # Convert rows to input dicts
-    inputs = []
-    col_index_map = {name: i for i, name in enumerate(col_names)}
-
-    for row in rows:
-        input_data = {}
-        for desc, col_name in input_columns.items():
-            idx = col_index_map.get(col_name)
-            if idx is not None:
-                value = row[idx]
-                if value is not None:
-                    input_data[desc] = str(value)
-        inputs.append(input_data)
-
-    # Call the shared enrichment function
-    results = enrich_batch(
-        inputs=inputs,
-        output_columns=output_columns,
-        api_key=api_key,
-        processor=processor,
-        timeout=timeout,
-        include_basis=include_basis,
-        source="duckdb",
-    )
-
-    # Build output schema to get property names
-    schema = build_output_schema(output_columns)
-    prop_names = list(schema["properties"].keys())
-
-    # Process results
-    errors = []
+    errors: list[dict[str, Any]] = []
     success_count = 0
     error_count = 0
 
-    enriched_rows = []
-    for i, (original_row, result) in enumerate(zip(rows, results, strict=True)):
-        row_data = list(original_row)
-
-        if "error" in result:
-            error_count += 1
-            errors.append({"row": i, "error": result["error"]})
-            for _ in prop_names:
-                row_data.append(None)
-            if include_basis:
-                row_data.append(None)
+    def enrich_chunk(chunk: pa.Table | pa.RecordBatch, row_offset: int, total_rows: int) -> pa.Table:
+        """Enrich one chunk of source rows and return it with the enriched columns appended."""
+        nonlocal success_count, error_count
+        num_rows = chunk.num_rows
+
+        # Assemble the input columns into one StructArray so Arrow builds the per-row
+        # dicts, then drop NULL fields only on rows the combined null mask flags
+        columns = {
+            desc: _string_array(chunk.column(col_name))
+            for desc, col_name in input_columns.items()
+            if col_name in chunk.column_names
+        }
+        if not columns:
+            inputs: list[dict[str, str]] = [{} for _ in range(num_rows)]
         else:
-            success_count += 1
-            for name in prop_names:
-                row_data.append(result.get(name))
-            if include_basis:
-                row_data.append(result.get("basis"))
-
-        enriched_rows.append(tuple(row_data))
-
-        if progress_callback:
-            progress_callback(i + 1, len(rows))
-
-    # Create result relation
-    all_col_names = list(col_names) + prop_names
-    if include_basis:
-        all_col_names.append("_basis")
+            inputs = pa.StructArray.from_arrays(list(columns.values()), names=list(columns)).to_pylist()
+            null_masks = [array.is_null() for array in columns.values() if array.null_count]
+            if null_masks:
+                for i in pc.indices_nonzero(reduce(pc.or_, null_masks)).to_pylist():
+                    inputs[i] = {desc: value for desc, value in inputs[i].items() if value is not None}
+
+        # Call the shared enrichment function (an empty chunk skips the call but still
+        # flows through below so the result keeps the source schema)
+        results = (
+            enrich_fn(
+                inputs=inputs,
+                output_columns=output_columns,
+                api_key=api_key,
+                processor=processor,
+                timeout=timeout,
+                include_basis=include_basis,
+                source="duckdb",
+            )
+            if num_rows
+            else []
+        )
 
-    # Create a temporary table with results
-    temp_table = f"_parallel_enriched_{int(time.time() * 1000)}"
+        if len(results) != num_rows:
+            raise ValueError(f"enrich_batch returned {len(results)} results for {num_rows} rows")
+
+        # Process results into one value list per output column
+        output_values: dict[str, list[str | None]] = {name: [None] * num_rows for name in prop_names}
+        basis_values: list[str | None] = [None] * num_rows
+        # Pair each result key with its target list once, so the row loop does no name lookups
+        output_targets = [(name, output_values[name]) for name in prop_names]
+
+        for i, result in enumerate(results):
+            if "error" in result:
+                error_count += 1
+                errors.append({"row": row_offset + i, "error": result["error"]})
+            else:
+                success_count += 1
+                for name, values in output_targets:
+                    values[i] = _to_string_value(result.get(name))
+                basis_values[i] = _to_string_value(result.get("basis"))
+
+            if row_progress:
+                row_progress(row_offset + i + 1, total_rows)
+
+        if progress_callback and progress_granularity == "batch" and num_rows:
+            progress_callback(row_offset + num_rows, total_rows)
+
+        # Append the enriched columns to the source data as Arrow arrays. _basis is
+        # always built (all NULL unless requested) and dropped once at the end.
+        names = [*chunk.column_names, *prop_names, "_basis"]
+        arrays = [
+            *chunk.columns,
+            *(pa.array(output_values[name], type=pa.string()) for name in prop_names),
+            pa.array(basis_values, type=pa.string()),
+        ]
+        return pa.Table.from_arrays(arrays, names=names)
+
+    if batch_size is not None:
+        # Stream the source in fixed-size slices so only one chunk of inputs and
+        # API results is held in Python at a time
+        reader = pa.RecordBatchReader.from_stream(conn.sql(query))
+        batches = iter(reader)
+
+        def read_next() -> pa.RecordBatch | None:
+            return next(batches, None)
+
+        chunks = []
+        row_offset = 0
+        rows_read = 0
+        # Prefetch the next source batch on a worker thread while the current one
+        # is being enriched, so the DuckDB scan overlaps with the API calls
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(read_next)
+            while (record_batch := pending.result()) is not None:
+                pending = prefetcher.submit(read_next)
+                rows_read += record_batch.num_rows
+                for start in range(0, record_batch.num_rows, batch_size):
+                    chunk = record_batch.slice(start, batch_size)
+                    chunks.append(enrich_chunk(chunk, row_offset, rows_read))
+                    row_offset += chunk.num_rows
+        if not chunks:
+            chunks.append(enrich_chunk(reader.schema.empty_table(), 0, 0))
+        enriched = _combine_small_chunks(pa.concat_tables(chunks))
+    else:
+        source = pa.table(conn.sql(query))
+        enriched = _combine_small_chunks(enrich_chunk(source, 0, source.num_rows))
 
-    # Build column definitions
-    col_defs = ", ".join(f'"{name}" VARCHAR' for name in all_col_names)
-    temp_quoted = quote_identifier(temp_table)
-    conn.execute(f"CREATE TEMP TABLE {temp_quoted} ({col_defs})")
+    if not include_basis:
+        enriched = enriched.drop_columns(["_basis"])
 
-    # Insert data
-    if enriched_rows:
-        placeholders = ", ".join(["?"] * len(all_col_names))
-        insert_sql = f"INSERT INTO {temp_quoted} VALUES ({placeholders})"
-        conn.executemany(insert_sql, enriched_rows)
+    # Expose the Arrow table to DuckDB as a relation, without copying it row by row
+    # or registering a named view
+    enriched_rel = conn.from_arrow(enriched)
 
     # Create result relation or table
     if result_table:
+        # Persist with one CTAS over the relation so the target name is properly
+        # quoted (relation.create() mangles names containing '"'). query() exposes
+        # the relation as a temp view under a name unique to this call, dropped
+        # again once the table exists.
         result_quoted = quote_identifier(result_table)
-        conn.execute(f"CREATE TABLE {result_quoted} AS SELECT * FROM {temp_quoted}")
+        view_name = f"_parallel_enriched_{uuid.uuid4().hex}"
+        try:
+            enriched_rel.query(view_name, f"CREATE TABLE {result_quoted} AS SELECT * FROM {view_name}")
+        finally:
+            conn.execute(f"DROP VIEW IF EXISTS temp.main.{view_name}")
         rel = conn.sql(f"SELECT * FROM {result_quoted}")
     else:
-        rel = conn.sql(f"SELECT * FROM {temp_quoted}")
+        rel = enriched_rel
 
-    elapsed = time.time() - start_time
+    elapsed = time.perf_counter() - start_time
 
     return EnrichmentResult(
         result=rel,
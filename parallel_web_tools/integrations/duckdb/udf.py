@@ -27,27 +27,74 @@ Example:
 from __future__ import annotations
 
 import asyncio
-import json
-from typing import Any
+import contextlib
+import threading
+from collections.abc import Coroutine, Sequence
+from functools import lru_cache
+from typing import Any, TypeVar
 
 import duckdb
+import orjson
 import pyarrow as pa
 from _duckdb._func import PythonUDFType
 
-from parallel_web_tools.core import build_output_schema
 from parallel_web_tools.core.auth import resolve_api_key
+from parallel_web_tools.core.batch import _build_task_spec, _output_property_names, _to_string_value
 from parallel_web_tools.core.user_agent import get_default_headers
 
+T = TypeVar("T")
 
-async def _enrich_all_async(
+_background_loop: asyncio.AbstractEventLoop | None = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide event loop used for UDF dispatch, starting it on first use."""
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="parallel-duckdb-udf", daemon=True).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def _run_on_background_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the background loop and block until it finishes."""
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a JSON string with orjson."""
+    return orjson.dumps(obj, default=str).decode()
+
+
+@lru_cache(maxsize=128)
+def _parse_output_columns(output_columns_json: str) -> tuple[str, ...]:
+    """Parse an output_columns JSON array, cached by the raw string.
+
+    Raises:
+        orjson.JSONDecodeError: If the string is not valid JSON.
+        ValueError: If the JSON is not an array.
+    """
+    output_columns = orjson.loads(output_columns_json)
+    if not isinstance(output_columns, list):
+        raise ValueError("output_columns must be a JSON array")
+    return tuple(str(col) for col in output_columns)
+
+
+async def _enrich_items_async(
     items: list[dict[str, Any]],
-    output_columns: list[str],
+    output_columns: Sequence[str],
     api_key: str,
     processor: str = "lite-fast",
     timeout: int = 300,
-) -> list[str]:
+    max_concurrency: int = 256,
+) -> list[dict[str, Any]]:
     """
-    Enrich all items concurrently using asyncio.gather.
+    Enrich all items concurrently, collecting results as they complete.
+
+    Identical inputs are dispatched once and share the same result.
 
     Args:
         items: List of input dictionaries to enrich.
@@ -55,12 +102,13 @@ async def _enrich_all_async(
         api_key: Parallel API key.
         processor: Parallel processor to use.
         timeout: Timeout in seconds for each API call.
+        max_concurrency: Maximum number of task runs in flight at once.
 
     Returns:
-        List of JSON strings containing enrichment results (same order as inputs).
+        List of result dicts (same order as inputs). Failed items are
+        ``{"error": "..."}`` and non-dict content is wrapped as ``{"result": "..."}``.
     """
     from parallel import AsyncParallel
-    from parallel.types import JsonSchemaParam, TaskSpecParam
 
     from parallel_web_tools.core.endpoints import get_api_url
 
@@ -69,10 +117,10 @@ async def _enrich_all_async(
         api_key=api_key,
         default_headers=get_default_headers("duckdb"),
     )
-    output_schema = build_output_schema(output_columns)
-    task_spec = TaskSpecParam(output_schema=JsonSchemaParam(type="json", json_schema=output_schema))
+    task_spec = _build_task_spec(tuple(output_columns))
+    semaphore = asyncio.Semaphore(max_concurrency)
 
-    async def process_one(item: dict[str, Any]) -> str:
+    async def enrich_one(item: dict[str, Any]) -> dict[str, Any]:
         try:
             task_run = await client.task_run.create(
                 input=dict(item),
@@ -82,12 +130,59 @@ async def _enrich_all_async(
             result = await client.task_run.result(task_run.run_id, api_timeout=timeout)
             content = result.output.content
             if isinstance(content, dict):
-                return json.dumps(content)
-            return json.dumps({"result": str(content)})
+                return content
+            return {"result": str(content)}
         except Exception as e:
-            return json.dumps({"error": str(e)})
+            return {"error": str(e)}
 
-    return await asyncio.gather(*[process_one(item) for item in items])
+    async def process_one(item: dict[str, Any]) -> dict[str, Any]:
+        async with semaphore:
+            return await enrich_one(item)
+
+    # Dispatch each distinct input once and scatter the results back
+    unique: dict[bytes, int] = {}
+    keys: list[bytes] = []
+    unique_items: list[dict[str, Any]] = []
+    for item in items:
+        key = orjson.dumps(item, default=str, option=orjson.OPT_SORT_KEYS)
+        if key not in unique:
+            unique[key] = len(unique_items)
+            unique_items.append(item)
+        keys.append(key)
+
+    # Close the client's connection pool when this chunk is done; the background
+    # loop never stops, so an unclosed client would leak its connections
+    async with client:
+        unique_results = await asyncio.gather(*(process_one(item) for item in unique_items))
+
+    return [unique_results[unique[key]] for key in keys]
+
+
+async def _enrich_all_async(
+    items: list[dict[str, Any]],
+    output_columns: Sequence[str],
+    api_key: str,
+    processor: str = "lite-fast",
+    timeout: int = 300,
+    max_concurrency: int = 256,
+) -> list[str]:
+    """
+    Enrich all items concurrently and serialize each result to JSON.
+
+    See ``_enrich_items_async`` for the arguments.
+
+    Returns:
+        List of JSON strings containing enrichment results (same order as inputs).
+    """
+    results = await _enrich_items_async(
+        items,
+        output_columns,
+        api_key,
+        processor,
+        timeout,
+        max_concurrency=max_concurrency,
+    )
+    return [_dumps(result) for result in results]
 
 
 def _enrich_batch_sync(
@@ -96,6 +191,7 @@ def _enrich_batch_sync(
     api_key: str,
     processor: str = "lite-fast",
     timeout: int = 300,
+    max_concurrency: int = 256,
 ) -> list[str]:
     """
     Enrich a batch of inputs synchronously by running async code.
@@ -106,18 +202,19 @@ def _enrich_batch_sync(
         api_key: Parallel API key.
         processor: Parallel processor to use.
         timeout: Timeout in seconds for each API call.
+        max_concurrency: Maximum number of task runs in flight at once.
 
     Returns:
         List of JSON strings with enriched data or errors.
     """
-    # Parse output columns once (same for all rows)
+    # Parse output columns once (cached across calls with the same spec)
     try:
-        output_columns = json.loads(output_columns_json)
-        if not isinstance(output_columns, list):
-            error = json.dumps({"error": "output_columns must be a JSON array"})
-            return [error] * len(input_jsons)
-    except json.JSONDecodeError as e:
-        error = json.dumps({"error": f"Invalid output_columns JSON: {e}"})
+        output_columns = _parse_output_columns(output_columns_json)
+    except orjson.JSONDecodeError as e:
+        error = _dumps({"error": f"Invalid output_columns JSON: {e}"})
+        return [error] * len(input_jsons)
+    except ValueError as e:
+        error = _dumps({"error": str(e)})
         return [error] * len(input_jsons)
 
     # Parse all input JSONs, tracking errors
@@ -126,10 +223,10 @@ def _enrich_batch_sync(
 
     for i, input_json in enumerate(input_jsons):
         try:
-            item = json.loads(input_json)
+            item = orjson.loads(input_json)
             items.append(item)
-        except json.JSONDecodeError as e:
-            parse_errors[i] = json.dumps({"error": f"Invalid input JSON: {e}"})
+        except orjson.JSONDecodeError as e:
+            parse_errors[i] = _dumps({"error": f"Invalid input JSON: {e}"})
             items.append({})  # Placeholder
 
     # Filter out items with parse errors for processing
@@ -138,25 +235,20 @@ def _enrich_batch_sync(
 
     if not valid_items:
         # All inputs had parse errors
-        return [parse_errors.get(i, json.dumps({"error": "Unknown error"})) for i in range(len(input_jsons))]
-
-    # Run async enrichment - handle both standalone and nested event loop cases (e.g., Jupyter)
-    try:
-        # Check if there's already a running event loop
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop is not None:
-        # We're inside an existing event loop (e.g., Jupyter notebook)
-        # Use nest_asyncio to allow nested event loops
-        import nest_asyncio
-
-        nest_asyncio.apply()
-        results = asyncio.run(_enrich_all_async(valid_items, output_columns, api_key, processor, timeout))
-    else:
-        # No existing event loop, use standard asyncio.run
-        results = asyncio.run(_enrich_all_async(valid_items, output_columns, api_key, processor, timeout))
+        return [parse_errors.get(i, _dumps({"error": "Unknown error"})) for i in range(len(input_jsons))]
+
+    # Run async enrichment on the shared background loop; this works the same
+    # whether or not the caller already has a running loop (e.g., Jupyter)
+    results = _run_on_background_loop(
+        _enrich_all_async(
+            valid_items,
+            output_columns,
+            api_key,
+            processor,
+            timeout,
+            max_concurrency=max_concurrency,
+        )
+    )
 
     # Map results back to original positions
     output: list[str] = [""] * len(input_jsons)
@@ -176,6 +268,8 @@ def register_parallel_functions(
     api_key: str | None = None,
     processor: str = "lite-fast",
     timeout: int = 300,
+    max_concurrency: int = 256,
+    output_columns: list[str] | None = None,
 ) -> None:
     """
     Register Parallel enrichment functions in a DuckDB connection.
@@ -190,6 +284,12 @@ def register_parallel_functions(
         processor: Parallel processor to use. Default is "lite-fast".
             Options: lite, lite-fast, base, base-fast, core, core-fast, pro, pro-fast
         timeout: Timeout in seconds for each enrichment. Default is 300 (5 min).
+        max_concurrency: Maximum number of task runs in flight per UDF chunk.
+            Default is 256.
+        output_columns: Optional fixed list of output column descriptions. When
+            given, ``parallel_enrich`` is registered specialized to this schema:
+            it takes only a MAP of inputs and returns a STRUCT, so no output
+            spec is passed or parsed per row.
 
     Example:
         >>> import duckdb
@@ -215,6 +315,21 @@ def register_parallel_functions(
         - input_json: JSON object with input data, e.g., json_object('company_name', 'Google')
         - output_columns: JSON array of output descriptions, e.g., json_array('CEO name')
         - Returns: JSON string with enriched data or {"error": "..."} on failure
+
+        parallel_enrich_map(input MAP(VARCHAR, VARCHAR), output_columns VARCHAR[])
+            -> MAP(VARCHAR, VARCHAR)
+
+        - Same as parallel_enrich but with native DuckDB values instead of JSON,
+          e.g., parallel_enrich_map(MAP {'company_name': name}, ['CEO name'])
+        - Returns: MAP of enriched values, or a MAP with an "error" key on failure
+
+        With output_columns=["CEO name", "Founding year"] at registration:
+
+        parallel_enrich(input MAP(VARCHAR, VARCHAR))
+            -> STRUCT(ceo_name VARCHAR, founding_year VARCHAR, _error VARCHAR)
+
+        - Returns: STRUCT with one field per output column; on failure those
+          fields are NULL and _error holds the message
     """
     # Resolve and capture the API key at registration time
     key = resolve_api_key(api_key)
@@ -234,26 +349,105 @@ def register_parallel_functions(
         input_jsons = input_col.to_pylist()
         output_columns_jsons = output_col.to_pylist()
 
-        # All rows should have the same output_columns, use the first one
-        output_columns_json = output_columns_jsons[0] if output_columns_jsons else "[]"
-
-        # Process all inputs concurrently
-        results = _enrich_batch_sync(
-            input_jsons=input_jsons,
-            output_columns_json=output_columns_json,
-            api_key=key,
-            processor=processor,
-            timeout=timeout,
-        )
+        # Group rows by output_columns so each distinct spec is enriched in a
+        # single batched call (in practice this is almost always one group).
+        groups: dict[str, list[int]] = {}
+        for i, output_columns_json in enumerate(output_columns_jsons):
+            groups.setdefault(output_columns_json or "[]", []).append(i)
+
+        results: list[str] = [""] * len(input_jsons)
+        for output_columns_json, indices in groups.items():
+            group_results = _enrich_batch_sync(
+                input_jsons=[input_jsons[i] for i in indices],
+                output_columns_json=output_columns_json,
+                api_key=key,
+                processor=processor,
+                timeout=timeout,
+                max_concurrency=max_concurrency,
+            )
+            for i, result in zip(indices, group_results, strict=True):
+                results[i] = result
 
         return pa.array(results, type=pa.string())
 
-    # Register the vectorized function
+    def enrich_map_vectorized(input_col: pa.Array, output_col: pa.Array) -> pa.Array:
+        """
+        Vectorized UDF over native MAP/LIST values, with no JSON on either side.
+
+        Args:
+            input_col: PyArrow MapArray of input key/value pairs.
+            output_col: PyArrow ListArray of output column descriptions.
+
+        Returns:
+            PyArrow MapArray of enriched values (or an "error" entry).
+        """
+        inputs = input_col.to_pylist()
+        output_columns_lists = output_col.to_pylist()
+
+        groups: dict[tuple[str, ...], list[int]] = {}
+        for i, output_columns in enumerate(output_columns_lists):
+            groups.setdefault(tuple(output_columns or ()), []).append(i)
+
+        results: list[list[tuple[str, str | None]] | None] = [None] * len(inputs)
+        for output_columns, indices in groups.items():
+            group_results = _run_on_background_loop(
+                _enrich_items_async(
+                    [dict(inputs[i] or ()) for i in indices],
+                    output_columns,
+                    key,
+                    processor,
+                    timeout,
+                    max_concurrency=max_concurrency,
+                )
+            )
+            for i, result in zip(indices, group_results, strict=True):
+                results[i] = [(name, _to_string_value(value)) for name, value in result.items()]
+
+        return pa.array(results, type=pa.map_(pa.string(), pa.string()))
+
+    # Register the vectorized functions
+    if output_columns is None:
+        conn.create_function(
+            "parallel_enrich",
+            enrich_vectorized,
+            ["VARCHAR", "VARCHAR"],
+            "VARCHAR",
+            type=PythonUDFType.ARROW,
+            side_effects=True,
+        )
+    else:
+        fixed_columns = tuple(output_columns)
+        prop_names = _output_property_names(fixed_columns)
+        struct_type = pa.struct([(name, pa.string()) for name in [*prop_names, "_error"]])
+        struct_sql = ", ".join(f'"{name}" VARCHAR' for name in [*prop_names, "_error"])
+
+        def enrich_struct_vectorized(input_col: pa.Array) -> pa.Array:
+            """Vectorized UDF specialized to the output columns given at registration."""
+            items = [dict(pairs or ()) for pairs in input_col.to_pylist()]
+            results = _run_on_background_loop(
+                _enrich_items_async(items, fixed_columns, key, processor, timeout, max_concurrency=max_concurrency)
+            )
+            rows = [
+                {"_error": result["error"]}
+                if "error" in result
+                else {name: _to_string_value(result.get(name)) for name in prop_names}
+                for result in results
+            ]
+            return pa.array(rows, type=struct_type)
+
+        conn.create_function(
+            "parallel_enrich",
+            enrich_struct_vectorized,
+            ["MAP(VARCHAR, VARCHAR)"],
+            f"STRUCT({struct_sql})",
+            type=PythonUDFType.ARROW,
+            side_effects=True,
+        )
     conn.create_function(
-        "parallel_enrich",
-        enrich_vectorized,
-        ["VARCHAR", "VARCHAR"],
-        "VARCHAR",
+        "parallel_enrich_map",
+        enrich_map_vectorized,
+        ["MAP(VARCHAR, VARCHAR)", "VARCHAR[]"],
+        "MAP(VARCHAR, VARCHAR)",
         type=PythonUDFType.ARROW,
         side_effects=True,
     )
@@ -344,9 +538,9 @@ def register_parallel_findall(
                 # Strip internal fields
                 skip_keys = {"candidate_id", "match_status", "basis"}
                 cleaned = [{k: v for k, v in c.items() if k not in skip_keys} for c in matched]
-                results.append(json.dumps(cleaned, default=str))
+                results.append(_dumps(cleaned))
             except Exception as e:
-                results.append(json.dumps([{"error": str(e)}]))
+                results.append(_dumps([{"error": str(e)}]))
         return pa.array(results, type=pa.string())
 
     conn.create_function(
@@ -366,7 +560,7 @@ def unregister_parallel_functions(conn: duckdb.DuckDBPyConnection) -> None:
     Args:
         conn: DuckDB connection.
     """
-    try:
-        conn.remove_function("parallel_enrich")
-    except Exception:
-        pass  # Function may not exist
+    for name in ("parallel_enrich", "parallel_enrich_map"):
+        # Raised when the function was never registered on this connection
+        with contextlib.suppress(duckdb.InvalidInputException):
+            conn.remove_function(name)
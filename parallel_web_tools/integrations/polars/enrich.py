@@ -24,15 +24,47 @@ Example:
 from __future__ import annotations
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
 
-from parallel_web_tools.core import EnrichmentResult, build_output_schema, enrich_batch
+from parallel_web_tools.core import EnrichmentResult, enrich_batch
+from parallel_web_tools.core.batch import _output_property_names
 
 if TYPE_CHECKING:
     PolarsEnrichmentResult = EnrichmentResult[pl.DataFrame]
 
+# Every key extract_basis can emit, so _basis has one native List(Struct) dtype
+# regardless of which keys the first rows happen to carry
+_BASIS_DTYPE = pl.List(
+    pl.Struct(
+        {
+            "field": pl.String,
+            "citations": pl.List(pl.Struct({"url": pl.String, "excerpts": pl.List(pl.String)})),
+            "reasoning": pl.String,
+            "confidence": pl.String,
+            "url": pl.String,
+            "title": pl.String,
+            "excerpts": pl.List(pl.String),
+        }
+    )
+)
+
+
+def _string_column(df: pl.DataFrame, col_name: str, alias: str) -> pl.Series:
+    """Return ``df[col_name]`` as a String series named ``alias``, rendered like ``str()``.
+
+    String, integer and categorical columns are cast natively. Other dtypes (floats,
+    temporals, nested) format differently under a Polars cast, so they go through
+    ``str()`` per value.
+    """
+    series = df.get_column(col_name)
+    dtype = series.dtype
+    if dtype == pl.String or dtype.is_integer() or isinstance(dtype, (pl.Categorical, pl.Enum)):
+        return series.cast(pl.String).alias(alias)
+    return pl.Series(alias, [None if value is None else str(value) for value in series], dtype=pl.String)
+
 
 def parallel_enrich(
     df: pl.DataFrame,
@@ -42,6 +74,8 @@ def parallel_enrich(
     processor: str = "lite-fast",
     timeout: int = 600,
     include_basis: bool = False,
+    batch_size: int | None = None,
+    max_workers: int = 4,
 ) -> EnrichmentResult:
     """
     Enrich a Polars DataFrame using the Parallel API.
@@ -63,6 +97,11 @@ def parallel_enrich(
             Options: lite, lite-fast, base, base-fast, core, core-fast, pro, pro-fast
         timeout: Timeout in seconds for the enrichment. Default is 600 (10 min).
         include_basis: Whether to include basis/citations in results. Default is False.
+        batch_size: Optional number of rows per ``enrich_batch`` call. When set, the rows
+            are split into chunks of this size that run concurrently, instead of one
+            task group for the whole DataFrame. Results keep the original row order.
+        max_workers: Maximum number of chunks enriched at once when batch_size is set.
+            Default is 4.
 
     Returns:
         EnrichmentResult containing:
@@ -100,8 +139,15 @@ def parallel_enrich(
     """
     start_time = time.time()
 
-    # Validate input columns exist
-    missing_cols = [col for col in input_columns.values() if col not in df.columns]
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be a positive integer, got {max_workers}")
+
+    # Validate input columns exist (df.columns builds a new list per access, so look
+    # names up in one set while keeping the missing ones in mapping order)
+    available = set(df.columns)
+    missing_cols = [col for col in input_columns.values() if col not in available]
     if missing_cols:
         raise ValueError(f"Columns not found in DataFrame: {missing_cols}")
 
@@ -114,59 +160,59 @@ def parallel_enrich(
             elapsed_time=time.time() - start_time,
         )
 
-    # Convert DataFrame rows to list of input dicts
-    inputs = []
-    for row in df.iter_rows(named=True):
-        input_data = {}
-        for desc, col_name in input_columns.items():
-            value = row[col_name]
-            if value is not None:
-                input_data[desc] = str(value)
-        inputs.append(input_data)
-
-    # Call the shared enrichment function
-    results = enrich_batch(
-        inputs=inputs,
-        output_columns=output_columns,
-        api_key=api_key,
-        processor=processor,
-        timeout=timeout,
-        include_basis=include_basis,
-        source="polars",
-    )
-
-    # Build output schema to get property names
-    schema = build_output_schema(output_columns)
-    prop_names = list(schema["properties"].keys())
+    # Render the input columns as strings in one select, then drop NULL fields
+    # only on the rows that have any. With no input columns every row sends {}.
+    inputs: list[dict[str, Any]]
+    if not input_columns:
+        inputs = [{} for _ in range(df.height)]
+    else:
+        input_df = pl.DataFrame([_string_column(df, col_name, desc) for desc, col_name in input_columns.items()])
+        inputs = input_df.to_dicts()
+        if input_df.null_count().sum_horizontal().item():
+            null_rows = input_df.select(pl.any_horizontal(pl.all().is_null())).to_series().arg_true()
+            for i in null_rows.to_list():
+                inputs[i] = {desc: value for desc, value in inputs[i].items() if value is not None}
+
+    def enrich_chunk(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        # Call the shared enrichment function
+        return enrich_batch(
+            inputs=chunk,
+            output_columns=output_columns,
+            api_key=api_key,
+            processor=processor,
+            timeout=timeout,
+            include_basis=include_basis,
+            source="polars",
+        )
 
-    # Extract columns from results
-    new_columns: dict[str, list[Any]] = {name: [] for name in prop_names}
-    if include_basis:
-        new_columns["_basis"] = []
+    if batch_size is None or batch_size >= len(inputs):
+        results = enrich_chunk(inputs)
+    else:
+        # Enrich fixed-size chunks concurrently; map() yields them back in input order
+        chunks = [inputs[start : start + batch_size] for start in range(0, len(inputs), batch_size)]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            results = [result for chunk_results in executor.map(enrich_chunk, chunks) for result in chunk_results]
 
-    errors = []
-    success_count = 0
-    error_count = 0
+    # Resolve the result column names once per distinct output spec
+    prop_names = _output_property_names(tuple(output_columns))
 
+    # Split errors out in one pass; error rows contribute NULL to every enriched column
+    errors: list[dict[str, Any]] = []
+    row_results: list[dict[str, Any]] = []
     for i, result in enumerate(results):
         if "error" in result:
-            error_count += 1
             errors.append({"row": i, "error": result["error"]})
-            for name in prop_names:
-                new_columns[name].append(None)
-            if include_basis:
-                new_columns["_basis"].append(None)
+            row_results.append({})
         else:
-            success_count += 1
-            for name in prop_names:
-                new_columns[name].append(result.get(name))
-            if include_basis:
-                new_columns["_basis"].append(result.get("basis"))
+            row_results.append(result)
+    error_count = len(errors)
+    success_count = len(results) - error_count
 
-    # Add new columns to DataFrame
-    enriched_df = df.clone()
-    for col_name, values in new_columns.items():
-        enriched_df = enriched_df.with_columns(pl.Series(name=col_name, values=values))
+    # Build each enriched column in one pass and attach them all in one with_columns
+    new_columns = [pl.Series(name, [result.get(name) for result in row_results]) for name in prop_names]
+    if include_basis:
+        new_columns.append(pl.Series("_basis", [result.get("basis") for result in row_results], dtype=_BASIS_DTYPE))
+    enriched_df = df.with_columns(new_columns)
 
     elapsed = time.time() - start_time
 
@@ -187,13 +233,15 @@ def parallel_enrich_lazy(
     processor: str = "lite-fast",
     timeout: int = 600,
     include_basis: bool = False,
+    batch_size: int | None = None,
+    max_workers: int = 4,
 ) -> EnrichmentResult:
     """
     Enrich a Polars LazyFrame using the Parallel API.
 
-    This is a convenience function that collects the LazyFrame, enriches it,
-    and returns the result. For large datasets, consider using `parallel_enrich`
-    with batched collection.
+    This is a convenience function that collects the LazyFrame with Polars'
+    streaming engine, enriches it, and returns the result. For large datasets,
+    consider using `parallel_enrich` with batched collection.
 
     Args:
         lf: The Polars LazyFrame to enrich.
@@ -203,11 +251,15 @@ def parallel_enrich_lazy(
         processor: Parallel processor to use.
         timeout: Timeout in seconds.
         include_basis: Whether to include basis/citations.
+        batch_size: Optional number of rows per concurrent ``enrich_batch`` call.
+        max_workers: Maximum number of chunks enriched at once.
 
     Returns:
         EnrichmentResult with enriched DataFrame.
     """
-    df = lf.collect()
+    # Run the upstream filter/select pipeline on the streaming engine so it is not
+    # materialized in full before only the surviving rows are kept
+    df = lf.collect(engine="streaming")
     return parallel_enrich(
         df=df,
         input_columns=input_columns,
@@ -216,4 +268,6 @@ def parallel_enrich_lazy(
         processor=processor,
         timeout=timeout,
         include_basis=include_basis,
+        batch_size=batch_size,
+        max_workers=max_workers,
     )
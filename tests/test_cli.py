@@ -2,10 +2,14 @@
 
 import json
 import os
+import re
+from functools import cache
+from types import SimpleNamespace
 from unittest import mock
 
 import pytest
 from click.testing import CliRunner
+from orjson import loads
 
 from parallel_web_tools.cli.commands import (
     EXIT_API_ERROR,
@@ -27,9 +31,13 @@ from parallel_web_tools.cli.commands import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared across the module.
+
+    ``CliRunner.invoke`` isolates stdin/stdout/stderr per call, so a single
+    runner can be reused instead of rebuilding one for every test.
+    """
     return CliRunner()
 
 
@@ -41,6 +49,30 @@ def mock_cli_client():
         yield client
 
 
+@pytest.fixture(scope="module")
+def source_columns_json():
+    """Source column spec shared read-only across tests."""
+    return json.dumps([{"name": "company", "description": "Company name"}])
+
+
+@pytest.fixture(scope="module")
+def enriched_columns_json():
+    """Enriched column spec shared read-only across tests."""
+    return json.dumps([{"name": "ceo", "description": "CEO name"}])
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _stub_api_key():
+    """Stub CLI API key resolution once for the whole module.
+
+    Tests that exercise authentication patch ``get_api_key`` themselves, which
+    takes precedence over this stub for the duration of the test.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("parallel_web_tools.cli.commands.get_api_key", lambda *args, **kwargs: "test-key")
+        yield
+
+
 class TestParseCommaSeparated:
     """Tests for parse_comma_separated helper function."""
 
@@ -320,7 +352,7 @@ class TestAuthCommand:
             result = runner.invoke(main, ["auth", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert output["selected_org_name"] == "Acme Org"
 
 
@@ -590,23 +622,22 @@ class TestEnrichSuggestCommand:
             "warnings": [],
         }
 
-        with mock.patch("parallel_web_tools.cli.commands.get_api_key", return_value="test-key"):
-            with mock.patch("httpx.Client") as mock_client_class:
-                mock_client = mock.MagicMock()
-                mock_response_obj = mock.MagicMock()
-                mock_response_obj.json.return_value = mock_response
-                mock_response_obj.raise_for_status = mock.MagicMock()
-                mock_client.post.return_value = mock_response_obj
-                mock_client.__enter__ = mock.MagicMock(return_value=mock_client)
-                mock_client.__exit__ = mock.MagicMock(return_value=False)
-                mock_client_class.return_value = mock_client
+        with mock.patch("httpx.Client") as mock_client_class:
+            mock_client = mock.MagicMock()
+            mock_response_obj = mock.MagicMock()
+            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.raise_for_status = mock.MagicMock()
+            mock_client.post.return_value = mock_response_obj
+            mock_client.__enter__ = mock.MagicMock(return_value=mock_client)
+            mock_client.__exit__ = mock.MagicMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
-                result = runner.invoke(main, ["enrich", "suggest", "Find CEO and revenue", "--json"])
+            result = runner.invoke(main, ["enrich", "suggest", "Find CEO and revenue", "--json"])
 
-                assert result.exit_code == 0
-                output = json.loads(result.output)
-                assert "enriched_columns" in output
-                assert "processor" in output
+            assert result.exit_code == 0
+            output = loads(result.output)
+            assert "enriched_columns" in output
+            assert "processor" in output
 
 
 class TestEnrichDeployCommand:
@@ -642,22 +673,21 @@ class TestSuggestFromIntent:
             "warnings": [],
         }
 
-        with mock.patch("parallel_web_tools.cli.commands.get_api_key", return_value="test-key"):
-            with mock.patch("httpx.Client") as mock_client_class:
-                mock_client = mock.MagicMock()
-                mock_response_obj = mock.MagicMock()
-                mock_response_obj.json.return_value = mock_response
-                mock_response_obj.raise_for_status = mock.MagicMock()
-                mock_client.post.return_value = mock_response_obj
-                mock_client.__enter__ = mock.MagicMock(return_value=mock_client)
-                mock_client.__exit__ = mock.MagicMock(return_value=False)
-                mock_client_class.return_value = mock_client
+        with mock.patch("httpx.Client") as mock_client_class:
+            mock_client = mock.MagicMock()
+            mock_response_obj = mock.MagicMock()
+            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.raise_for_status = mock.MagicMock()
+            mock_client.post.return_value = mock_response_obj
+            mock_client.__enter__ = mock.MagicMock(return_value=mock_client)
+            mock_client.__exit__ = mock.MagicMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
-                result = suggest_from_intent("Find the CEO")
+            result = suggest_from_intent("Find the CEO")
 
-                assert "enriched_columns" in result
-                assert len(result["enriched_columns"]) == 1
-                assert result["enriched_columns"][0]["name"] == "ceo"
+            assert "enriched_columns" in result
+            assert len(result["enriched_columns"]) == 1
+            assert result["enriched_columns"][0]["name"] == "ceo"
 
     def test_suggest_from_intent_with_source_columns(self):
         """Should include source columns context in intent."""
@@ -667,25 +697,24 @@ class TestSuggestFromIntent:
             "warnings": [],
         }
 
-        with mock.patch("parallel_web_tools.cli.commands.get_api_key", return_value="test-key"):
-            with mock.patch("parallel_web_tools.cli.commands.httpx.Client") as mock_client_class:
-                mock_client = mock.MagicMock()
-                mock_response_obj = mock.MagicMock()
-                mock_response_obj.json.return_value = mock_response
-                mock_response_obj.raise_for_status = mock.MagicMock()
-                mock_client.post.return_value = mock_response_obj
-                mock_client.__enter__ = mock.MagicMock(return_value=mock_client)
-                mock_client.__exit__ = mock.MagicMock(return_value=False)
-                mock_client_class.return_value = mock_client
+        with mock.patch("parallel_web_tools.cli.commands.httpx.Client") as mock_client_class:
+            mock_client = mock.MagicMock()
+            mock_response_obj = mock.MagicMock()
+            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.raise_for_status = mock.MagicMock()
+            mock_client.post.return_value = mock_response_obj
+            mock_client.__enter__ = mock.MagicMock(return_value=mock_client)
+            mock_client.__exit__ = mock.MagicMock(return_value=False)
+            mock_client_class.return_value = mock_client
 
-                source_cols = [{"name": "company", "description": "Company name"}]
-                result = suggest_from_intent("Find CEO", source_cols)
+            source_cols = [{"name": "company", "description": "Company name"}]
+            result = suggest_from_intent("Find CEO", source_cols)
 
-                # Verify that the function returned valid results
-                assert "enriched_columns" in result
+            # Verify that the function returned valid results
+            assert "enriched_columns" in result
 
-                # Verify the call was made
-                assert mock_client.post.called
+            # Verify the call was made
+            assert mock_client.post.called
 
 
 class TestCLIExtrasAndStandaloneMode:
@@ -853,7 +882,7 @@ class TestHandleError:
             _handle_error(RuntimeError("api down"), output_json=True, exit_code=EXIT_API_ERROR)
 
         assert exc_info.value.code == EXIT_API_ERROR
-        output = json.loads(capsys.readouterr().out)
+        output = loads(capsys.readouterr().out)
         assert output["error"]["message"] == "api down"
         assert output["error"]["type"] == "RuntimeError"
 
@@ -886,7 +915,7 @@ class TestHandleError:
             _handle_error(error, output_json=True)
 
         assert exc_info.value.code == EXIT_AUTH_ERROR
-        output = json.loads(capsys.readouterr().out)
+        output = loads(capsys.readouterr().out)
         assert "Account API credentials" in output["error"]["message"]
         assert "parallel-cli login" in output["error"]["message"]
 
@@ -911,7 +940,7 @@ class TestHandleError:
         with pytest.raises(SystemExit):
             _handle_error(error, output_json=True)
 
-        output = json.loads(capsys.readouterr().out)
+        output = loads(capsys.readouterr().out)
         assert "Account API credentials" not in output["error"]["message"]
         assert "authorization grant has expired" in output["error"]["message"]
 
@@ -927,127 +956,107 @@ class TestWriteJsonOutput:
         write_json_output(data, str(output_file), output_json=False)
 
         assert output_file.exists()
-        loaded = json.loads(output_file.read_text())
+        loaded = loads(output_file.read_bytes())
         assert loaded == data
 
-    def test_write_to_stdout(self, capsys):
+    def test_write_to_stdout(self, capfd):
         """Should print JSON to stdout when output_json is True."""
         data = {"results": [1, 2, 3]}
 
         write_json_output(data, None, output_json=True)
 
-        output = json.loads(capsys.readouterr().out)
+        output = loads(capfd.readouterr().out)
         assert output == data
 
-    def test_write_to_both(self, tmp_path, capsys):
+    def test_write_to_both(self, tmp_path, capfd):
         """Should write to file AND stdout when both specified."""
         output_file = tmp_path / "output.json"
         data = {"result": "ok"}
 
         write_json_output(data, str(output_file), output_json=True)
 
-        # File should be written
-        assert output_file.exists()
-        file_data = json.loads(output_file.read_text())
-        assert file_data == data
+        # File should hold exactly the serialized payload; no parse needed
+        assert output_file.read_bytes() == json.dumps(data, indent=2).encode()
 
         # stdout should contain the JSON data
-        captured = capsys.readouterr().out
+        captured = capfd.readouterr().out
         assert '"result"' in captured
         assert '"ok"' in captured
 
-    def test_write_neither(self, tmp_path, capsys):
+    def test_write_neither(self, tmp_path, capfd):
         """Should do nothing when no output_file and output_json is False."""
         data = {"result": "ok"}
 
         write_json_output(data, None, output_json=False)
 
-        assert capsys.readouterr().out == ""
+        assert capfd.readouterr().out == ""
 
 
 class TestContentToMarkdown:
     """Tests for _content_to_markdown function."""
 
-    def test_none_returns_empty(self):
-        """Should return empty string for None."""
-        assert _content_to_markdown(None) == ""
-
-    def test_string_returned_as_is(self):
-        """Should return strings unchanged."""
-        assert _content_to_markdown("hello world") == "hello world"
-
-    def test_dict_with_text_key(self):
-        """Should extract text from {text: '...'} structure."""
-        assert _content_to_markdown({"text": "the content"}) == "the content"
-
-    def test_dict_with_multiple_keys(self):
-        """Should convert dict keys to markdown headings."""
-        result = _content_to_markdown({"summary": "A summary.", "conclusion": "Done."})
-        assert "# Summary" in result
-        assert "A summary." in result
-        assert "# Conclusion" in result
-        assert "Done." in result
-
-    def test_dict_with_list_values(self):
-        """Should convert list values to bullet points."""
-        result = _content_to_markdown({"findings": ["item 1", "item 2"]})
-        assert "# Findings" in result
-        assert "- item 1" in result
-        assert "- item 2" in result
-
-    def test_dict_with_nested_dict(self):
-        """Should recursively convert nested dicts."""
-        result = _content_to_markdown({"section": {"sub_topic": "content here"}})
-        assert "# Section" in result
-        assert "## Sub Topic" in result
-        assert "content here" in result
-
-    def test_list_of_strings(self):
-        """Should convert list of strings to bullet points."""
-        result = _content_to_markdown(["a", "b", "c"])
-        assert "- a" in result
-        assert "- b" in result
-        assert "- c" in result
-
-    def test_list_of_dicts(self):
-        """Should recursively process list of dicts."""
-        result = _content_to_markdown([{"name": "Alice"}, {"name": "Bob"}])
-        assert "Name" in result
-        assert "Alice" in result
-        assert "Bob" in result
-
-    def test_non_string_non_dict_non_list(self):
-        """Should convert other types to string."""
-        assert _content_to_markdown(42) == "42"
-        assert _content_to_markdown(True) == "True"
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            pytest.param(None, "", id="none_returns_empty"),
+            pytest.param("hello world", "hello world", id="string_returned_as_is"),
+            pytest.param({"text": "the content"}, "the content", id="dict_with_text_key"),
+            pytest.param(42, "42", id="int_converted_to_string"),
+            pytest.param(True, "True", id="bool_converted_to_string"),
+        ],
+    )
+    def test_content_to_markdown_exact(self, content, expected):
+        """Should render scalars and text content exactly."""
+        assert _content_to_markdown(content) == expected
+
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            pytest.param(
+                {"summary": "A summary.", "conclusion": "Done."},
+                ["# Summary", "A summary.", "# Conclusion", "Done."],
+                id="dict_with_multiple_keys",
+            ),
+            pytest.param(
+                {"findings": ["item 1", "item 2"]},
+                ["# Findings", "- item 1", "- item 2"],
+                id="dict_with_list_values",
+            ),
+            pytest.param(
+                {"section": {"sub_topic": "content here"}},
+                ["# Section", "## Sub Topic", "content here"],
+                id="dict_with_nested_dict",
+            ),
+            pytest.param(["a", "b", "c"], ["- a", "- b", "- c"], id="list_of_strings"),
+            pytest.param([{"name": "Alice"}, {"name": "Bob"}], ["Name", "Alice", "Bob"], id="list_of_dicts"),
+            pytest.param(
+                {"key_findings_summary": "text"},
+                ["# Key Findings Summary"],
+                id="key_underscores_converted_to_spaces_and_titled",
+            ),
+            pytest.param({"count": 42}, ["42"], id="dict_with_non_string_value"),
+            pytest.param(
+                {"sources": [{"url": "https://example.com", "title": "Example"}]},
+                ["# Sources", "example.com"],
+                id="dict_list_with_nested_dicts",
+            ),
+        ],
+    )
+    def test_content_to_markdown_contains(self, content, expected):
+        """Should include every expected fragment in the rendered markdown."""
+        result = _content_to_markdown(content)
+        for text in expected:
+            assert text in result
 
     def test_heading_level_capped_at_6(self):
-        """Should not exceed 6 levels of headings."""
-        # Deeply nested
+        """Should never emit a heading deeper than ######."""
         result = _content_to_markdown({"a": {"b": {"c": {"d": {"e": {"f": {"g": "deep"}}}}}}})
-        # The deepest heading should still be ######
         assert "#######" not in result
 
-    def test_key_underscores_converted_to_spaces_and_titled(self):
-        """Should convert underscored keys to title case."""
-        result = _content_to_markdown({"key_findings_summary": "text"})
-        assert "# Key Findings Summary" in result
-
-    def test_dict_with_non_string_value(self):
-        """Should convert non-string/non-dict/non-list values to strings."""
-        result = _content_to_markdown({"count": 42})
-        assert "42" in result
-
-    def test_dict_list_with_nested_dicts(self):
-        """Should handle list of dicts inside a dict."""
-        content = {
-            "sources": [
-                {"url": "https://example.com", "title": "Example"},
-            ]
-        }
-        result = _content_to_markdown(content)
-        assert "# Sources" in result
-        assert "example.com" in result
+
+_MATCH_NOT_BOTH = re.compile("not both")
+_MATCH_SOURCE_TYPE = re.compile("--source-type")
+_MATCH_OUTPUT_SPEC = re.compile("--enriched-columns OR --intent")
 
 
 class TestValidateEnrichArgs:
@@ -1065,21 +1074,21 @@ class TestValidateEnrichArgs:
         """Should raise when both enriched_columns and intent are provided."""
         import click
 
-        with pytest.raises(click.UsageError, match="not both"):
+        with pytest.raises(click.UsageError, match=_MATCH_NOT_BOTH):
             validate_enrich_args("csv", "input.csv", "output.csv", "[]", "[]", "intent")
 
     def test_missing_source_type(self):
         """Should raise when source_type is missing."""
         import click
 
-        with pytest.raises(click.UsageError, match="--source-type"):
+        with pytest.raises(click.UsageError, match=_MATCH_SOURCE_TYPE):
             validate_enrich_args(None, "input.csv", "output.csv", "[]", "[]", None)
 
     def test_no_output_spec_raises(self):
         """Should raise when neither enriched_columns nor intent provided."""
         import click
 
-        with pytest.raises(click.UsageError, match="--enriched-columns OR --intent"):
+        with pytest.raises(click.UsageError, match=_MATCH_OUTPUT_SPEC):
             validate_enrich_args("csv", "input.csv", "output.csv", "[]", None, None)
 
     def test_all_none_does_not_raise(self):
@@ -1087,34 +1096,48 @@ class TestValidateEnrichArgs:
         validate_enrich_args(None, None, None, None, None, None)
 
 
+EXPECTED_SEARCH_OUTPUT = {
+    "search_id": "search_123",
+    "session_id": None,
+    "status": "ok",
+    "results": [
+        {
+            "url": "https://example.com",
+            "title": "Example",
+            "publish_date": "2024-01-01",
+            "excerpts": ["An excerpt"],
+        }
+    ],
+    "usage": [],
+    "warnings": [],
+}
+
+
 class TestSearchCommandMocked:
     """Tests for the search command with mocked Parallel SDK."""
 
     def test_search_successful_json_output(self, runner, mock_cli_client):
         """Should output JSON for successful search."""
-        mock_search_result = mock.MagicMock()
-        mock_search_result.search_id = "search_123"
-        mock_search_result.results = [
-            mock.MagicMock(
-                url="https://example.com",
-                title="Example",
-                publish_date="2024-01-01",
-                excerpts=["An excerpt"],
-            )
-        ]
-        mock_search_result.session_id = None
-        mock_search_result.usage = None
-        mock_search_result.warnings = []
+        mock_search_result = SimpleNamespace(
+            search_id="search_123",
+            results=[
+                SimpleNamespace(
+                    url="https://example.com",
+                    title="Example",
+                    publish_date="2024-01-01",
+                    excerpts=["An excerpt"],
+                )
+            ],
+            session_id=None,
+            usage=None,
+            warnings=[],
+        )
 
         mock_cli_client.search.return_value = mock_search_result
         result = runner.invoke(main, ["search", "test query", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert output["search_id"] == "search_123"
-        assert output["status"] == "ok"
-        assert len(output["results"]) == 1
-        assert output["results"][0]["url"] == "https://example.com"
+        assert loads(result.output) == EXPECTED_SEARCH_OUTPUT
 
     def test_search_warnings_serialized_in_json_output(self, runner, mock_cli_client):
         """Should serialize SDK Warning objects as dicts in JSON output."""
@@ -1141,7 +1164,7 @@ class TestSearchCommandMocked:
         result = runner.invoke(main, ["search", "test query", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert len(output["warnings"]) == 1
         warning = output["warnings"][0]
         assert warning["type"] == "warning"
@@ -1154,7 +1177,7 @@ class TestSearchCommandMocked:
         result = runner.invoke(main, ["search", "test query", "--json"])
 
         assert result.exit_code == EXIT_API_ERROR
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert output["error"]["message"] == "API unavailable"
         assert output["error"]["type"] == "RuntimeError"
 
@@ -1574,7 +1597,7 @@ class TestV1ResponseFieldsSurfaced:
         result = runner.invoke(main, ["search", "test", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.stdout)
+        output = loads(result.stdout)
         assert output["session_id"] == "sess_xyz"
         assert output["usage"] == [{"name": "search_basic", "count": 1}]
 
@@ -1601,7 +1624,7 @@ class TestV1ResponseFieldsSurfaced:
         result = runner.invoke(main, ["extract", "https://example.com", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.stdout)
+        output = loads(result.stdout)
         assert output["session_id"] == "sess_abc"
         assert output["usage"] == [{"name": "extract", "count": 1}]
 
@@ -1639,7 +1662,7 @@ class TestSearchDeprecationWarnings:
         assert deprecated_mode in result.stderr
         assert expected_new in result.stderr
         # JSON stdout must remain clean
-        json.loads(result.stdout)
+        loads(result.stdout)
         # SDK call uses translated mode
         call_kwargs = mock_cli_client.search.call_args.kwargs
         assert call_kwargs["mode"] == expected_new
@@ -1687,7 +1710,7 @@ class TestExtractDeprecationWarnings:
         assert result.exit_code == 0
         assert "[deprecated]" in result.stderr
         assert "--no-excerpts" in result.stderr
-        output = json.loads(result.stdout)
+        output = loads(result.stdout)
         # Excerpts should be stripped from the CLI output
         assert "excerpts" not in output["results"][0]
 
@@ -1701,10 +1724,28 @@ class TestExtractDeprecationWarnings:
 
         assert result.exit_code == 0
         assert "[deprecated]" not in result.stderr
-        output = json.loads(result.stdout)
+        output = loads(result.stdout)
         assert output["results"][0]["excerpts"] == ["a server-side excerpt"]
 
 
+EXPECTED_EXTRACT_OUTPUT = {
+    "extract_id": "ext_123",
+    "session_id": None,
+    "status": "ok",
+    "results": [
+        {
+            "url": "https://example.com",
+            "title": "Example Page",
+            "publish_date": "2025-01-15",
+            "excerpts": ["Some excerpt"],
+        }
+    ],
+    "errors": [],
+    "usage": [],
+    "warnings": [],
+}
+
+
 class TestExtractCommandMocked:
     """Tests for the extract command with mocked Parallel SDK."""
 
@@ -1714,37 +1755,34 @@ class TestExtractCommandMocked:
         result = runner.invoke(main, ["extract", "https://example.com", "--json"])
 
         assert result.exit_code == EXIT_API_ERROR
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert output["error"]["type"] == "ConnectionError"
         assert "Network error" in output["error"]["message"]
 
     def test_extract_successful_json_output(self, runner, mock_cli_client):
         """Should output structured JSON for successful extraction."""
-        mock_extract_result = mock.MagicMock()
-        mock_extract_result.extract_id = "ext_123"
-        mock_page = mock.MagicMock()
-        mock_page.url = "https://example.com"
-        mock_page.title = "Example Page"
-        mock_page.publish_date = "2025-01-15"
-        mock_page.excerpts = ["Some excerpt"]
-        mock_page.full_content = None
-        mock_extract_result.results = [mock_page]
-        mock_extract_result.errors = []
-        mock_extract_result.session_id = None
-        mock_extract_result.usage = None
-        mock_extract_result.warnings = None
+        mock_extract_result = SimpleNamespace(
+            extract_id="ext_123",
+            results=[
+                SimpleNamespace(
+                    url="https://example.com",
+                    title="Example Page",
+                    publish_date="2025-01-15",
+                    excerpts=["Some excerpt"],
+                    full_content=None,
+                )
+            ],
+            errors=[],
+            session_id=None,
+            usage=None,
+            warnings=None,
+        )
 
         mock_cli_client.extract.return_value = mock_extract_result
         result = runner.invoke(main, ["extract", "https://example.com", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
-        assert output["extract_id"] == "ext_123"
-        assert output["status"] == "ok"
-        assert len(output["results"]) == 1
-        assert output["results"][0]["url"] == "https://example.com"
-        assert output["results"][0]["publish_date"] == "2025-01-15"
-        assert output["warnings"] == []
+        assert loads(result.output) == EXPECTED_EXTRACT_OUTPUT
 
     def test_extract_warnings_serialized_in_json_output(self, runner, mock_cli_client):
         """Should serialize SDK Warning objects as dicts in JSON output."""
@@ -1770,7 +1808,7 @@ class TestExtractCommandMocked:
         result = runner.invoke(main, ["extract", "https://example.com", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert len(output["warnings"]) == 1
         warning = output["warnings"][0]
         assert warning["type"] == "input_validation_warning"
@@ -1796,7 +1834,7 @@ class TestExtractCommandMocked:
         result = runner.invoke(main, ["extract", "https://example.com/broken", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert len(output["errors"]) == 1
         error = output["errors"][0]
         assert error["url"] == "https://example.com/broken"
@@ -1808,20 +1846,18 @@ class TestExtractCommandMocked:
 class TestEnrichDeploySnowflake:
     """Tests for the enrich deploy command Snowflake path."""
 
-    def test_deploy_snowflake_missing_account(self, runner):
-        """Should error without --account for Snowflake."""
-        result = runner.invoke(main, ["enrich", "deploy", "--system", "snowflake", "--user", "testuser"])
-        assert result.exit_code != 0
-        assert "account" in result.output.lower()
-
-    def test_deploy_snowflake_missing_user(self, runner):
-        """Should error without --user for Snowflake."""
-        result = runner.invoke(
-            main,
-            ["enrich", "deploy", "--system", "snowflake", "--account", "abc123.us-east-1"],
-        )
+    @pytest.mark.parametrize(
+        "args,expected",
+        [
+            pytest.param(["--user", "testuser"], "account", id="missing_account"),
+            pytest.param(["--account", "abc123.us-east-1"], "user", id="missing_user"),
+        ],
+    )
+    def test_deploy_snowflake_missing_required(self, runner, args, expected):
+        """Should error when --account or --user is omitted for Snowflake."""
+        result = runner.invoke(main, ["enrich", "deploy", "--system", "snowflake", *args])
         assert result.exit_code != 0
-        assert "user" in result.output.lower()
+        assert expected in result.output.lower()
 
 
 class TestOutputResearchResultJsonPath:
@@ -1853,7 +1889,7 @@ class TestOutputResearchResultJsonPath:
 
         assert json_start is not None
         json_text = "\n".join(lines[json_start:])
-        output = json.loads(json_text)
+        output = loads(json_text)
         assert output["run_id"] == "trun_json"
         assert output["status"] == "completed"
 
@@ -1878,7 +1914,7 @@ class TestOutputResearchResultJsonPath:
 
         # JSON file should have content_file reference instead of content
         json_file = tmp_path / "report.json"
-        data = json.loads(json_file.read_text())
+        data = loads(json_file.read_bytes())
         assert "content" not in data["output"]
         assert data["output"]["content_file"] == "report.md"
 
@@ -1925,7 +1961,7 @@ class TestExitCodes:
                 break
         assert json_start is not None
         json_text = "\n".join(lines[json_start:])
-        output = json.loads(json_text)
+        output = loads(json_text)
         assert output["error"]["type"] == "TimeoutError"
 
     def test_login_failure_exit_code(self, runner):
@@ -1937,6 +1973,32 @@ class TestExitCodes:
         assert result.exit_code == EXIT_AUTH_ERROR
 
 
+@cache
+def _help_output(argv: tuple[str, ...]) -> tuple[int, str]:
+    """Invoke ``<argv> --help`` once and cache the exit code and output."""
+    result = CliRunner().invoke(main, [*argv, "--help"])
+    return result.exit_code, result.output
+
+
+class TestEnrichSubcommandHelp:
+    """Tests for enrich subcommand help text."""
+
+    @pytest.mark.parametrize(
+        "argv,expected",
+        [
+            (("enrich", "run"), ["--no-wait", "json"]),
+            (("enrich", "status"), ["TASKGROUP_ID", "--json"]),
+            (("enrich", "poll"), ["TASKGROUP_ID", "--timeout", "--poll-interval", "--json", "--output"]),
+        ],
+    )
+    def test_enrich_subcommand_help(self, argv, expected):
+        """Help for each enrich subcommand should list its arguments and options."""
+        exit_code, output = _help_output(argv)
+        assert exit_code == 0
+        for text in expected:
+            assert text in output
+
+
 class TestEnrichNoWait:
     """Tests for enrich run --no-wait."""
 
@@ -1975,23 +2037,10 @@ class TestEnrichNoWait:
         mock_run.assert_called_once()
         assert mock_run.call_args.kwargs["no_wait"] is True
 
-    def test_enrich_run_help_shows_no_wait(self, runner):
-        """Should show --no-wait in help."""
-        result = runner.invoke(main, ["enrich", "run", "--help"])
-        assert result.exit_code == 0
-        assert "--no-wait" in result.output
-
 
 class TestEnrichStatusCommand:
     """Tests for the enrich status command."""
 
-    def test_enrich_status_help(self, runner):
-        """Should show enrich status help."""
-        result = runner.invoke(main, ["enrich", "status", "--help"])
-        assert result.exit_code == 0
-        assert "TASKGROUP_ID" in result.output
-        assert "--json" in result.output
-
     def test_enrich_status_shows_formatted_output(self, runner):
         """Should show formatted status info."""
         with mock.patch("parallel_web_tools.cli.commands.get_task_group_status") as mock_status:
@@ -2025,7 +2074,7 @@ class TestEnrichStatusCommand:
             result = runner.invoke(main, ["enrich", "status", "tgrp_json", "--json"])
 
         assert result.exit_code == 0
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert output["taskgroup_id"] == "tgrp_json"
         assert output["num_runs"] == 2
 
@@ -2049,16 +2098,6 @@ class TestEnrichStatusCommand:
 class TestEnrichPollCommand:
     """Tests for the enrich poll command."""
 
-    def test_enrich_poll_help(self, runner):
-        """Should show enrich poll help."""
-        result = runner.invoke(main, ["enrich", "poll", "--help"])
-        assert result.exit_code == 0
-        assert "TASKGROUP_ID" in result.output
-        assert "--timeout" in result.output
-        assert "--poll-interval" in result.output
-        assert "--json" in result.output
-        assert "--output" in result.output
-
     def test_enrich_poll_waits_and_outputs_summary(self, runner):
         """Should wait for completion and show summary."""
         with mock.patch("parallel_web_tools.cli.commands.poll_task_group") as mock_poll:
@@ -2092,7 +2131,7 @@ class TestEnrichPollCommand:
                 break
         assert json_start is not None
         json_text = "\n".join(lines[json_start:])
-        output = json.loads(json_text)
+        output = loads(json_text)
         assert len(output) == 1
         assert output[0]["output"]["ceo"] == "CEO A"
 
@@ -2109,7 +2148,7 @@ class TestEnrichPollCommand:
 
         assert result.exit_code == 0
         assert output_file.exists()
-        data = json.loads(output_file.read_text())
+        data = loads(output_file.read_bytes())
         assert len(data) == 1
         assert data[0]["output"]["ceo"] == "CEO A"
 
@@ -2139,20 +2178,14 @@ class TestEnrichPollCommand:
                 break
         assert json_start is not None
         json_text = "\n".join(lines[json_start:])
-        output = json.loads(json_text)
+        output = loads(json_text)
         assert output["error"]["type"] == "TimeoutError"
 
 
 class TestEnrichRunJsonSourceType:
     """Tests for enrich run with --source-type json."""
 
-    def test_enrich_run_accepts_json_source_type(self, runner):
-        """CLI should accept --source-type json."""
-        result = runner.invoke(main, ["enrich", "run", "--help"])
-        assert result.exit_code == 0
-        assert "json" in result.output
-
-    def test_enrich_run_json_source_type_valid(self, runner):
+    def test_enrich_run_json_source_type_valid(self, runner, source_columns_json, enriched_columns_json):
         """Should accept json as a valid source type option."""
         with mock.patch("parallel_web_tools.cli.commands.run_enrichment_from_dict") as mock_run:
             mock_run.return_value = None
@@ -2169,9 +2202,9 @@ class TestEnrichRunJsonSourceType:
                     "--target",
                     "output.json",
                     "--source-columns",
-                    '[{"name": "company", "description": "Company name"}]',
+                    source_columns_json,
                     "--enriched-columns",
-                    '[{"name": "ceo", "description": "CEO name"}]',
+                    enriched_columns_json,
                 ],
             )
 
@@ -2180,7 +2213,7 @@ class TestEnrichRunJsonSourceType:
         config = mock_run.call_args[0][0]
         assert config["source_type"] == "json"
 
-    def test_enrich_plan_accepts_json_source_type(self, runner, tmp_path):
+    def test_enrich_plan_accepts_json_source_type(self, runner, tmp_path, source_columns_json, enriched_columns_json):
         """enrich plan should accept json as a valid source type."""
         output_file = tmp_path / "config.yaml"
 
@@ -2198,9 +2231,9 @@ class TestEnrichRunJsonSourceType:
                 "--target",
                 "output.json",
                 "--source-columns",
-                '[{"name": "company", "description": "Company name"}]',
+                source_columns_json,
                 "--enriched-columns",
-                '[{"name": "ceo", "description": "CEO name"}]',
+                enriched_columns_json,
             ],
         )
 
@@ -2229,7 +2262,7 @@ class TestCleanJsonOutput:
 
         assert result.exit_code == 0
         # The entire output should be valid JSON - no Rich console messages before it
-        output = json.loads(result.output.strip())
+        output = loads(result.output.strip())
         assert isinstance(output, list)
         assert len(output) == 1
         assert output[0]["output"]["ceo"] == "CEO A"
@@ -2251,7 +2284,7 @@ class TestCleanJsonOutput:
 
         assert result.exit_code == 0
         # The entire output should be valid JSON
-        output = json.loads(result.output.strip())
+        output = loads(result.output.strip())
         assert output["run_id"] == "trun_clean"
         assert output["status"] == "completed"
 
@@ -2269,7 +2302,7 @@ class TestCleanJsonOutput:
             )
 
         assert result.exit_code == 0
-        output = json.loads(result.output.strip())
+        output = loads(result.output.strip())
         assert output["run_id"] == "trun_nowait"
 
     def test_research_poll_json_clean_output(self, runner, tmp_path, monkeypatch):
@@ -2288,7 +2321,7 @@ class TestCleanJsonOutput:
             )
 
         assert result.exit_code == 0
-        output = json.loads(result.output.strip())
+        output = loads(result.output.strip())
         assert output["run_id"] == "trun_poll_clean"
         assert output["status"] == "completed"
 
@@ -2333,7 +2366,7 @@ class TestEnrichRunJsonOutput:
             )
 
         assert result.exit_code == 0
-        output = json.loads(result.output.strip())
+        output = loads(result.output.strip())
         assert output["taskgroup_id"] == "tgrp_json_nowait"
         assert output["num_runs"] == 3
 
@@ -2371,7 +2404,7 @@ class TestEnrichRunJsonOutput:
 
         assert result.exit_code == 0
         assert output_file.exists()
-        data = json.loads(output_file.read_text())
+        data = loads(output_file.read_bytes())
         assert data["taskgroup_id"] == "tgrp_file_nowait"
 
     def test_enrich_run_wait_json_reads_target_csv(self, runner, tmp_path):
@@ -2403,7 +2436,7 @@ class TestEnrichRunJsonOutput:
             )
 
         assert result.exit_code == 0
-        output = json.loads(result.output.strip())
+        output = loads(result.output.strip())
         assert isinstance(output, list)
         assert len(output) == 2
         assert output[0]["company"] == "Google"
@@ -2440,7 +2473,7 @@ class TestEnrichRunJsonOutput:
 
         assert result.exit_code == 0
         assert output_file.exists()
-        data = json.loads(output_file.read_text())
+        data = loads(output_file.read_bytes())
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["company"] == "Google"
@@ -2471,7 +2504,7 @@ class TestSkillsCommands:
             result = runner.invoke(main, ["skills", "list", "--json"])
 
         assert result.exit_code == 0
-        payload = json.loads(result.output)
+        payload = loads(result.output)
         assert payload == {
             "ref": "main",
             "skills": ["parallel-web-extract", "parallel-web-search"],
@@ -2496,7 +2529,7 @@ class TestSkillsCommands:
             result = runner.invoke(main, ["skills", "install", "--json"])
 
         assert result.exit_code == 0
-        payload = json.loads(result.output)
+        payload = loads(result.output)
         assert payload["count"] == 1
         mock_dir.assert_called_once_with(project=False)
         mock_install.assert_called_once()
@@ -2531,7 +2564,7 @@ class TestSkillsCommands:
             result = runner.invoke(main, ["skills", "install", "--project", "--json"])
 
         assert result.exit_code == EXIT_BAD_INPUT
-        payload = json.loads(result.output)
+        payload = loads(result.output)
         assert payload["error"]["message"] == "no project root"
 
     def test_skills_install_invalid_skill_is_bad_input(self, runner):
@@ -2547,7 +2580,7 @@ class TestSkillsCommands:
             result = runner.invoke(main, ["skills", "install", "--skill", "does-not-exist", "--json"])
 
         assert result.exit_code == EXIT_BAD_INPUT
-        payload = json.loads(result.output)
+        payload = loads(result.output)
         assert payload["error"]["message"] == "unknown skill"
 
     def test_skills_uninstall_json(self, runner):
@@ -2565,7 +2598,7 @@ class TestSkillsCommands:
             result = runner.invoke(main, ["skills", "uninstall", "--json"])
 
         assert result.exit_code == 0
-        payload = json.loads(result.output)
+        payload = loads(result.output)
         assert payload["removed_skills"] == ["parallel-web-search"]
 
     def test_skills_reinstall_json(self, runner):
@@ -2586,7 +2619,7 @@ class TestSkillsCommands:
             result = runner.invoke(main, ["skills", "reinstall", "--json"])
 
         assert result.exit_code == 0
-        payload = json.loads(result.output)
+        payload = loads(result.output)
         assert payload["installed_skills"] == ["parallel-web-extract"]
 
 
@@ -2701,7 +2734,7 @@ class TestLoginCommand:
 
         assert result.exit_code == 0
         lines = [line for line in result.output.strip().splitlines() if line.strip()]
-        events = [json.loads(line) for line in lines]
+        events = [loads(line) for line in lines]
         assert events[0]["event"] == "auth_start"
         assert events[1]["event"] == "device_code"
         assert events[1]["user_code"] == "ABCD-1234"
@@ -2714,7 +2747,7 @@ class TestLoginCommand:
 
         assert result.exit_code == EXIT_AUTH_ERROR
         lines = [line for line in result.output.strip().splitlines() if line.strip()]
-        events = [json.loads(line) for line in lines]
+        events = [loads(line) for line in lines]
         assert events[0]["event"] == "auth_start"
         assert events[1]["event"] == "auth_error"
         assert "auth failed" in events[1]["error"]["message"]
@@ -2772,7 +2805,7 @@ class TestBalanceGetCommand:
 
         assert result.exit_code == 0
         mock_get.assert_called_once_with("atk")
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert output["org_id"] == "org_abc"
         assert output["credit_balance_cents"] == 1234
         assert output["pending_debit_balance_cents"] == 56
@@ -2846,7 +2879,7 @@ class TestBalanceAddCommand:
         assert result.exit_code == 0
         # five_min_bucket = floor(1_700_000_123 / 300) * 300 = 1_700_000_100
         assert captured_key["key"] == "cid_xyz-100-1700000100"
-        output = json.loads(result.output)
+        output = loads(result.output)
         assert output["credit_balance_cents"] == 1600
 
     def test_console_output_shows_charge_and_new_balance(self, runner):
@@ -1,9 +1,11 @@
 """Tests for the DuckDB integration module."""
 
 import json
+from typing import Any, cast
 from unittest import mock
 
 import duckdb
+import pyarrow as pa
 import pytest
 
 from parallel_web_tools.integrations.duckdb import (
@@ -15,14 +17,52 @@ from parallel_web_tools.integrations.duckdb import (
 )
 
 
-@pytest.fixture
-def conn():
-    """Create a fresh DuckDB connection for each test."""
+@pytest.fixture(scope="module")
+def _module_conn():
+    """Open one DuckDB connection shared by every test in this module."""
     connection = duckdb.connect()
     yield connection
     connection.close()
 
 
+@pytest.fixture
+def conn(_module_conn):
+    """Yield the shared DuckDB connection and reset its catalog after each test."""
+    yield _module_conn
+    for (name,) in _module_conn.execute("SELECT view_name FROM duckdb_views() WHERE NOT internal").fetchall():
+        _module_conn.unregister(name)
+    tables = _module_conn.execute("SELECT database_name, table_name FROM duckdb_tables()").fetchall()
+    for database, name in tables:
+        quoted = ".".join('"' + part.replace('"', '""') + '"' for part in (database, name))
+        _module_conn.execute(f"DROP TABLE {quoted}")
+    unregister_parallel_functions(_module_conn)
+
+
+def _seed(conn, name, columns):
+    """Expose a pyarrow table built from ``columns`` as ``name`` without SQL inserts."""
+    conn.register(name, pa.table(columns))
+
+
+@pytest.fixture
+def google_table(conn):
+    """Expose a one-row ``companies`` table holding the name 'Google'."""
+    _seed(conn, "companies", {"name": ["Google"]})
+
+
+@pytest.fixture(scope="module")
+def _patched_enrich_batch():
+    """Patch enrich_batch once for the whole module."""
+    with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as patched:
+        yield patched
+
+
+@pytest.fixture
+def mock_batch(_patched_enrich_batch):
+    """Yield the module-wide enrich_batch mock, reset for this test."""
+    _patched_enrich_batch.reset_mock(return_value=True, side_effect=True)
+    return _patched_enrich_batch
+
+
 class TestEnrichmentResult:
     """Tests for EnrichmentResult dataclass."""
 
@@ -56,319 +96,506 @@ class TestEnrichmentResult:
         assert result.errors == errors
         assert result.elapsed_time == 1.5
 
+    def test_to_arrow(self, conn):
+        """Should materialize the relation as a pyarrow Table."""
+        rel = conn.sql("SELECT * FROM (VALUES ('Google'), ('Microsoft')) AS t(name)")
+        result = EnrichmentResult(result=rel, success_count=2, error_count=0)
+
+        table = result.to_arrow()
+
+        assert table.column_names == ["name"]
+        assert table.column("name").to_pylist() == ["Google", "Microsoft"]
+
+    def test_to_pandas(self, conn):
+        """Should materialize the relation as a pandas DataFrame."""
+        rel = conn.sql("SELECT * FROM (VALUES ('Google'), ('Microsoft')) AS t(name)")
+        result = EnrichmentResult(result=rel, success_count=2, error_count=0)
+
+        df = result.to_pandas()
+
+        assert df["name"].tolist() == ["Google", "Microsoft"]
+
+    def test_to_polars(self, conn):
+        """Should materialize the relation as a Polars DataFrame."""
+        rel = conn.sql("SELECT * FROM (VALUES ('Google'), ('Microsoft')) AS t(name)")
+        result = EnrichmentResult(result=rel, success_count=2, error_count=0)
+
+        df = result.to_polars()
+
+        assert df["name"].to_list() == ["Google", "Microsoft"]
+
+    def test_errors_table(self, conn):
+        """Should expose errors as a columnar (row, error) Arrow table."""
+        result = EnrichmentResult(
+            result=conn.sql("SELECT 1"),
+            success_count=1,
+            error_count=2,
+            errors=[{"row": 1, "error": "not found"}, {"row": 3, "error": "timeout"}],
+        )
+
+        table = result.errors_table()
+
+        assert table.schema == pa.schema([("row", pa.int64()), ("error", pa.string())])
+        assert table.column("row").to_pylist() == [1, 3]
+        assert table.column("error").to_pylist() == ["not found", "timeout"]
+
+    def test_errors_table_empty(self, conn):
+        """Should return an empty table with the same schema when there are no errors."""
+        result = EnrichmentResult(result=conn.sql("SELECT 1"), success_count=1, error_count=0)
+
+        table = result.errors_table()
+
+        assert table.num_rows == 0
+        assert table.column_names == ["row", "error"]
+
 
 class TestEnrichTable:
     """Tests for enrich_table function."""
 
-    def test_empty_table(self, conn):
+    def test_empty_table(self, conn, mock_batch):
         """Should handle empty table."""
         conn.execute("CREATE TABLE empty_companies (name VARCHAR)")
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = []
+        mock_batch.return_value = []
 
-            result = enrich_table(
-                conn,
-                source_table="empty_companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-            )
+        result = enrich_table(
+            conn,
+            source_table="empty_companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
+        mock_batch.assert_not_called()
         assert result.success_count == 0
         assert result.error_count == 0
+        assert result.result.columns == ["name", "ceo_name"]
 
-    def test_successful_enrichment(self, conn):
+    def test_successful_enrichment(self, conn, mock_batch):
         """Should enrich table successfully."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Google', 'google.com'),
-                ('Microsoft', 'microsoft.com')
-            ) AS t(name, website)
-        """)
-
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {"ceo_name": "Sundar Pichai", "founding_year": "1998"},
-                {"ceo_name": "Satya Nadella", "founding_year": "1975"},
-            ]
-
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name", "website": "website"},
-                output_columns=["CEO name", "Founding year"],
-                api_key="test-key",
-            )
+        _seed(conn, "companies", {"name": ["Google", "Microsoft"], "website": ["google.com", "microsoft.com"]})
+
+        mock_batch.return_value = [
+            {"ceo_name": "Sundar Pichai", "founding_year": "1998"},
+            {"ceo_name": "Satya Nadella", "founding_year": "1975"},
+        ]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name", "website": "website"},
+            output_columns=["CEO name", "Founding year"],
+            api_key="test-key",
+        )
 
         assert result.success_count == 2
         assert result.error_count == 0
 
-        df = result.result.fetchdf()
-        assert "ceo_name" in df.columns
-        assert "founding_year" in df.columns
-        assert df["ceo_name"].tolist() == ["Sundar Pichai", "Satya Nadella"]
+        table = result.to_arrow()
+        assert "ceo_name" in table.column_names
+        assert "founding_year" in table.column_names
+        assert table.column("ceo_name").to_pylist() == ["Sundar Pichai", "Satya Nadella"]
 
-    def test_preserves_original_columns(self, conn):
+    def test_preserves_original_columns(self, conn, mock_batch):
         """Should preserve original table columns."""
         conn.execute("""
             CREATE TABLE companies AS SELECT 'Google' as name, 'Tech' as industry
         """)
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+        mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
 
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-            )
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
-        df = result.result.fetchdf()
-        assert "name" in df.columns
-        assert df["name"].iloc[0] == "Google"
+        table = result.to_arrow()
+        assert "name" in table.column_names
+        assert table.column("name")[0].as_py() == "Google"
 
-    def test_error_handling(self, conn):
+    def test_error_handling(self, conn, mock_batch):
         """Should handle errors in individual rows."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Google'),
-                ('InvalidCompany')
-            ) AS t(name)
-        """)
-
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {"ceo_name": "Sundar Pichai"},
-                {"error": "Company not found"},
-            ]
-
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-            )
+        _seed(conn, "companies", {"name": ["Google", "InvalidCompany"]})
+
+        mock_batch.return_value = [
+            {"ceo_name": "Sundar Pichai"},
+            {"error": "Company not found"},
+        ]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
         assert result.success_count == 1
         assert result.error_count == 1
         assert len(result.errors) == 1
         assert result.errors[0]["row"] == 1
 
-        df = result.result.fetchdf()
-        assert df["ceo_name"].iloc[0] == "Sundar Pichai"
-        assert df["ceo_name"].iloc[1] is None
+        table = result.to_arrow()
+        assert table.column("ceo_name")[0].as_py() == "Sundar Pichai"
+        assert table.column("ceo_name")[1].as_py() is None
 
-    def test_include_basis(self, conn):
+    def test_include_basis(self, conn, mock_batch, google_table):
         """Should include basis when include_basis=True."""
-        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+        mock_batch.return_value = [
+            {
+                "ceo_name": "Sundar Pichai",
+                "basis": [{"field": "ceo_name", "reasoning": "test"}],
+            }
+        ]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            include_basis=True,
+        )
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {
-                    "ceo_name": "Sundar Pichai",
-                    "basis": [{"field": "ceo_name", "reasoning": "test"}],
-                }
-            ]
+        table = result.to_arrow()
+        assert "_basis" in table.column_names
 
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-                include_basis=True,
-            )
+    def test_no_basis_when_disabled(self, conn, mock_batch, google_table):
+        """Should not include basis when include_basis=False."""
+        mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            include_basis=False,
+        )
 
-        df = result.result.fetchdf()
-        assert "_basis" in df.columns
+        table = result.to_arrow()
+        assert "_basis" not in table.column_names
+
+    @pytest.mark.parametrize(
+        ("kwarg", "value"),
+        [
+            ("api_key", "my-secret-key"),
+            ("processor", "pro-fast"),
+            ("timeout", 1200),
+        ],
+    )
+    def test_passes_kwarg(self, conn, mock_batch, kwarg, value, google_table):
+        """Should pass api_key, processor and timeout through to enrich_batch."""
+        mock_batch.return_value = [{"ceo_name": "Test"}]
+
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            **{kwarg: value},
+        )
 
-    def test_no_basis_when_disabled(self, conn):
-        """Should not include basis when include_basis=False."""
-        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+        assert mock_batch.call_args.kwargs[kwarg] == value
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+    def test_default_parameters(self, conn, mock_batch, google_table):
+        """Should use default parameters when not specified."""
+        mock_batch.return_value = [{"ceo_name": "Test"}]
 
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-                include_basis=False,
-            )
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
-        df = result.result.fetchdf()
-        assert "_basis" not in df.columns
+        call_kwargs = mock_batch.call_args.kwargs
+        assert call_kwargs["processor"] == "lite-fast"
+        assert call_kwargs["timeout"] == 600
+        assert call_kwargs["include_basis"] is False
 
-    def test_passes_api_key(self, conn):
-        """Should pass api_key to enrich_batch."""
-        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+    def test_sql_query_as_source(self, conn, mock_batch):
+        """Should handle SQL query as source_table."""
+        _seed(conn, "companies", {"name": ["Google", "Inactive"], "active": [True, False]})
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Test"}]
+        mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
 
-            enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-                api_key="my-secret-key",
-            )
+        result = enrich_table(
+            conn,
+            source_table="SELECT name FROM companies WHERE active = true",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
-        assert mock_batch.call_args.kwargs["api_key"] == "my-secret-key"
+        # Should only process one row (Google)
+        assert result.success_count == 1
 
-    def test_passes_processor(self, conn):
-        """Should pass processor to enrich_batch."""
-        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+    def test_batch_size_streams_chunks(self, conn, mock_batch):
+        """Should enrich the source in batch_size chunks and keep global row numbers."""
+        conn.execute("CREATE TABLE companies AS SELECT 'Company ' || range AS name FROM range(5)")
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Test"}]
+        def fake_enrich_batch(inputs, **kwargs):
+            return [
+                {"error": "not found"} if row["company_name"] == "Company 3" else {"ceo_name": "CEO"} for row in inputs
+            ]
 
-            enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-                processor="pro-fast",
-            )
+        mock_batch.side_effect = fake_enrich_batch
+        progress = []
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            batch_size=2,
+            progress_callback=lambda done, total: progress.append((done, total)),
+        )
 
-        assert mock_batch.call_args.kwargs["processor"] == "pro-fast"
+        assert [len(c.kwargs["inputs"]) for c in mock_batch.call_args_list] == [2, 2, 1]
+        assert result.success_count == 4
+        assert result.errors == [{"row": 3, "error": "not found"}]
+        assert progress[-1] == (5, 5)
+        assert result.result.fetchall() == [
+            ("Company 0", "CEO"),
+            ("Company 1", "CEO"),
+            ("Company 2", "CEO"),
+            ("Company 3", None),
+            ("Company 4", "CEO"),
+        ]
+
+    def test_enrich_fn_injection(self, conn, google_table):
+        """Should call an injected enrich_fn instead of enrich_batch."""
+        calls = []
+
+        def fake_enrich(inputs, **kwargs):
+            calls.append((inputs, kwargs))
+            return [{"ceo_name": "Sundar Pichai"} for _ in inputs]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            api_key="test-key",
+            enrich_fn=fake_enrich,
+        )
 
-    def test_passes_timeout(self, conn):
-        """Should pass timeout to enrich_batch."""
-        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+        assert calls[0][0] == [{"company_name": "Google"}]
+        assert calls[0][1]["api_key"] == "test-key"
+        assert result.result.fetchall() == [("Google", "Sundar Pichai")]
+
+    def test_batch_progress_granularity(self, conn, mock_batch):
+        """Should report progress once per chunk with progress_granularity="batch"."""
+        conn.execute("CREATE TABLE companies AS SELECT 'Company ' || range AS name FROM range(5)")
+        mock_batch.side_effect = lambda inputs, **kwargs: [{"ceo_name": "CEO"} for _ in inputs]
+
+        progress = []
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            batch_size=2,
+            progress_callback=lambda done, total: progress.append((done, total)),
+            progress_granularity="batch",
+        )
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Test"}]
+        assert progress == [(2, 5), (4, 5), (5, 5)]
 
+    def test_invalid_progress_granularity(self, conn, google_table):
+        """Should reject unknown progress granularities."""
+        with pytest.raises(ValueError, match="progress_granularity"):
             enrich_table(
                 conn,
                 source_table="companies",
                 input_columns={"company_name": "name"},
                 output_columns=["CEO name"],
-                timeout=1200,
+                progress_granularity=cast(Any, "chunk"),
             )
 
-        assert mock_batch.call_args.kwargs["timeout"] == 1200
-
-    def test_default_parameters(self, conn):
-        """Should use default parameters when not specified."""
-        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
-
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Test"}]
-
+    @pytest.mark.parametrize("batch_size", [0, -1])
+    def test_invalid_batch_size(self, conn, google_table, batch_size):
+        """Should reject a batch_size below 1 instead of treating it as unbatched or empty."""
+        with pytest.raises(ValueError, match="batch_size"):
             enrich_table(
                 conn,
                 source_table="companies",
                 input_columns={"company_name": "name"},
                 output_columns=["CEO name"],
+                batch_size=batch_size,
             )
 
-        call_kwargs = mock_batch.call_args.kwargs
-        assert call_kwargs["processor"] == "lite-fast"
-        assert call_kwargs["timeout"] == 600
-        assert call_kwargs["include_basis"] is False
+    def test_batch_size_empty_source(self, conn, mock_batch):
+        """Should return an empty enriched relation when streaming an empty source."""
+        conn.execute("CREATE TABLE companies (name VARCHAR)")
 
-    def test_sql_query_as_source(self, conn):
-        """Should handle SQL query as source_table."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Google', true),
-                ('Inactive', false)
-            ) AS t(name, active)
-        """)
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            batch_size=2,
+        )
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+        mock_batch.assert_not_called()
+        assert result.result.columns == ["name", "ceo_name"]
+        assert result.result.fetchall() == []
 
-            result = enrich_table(
-                conn,
-                source_table="SELECT name FROM companies WHERE active = true",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-            )
-
-        # Should only process one row (Google)
-        assert result.success_count == 1
+    def test_empty_sql_query_as_source(self, conn, mock_batch):
+        """Should return an empty result with the enriched schema for an empty query."""
+        conn.execute("CREATE TABLE companies AS SELECT 'Google' AS name, false AS active")
 
-    def test_handles_null_values(self, conn):
-        """Should handle NULL values in input columns."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Google'),
-                (NULL)
-            ) AS t(name)
-        """)
+        result = enrich_table(
+            conn,
+            source_table="SELECT name FROM companies WHERE active = true",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {"ceo_name": "Sundar Pichai"},
-                {"ceo_name": "Unknown"},
-            ]
+        mock_batch.assert_not_called()
+        assert result.success_count == 0
+        assert result.result.columns == ["name", "ceo_name"]
+        assert result.result.fetchall() == []
 
-            enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-            )
+    def test_handles_null_values(self, conn, mock_batch):
+        """Should handle NULL values in input columns."""
+        _seed(conn, "companies", {"name": ["Google", None]})
+
+        mock_batch.return_value = [
+            {"ceo_name": "Sundar Pichai"},
+            {"ceo_name": "Unknown"},
+        ]
+
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
         # Check that NULL values were filtered from inputs
         inputs = mock_batch.call_args.kwargs["inputs"]
         assert inputs[0] == {"company_name": "Google"}
         assert inputs[1] == {}  # NULL value should result in empty dict
 
-    def test_progress_callback(self, conn):
+    def test_handles_null_values_in_one_of_several_columns(self, conn, mock_batch):
+        """Should only drop the NULL cells, keeping other columns of the same row."""
+        _seed(conn, "companies", {"name": ["Google", "Acme"], "website": ["google.com", None]})
+
+        mock_batch.return_value = [{"ceo_name": "A"}, {"ceo_name": "B"}]
+
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name", "website": "website"},
+            output_columns=["CEO name"],
+        )
+
+        inputs = mock_batch.call_args.kwargs["inputs"]
+        assert inputs == [{"company_name": "Google", "website": "google.com"}, {"company_name": "Acme"}]
+
+    def test_progress_callback(self, conn, mock_batch):
         """Should call progress callback."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Google'),
-                ('Microsoft')
-            ) AS t(name)
-        """)
+        _seed(conn, "companies", {"name": ["Google", "Microsoft"]})
 
         progress_calls = []
 
         def on_progress(completed, total):
             progress_calls.append((completed, total))
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {"ceo_name": "Sundar Pichai"},
-                {"ceo_name": "Satya Nadella"},
-            ]
-
-            enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-                progress_callback=on_progress,
-            )
+        mock_batch.return_value = [
+            {"ceo_name": "Sundar Pichai"},
+            {"ceo_name": "Satya Nadella"},
+        ]
+
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            progress_callback=on_progress,
+        )
 
         assert len(progress_calls) == 2
         assert progress_calls[0] == (1, 2)
         assert progress_calls[1] == (2, 2)
 
-    def test_creates_result_table(self, conn):
+    def test_creates_result_table(self, conn, mock_batch):
         """Should create permanent result table when specified."""
+        # A real table rather than google_table, so no view is in the catalog
         conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
 
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+        mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
 
-            enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-                result_table="enriched_companies",
-            )
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            result_table="enriched_companies",
+        )
 
         # Should be able to query the result table
-        df = conn.execute("SELECT * FROM enriched_companies").fetchdf()
-        assert df["ceo_name"].iloc[0] == "Sundar Pichai"
+        table = pa.table(conn.sql("SELECT * FROM enriched_companies"))
+        assert table.column("ceo_name")[0].as_py() == "Sundar Pichai"
+
+        # No intermediate view should be left in the catalog
+        assert conn.execute("SELECT view_name FROM duckdb_views() WHERE NOT internal").fetchall() == []
+
+    def test_result_table_name_with_quote(self, conn, mock_batch):
+        """Should create a result table whose name contains a double quote."""
+        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+        mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            result_table='my "enriched" companies',
+        )
+
+        assert result.result.fetchall() == [("Google", "Sundar Pichai")]
+        assert conn.sql('SELECT ceo_name FROM "my ""enriched"" companies"').fetchall() == [("Sundar Pichai",)]
+
+    def test_result_table_leaves_user_views_alone(self, conn, mock_batch):
+        """Should neither read from nor drop a user's view named like the internal one."""
+        conn.execute("CREATE TABLE companies AS SELECT 'Google' as name")
+        conn.execute("CREATE TEMP VIEW _parallel_enriched AS SELECT 'mine' AS name, 'user' AS ceo_name")
+        mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+
+        enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+            result_table="enriched_companies",
+        )
+
+        assert conn.sql("SELECT * FROM enriched_companies").fetchall() == [("Google", "Sundar Pichai")]
+        assert conn.sql("SELECT * FROM _parallel_enriched").fetchall() == [("mine", "user")]
+        conn.execute("DROP VIEW _parallel_enriched")
+
+
+class TestCombineSmallChunks:
+    """Tests for the _combine_small_chunks helper."""
+
+    def test_combines_heavily_chunked_table(self):
+        """Should merge tables with many small batches into one chunk per column."""
+        from parallel_web_tools.integrations.duckdb.batch import _combine_small_chunks
+
+        table = pa.concat_tables([pa.table({"name": [f"row_{i}"]}) for i in range(10)])
+        assert table.column("name").num_chunks == 10
+
+        combined = _combine_small_chunks(table)
+
+        assert combined.column("name").num_chunks == 1
+        assert combined.equals(table)
+
+    def test_leaves_lightly_chunked_table_alone(self):
+        """Should return the table unchanged when it has few chunks."""
+        from parallel_web_tools.integrations.duckdb.batch import _combine_small_chunks
+
+        table = pa.concat_tables([pa.table({"name": ["a"]}), pa.table({"name": ["b"]})])
+
+        assert _combine_small_chunks(table) is table
 
 
 class TestEnrichAllAsync:
@@ -414,6 +641,28 @@ class TestEnrichAllAsync:
         assert json.loads(results[1])["ceo_name"] == "CEO of Microsoft"
         assert json.loads(results[2])["ceo_name"] == "CEO of Apple"
 
+    def test_closes_client_after_chunk(self):
+        """Should close the AsyncParallel client once the chunk is enriched."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from parallel_web_tools.integrations.duckdb.udf import _enrich_all_async
+
+        async def mock_create(input, task_spec, processor):
+            return SimpleNamespace(run_id="run_1")
+
+        async def mock_result(run_id, api_timeout):
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": "CEO"}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            asyncio.run(_enrich_all_async([{"company": "Google"}], ["CEO name"], "test-key"))
+
+        mock_client.__aexit__.assert_awaited_once()
+
     def test_error_handling_per_item(self):
         """Should handle errors for individual items without failing others."""
         import asyncio
@@ -488,6 +737,87 @@ class TestEnrichAllAsync:
         result = json.loads(results[0])
         assert result["result"] == "plain text response"
 
+    def test_deduplicates_identical_inputs(self):
+        """Should dispatch each distinct input once and fan results back out."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from parallel_web_tools.integrations.duckdb.udf import _enrich_all_async
+
+        created = []
+
+        async def mock_create(input, task_spec, processor):
+            created.append(input)
+            return SimpleNamespace(run_id=f"run_{input['company']}")
+
+        async def mock_result(run_id, api_timeout):
+            company = run_id.replace("run_", "")
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": f"CEO of {company}"}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            results = asyncio.run(
+                _enrich_all_async(
+                    items=[
+                        {"company": "SpaceX", "ceo": "x"},
+                        {"company": "Tesla"},
+                        {"ceo": "x", "company": "SpaceX"},
+                    ],
+                    output_columns=["CEO name"],
+                    api_key="test-key",
+                )
+            )
+
+        assert len(created) == 2
+        assert [json.loads(r)["ceo_name"] for r in results] == [
+            "CEO of SpaceX",
+            "CEO of Tesla",
+            "CEO of SpaceX",
+        ]
+
+    def test_max_concurrency_bounds_in_flight_tasks(self):
+        """Should never have more than max_concurrency task runs in flight."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from parallel_web_tools.integrations.duckdb.udf import _enrich_all_async
+
+        in_flight = 0
+        peak = 0
+
+        async def mock_create(input, task_spec, processor):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            return SimpleNamespace(run_id="run")
+
+        async def mock_result(run_id, api_timeout):
+            nonlocal in_flight
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": "CEO"}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            results = asyncio.run(
+                _enrich_all_async(
+                    items=[{"company": f"Company {i}"} for i in range(20)],
+                    output_columns=["CEO name"],
+                    api_key="test-key",
+                    max_concurrency=3,
+                )
+            )
+
+        assert len(results) == 20
+        assert peak == 3
+
 
 class TestEnrichBatchSync:
     """Tests for the _enrich_batch_sync function."""
@@ -567,10 +897,78 @@ class TestEnrichBatchSync:
         assert "error" in error_result
         assert "array" in error_result["error"]
 
+    def test_reuses_parsed_output_columns_and_task_spec(self):
+        """Should parse each output_columns string and build its task spec only once."""
+        from types import SimpleNamespace
+
+        from parallel_web_tools.core.batch import _build_task_spec
+        from parallel_web_tools.integrations.duckdb.udf import _enrich_batch_sync, _parse_output_columns
+
+        captured_specs = []
+
+        async def mock_create(input, task_spec, processor):
+            captured_specs.append(task_spec)
+            return SimpleNamespace(run_id="run_1")
+
+        async def mock_result(run_id, api_timeout):
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": "Test"}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        _parse_output_columns.cache_clear()
+        _build_task_spec.cache_clear()
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            for _ in range(3):
+                _enrich_batch_sync(
+                    input_jsons=['{"company": "Google"}'],
+                    output_columns_json='["CEO name"]',
+                    api_key="test-key",
+                )
+
+        assert _parse_output_columns.cache_info().misses == 1
+        assert _build_task_spec.cache_info().misses == 1
+        assert all(spec is captured_specs[0] for spec in captured_specs)
+
+    def test_reuses_background_event_loop(self):
+        """Should dispatch every batch on one long-lived background loop."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from parallel_web_tools.integrations.duckdb.udf import _enrich_batch_sync
+
+        loops = []
+
+        async def mock_create(input, task_spec, processor):
+            loops.append(asyncio.get_running_loop())
+            return SimpleNamespace(run_id="run_1")
+
+        async def mock_result(run_id, api_timeout):
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": "Test"}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            for company in ("Google", "Apple"):
+                _enrich_batch_sync(
+                    input_jsons=[json.dumps({"company": company})],
+                    output_columns_json='["CEO name"]',
+                    api_key="test-key",
+                )
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert loops[0].is_running()
+
 
 class TestRegisterParallelFunctions:
     """Tests for register_parallel_functions function."""
 
+    ENRICH_SQL = "SELECT parallel_enrich(?, ?)"
+
     def test_registers_function(self, conn):
         """Should register parallel_enrich function."""
         from types import SimpleNamespace
@@ -589,12 +987,7 @@ class TestRegisterParallelFunctions:
             register_parallel_functions(conn, api_key="test-key")
 
             # Function should be callable
-            result = conn.execute("""
-                SELECT parallel_enrich(
-                    '{"company_name": "Google"}',
-                    '["CEO name"]'
-                )
-            """).fetchone()[0]
+            result = conn.execute(self.ENRICH_SQL, ['{"company_name": "Google"}', '["CEO name"]']).fetchall()[0][0]
 
             data = json.loads(result)
             assert data["ceo_name"] == "Test"
@@ -628,9 +1021,7 @@ class TestRegisterParallelFunctions:
                 timeout=500,
             )
 
-            conn.execute("""
-                SELECT parallel_enrich('{"company": "Google"}', '["CEO name"]')
-            """).fetchone()
+            conn.execute(self.ENRICH_SQL, ['{"company": "Google"}', '["CEO name"]']).fetchall()
 
         assert captured_processor == "pro-fast"
         assert captured_timeout == 500
@@ -639,9 +1030,7 @@ class TestRegisterParallelFunctions:
         """Should return error for invalid JSON input."""
         register_parallel_functions(conn, api_key="test-key")
 
-        result = conn.execute("""
-            SELECT parallel_enrich('invalid json', '["CEO name"]')
-        """).fetchone()[0]
+        result = conn.execute(self.ENRICH_SQL, ["invalid json", '["CEO name"]']).fetchall()[0][0]
 
         data = json.loads(result)
         assert "error" in data
@@ -659,9 +1048,7 @@ class TestRegisterParallelFunctions:
         with mock.patch("parallel.AsyncParallel", return_value=mock_client):
             register_parallel_functions(conn, api_key="test-key")
 
-            result = conn.execute("""
-                SELECT parallel_enrich('{"company": "Google"}', '["CEO name"]')
-            """).fetchone()[0]
+            result = conn.execute(self.ENRICH_SQL, ['{"company": "Google"}', '["CEO name"]']).fetchall()[0][0]
 
             data = json.loads(result)
             assert "error" in data
@@ -690,13 +1077,7 @@ class TestRegisterParallelFunctions:
             register_parallel_functions(conn, api_key="test-key")
 
             # Create a table with multiple rows
-            conn.execute("""
-                CREATE TABLE companies AS SELECT * FROM (VALUES
-                    ('Google'),
-                    ('Microsoft'),
-                    ('Apple')
-                ) AS t(company)
-            """)
+            _seed(conn, "companies", {"company": ["Google", "Microsoft", "Apple"]})
 
             results = conn.execute("""
                 SELECT parallel_enrich(
@@ -710,6 +1091,97 @@ class TestRegisterParallelFunctions:
         # All 3 rows should have been processed
         assert call_count == 3
 
+    def test_mixed_output_columns_per_row(self, conn):
+        """Rows with different output_columns should each use their own spec."""
+        from types import SimpleNamespace
+
+        async def mock_create(input, task_spec, processor):
+            props = task_spec["output_schema"]["json_schema"]["properties"]
+            return SimpleNamespace(run_id=",".join(sorted(props)))
+
+        async def mock_result(run_id, api_timeout):
+            return SimpleNamespace(output=SimpleNamespace(content={k: "x" for k in run_id.split(",")}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            register_parallel_functions(conn, api_key="test-key")
+
+            rows = conn.execute("""
+                SELECT parallel_enrich(json_object('company', company), spec)
+                FROM (VALUES
+                    ('Google', '["CEO name"]'),
+                    ('Apple', '["Founding year"]'),
+                    ('Meta', '["CEO name"]')
+                ) AS t(company, spec)
+            """).fetchall()
+
+        assert [set(json.loads(r[0])) for r in rows] == [{"ceo_name"}, {"founding_year"}, {"ceo_name"}]
+
+    def test_enrich_map_native_types(self, conn):
+        """parallel_enrich_map should take MAP/LIST inputs and return a MAP."""
+        from types import SimpleNamespace
+
+        captured_inputs = []
+
+        async def mock_create(input, task_spec, processor):
+            captured_inputs.append(input)
+            return SimpleNamespace(run_id=f"run_{input['company']}")
+
+        async def mock_result(run_id, api_timeout):
+            if run_id == "run_Bad":
+                raise ValueError("API error")
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": "CEO", "employees": 100}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            register_parallel_functions(conn, api_key="test-key")
+
+            rows = conn.execute("""
+                SELECT parallel_enrich_map(MAP {'company': company}, ['CEO name', 'Employees'])
+                FROM (VALUES ('Google'), ('Bad')) AS t(company)
+            """).fetchall()
+
+        assert {"company": "Google"} in captured_inputs
+        assert rows[0][0] == {"ceo_name": "CEO", "employees": "100"}
+        assert rows[1][0] == {"error": "API error"}
+
+    def test_specialized_output_columns(self, conn):
+        """With output_columns at registration, parallel_enrich should take a MAP and return a STRUCT."""
+        from types import SimpleNamespace
+
+        captured_specs = []
+
+        async def mock_create(input, task_spec, processor):
+            captured_specs.append(task_spec)
+            return SimpleNamespace(run_id=f"run_{input['company']}")
+
+        async def mock_result(run_id, api_timeout):
+            if run_id == "run_Bad":
+                raise ValueError("API error")
+            return SimpleNamespace(output=SimpleNamespace(content={"ceo_name": "CEO", "founding_year": 1998}))
+
+        mock_client = mock.AsyncMock()
+        mock_client.task_run.create = mock_create
+        mock_client.task_run.result = mock_result
+
+        with mock.patch("parallel.AsyncParallel", return_value=mock_client):
+            register_parallel_functions(conn, api_key="test-key", output_columns=["CEO name", "Founding year"])
+
+            rows = conn.execute("""
+                SELECT parallel_enrich(MAP {'company': company})
+                FROM (VALUES ('Google'), ('Bad')) AS t(company)
+            """).fetchall()
+
+        assert set(captured_specs[0]["output_schema"]["json_schema"]["properties"]) == {"ceo_name", "founding_year"}
+        assert rows[0][0] == {"ceo_name": "CEO", "founding_year": "1998", "_error": None}
+        assert rows[1][0] == {"ceo_name": None, "founding_year": None, "_error": "API error"}
+
     def test_works_in_nested_event_loop(self, conn):
         """Should work when called from within an existing event loop (e.g., Jupyter)."""
         import asyncio
@@ -735,7 +1207,7 @@ class TestRegisterParallelFunctions:
                         '{"company_name": "Google"}',
                         '["CEO name"]'
                     )
-                """).fetchone()[0]
+                """).fetchall()[0][0]
 
                 return json.loads(result)
 
@@ -765,9 +1237,11 @@ class TestUnregisterParallelFunctions:
             register_parallel_functions(conn, api_key="test-key")
             unregister_parallel_functions(conn)
 
-        # Function should no longer exist
+        # Functions should no longer exist
+        with pytest.raises(duckdb.CatalogException):
+            conn.execute("SELECT parallel_enrich('{}', '[]')").fetchall()
         with pytest.raises(duckdb.CatalogException):
-            conn.execute("SELECT parallel_enrich('{}', '[]')").fetchone()
+            conn.execute("SELECT parallel_enrich_map(MAP {}, [])").fetchall()
 
     def test_handles_nonexistent_function(self, conn):
         """Should not raise when function doesn't exist."""
@@ -778,72 +1252,58 @@ class TestUnregisterParallelFunctions:
 class TestIntegration:
     """Integration tests for the DuckDB module."""
 
-    def test_full_workflow(self, conn):
+    def test_full_workflow(self, conn, mock_batch):
         """Test a complete enrichment workflow."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Tesla', 'Automotive'),
-                ('SpaceX', 'Aerospace')
-            ) AS t(name, industry)
-        """)
-
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {"ceo_name": "Elon Musk", "founding_year": "2003"},
-                {"ceo_name": "Elon Musk", "founding_year": "2002"},
-            ]
-
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name", "sector": "industry"},
-                output_columns=["CEO name", "Founding year"],
-            )
+        _seed(conn, "companies", {"name": ["Tesla", "SpaceX"], "industry": ["Automotive", "Aerospace"]})
+
+        mock_batch.return_value = [
+            {"ceo_name": "Elon Musk", "founding_year": "2003"},
+            {"ceo_name": "Elon Musk", "founding_year": "2002"},
+        ]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name", "sector": "industry"},
+            output_columns=["CEO name", "Founding year"],
+        )
 
         assert result.success_count == 2
         assert result.error_count == 0
 
-        df = result.result.fetchdf()
+        table = result.to_arrow()
 
         # Check original columns preserved
-        assert df["name"].tolist() == ["Tesla", "SpaceX"]
-        assert df["industry"].tolist() == ["Automotive", "Aerospace"]
+        assert table.column("name").to_pylist() == ["Tesla", "SpaceX"]
+        assert table.column("industry").to_pylist() == ["Automotive", "Aerospace"]
 
         # Check new columns added
-        assert df["ceo_name"].tolist() == ["Elon Musk", "Elon Musk"]
-        assert df["founding_year"].tolist() == ["2003", "2002"]
+        assert table.column("ceo_name").to_pylist() == ["Elon Musk", "Elon Musk"]
+        assert table.column("founding_year").to_pylist() == ["2003", "2002"]
 
-    def test_mixed_success_and_errors(self, conn):
+    def test_mixed_success_and_errors(self, conn, mock_batch):
         """Test handling mix of successful and failed enrichments."""
-        conn.execute("""
-            CREATE TABLE companies AS SELECT * FROM (VALUES
-                ('Google'),
-                ('FakeCompany123'),
-                ('Microsoft')
-            ) AS t(name)
-        """)
-
-        with mock.patch("parallel_web_tools.integrations.duckdb.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [
-                {"ceo_name": "Sundar Pichai"},
-                {"error": "Company not found"},
-                {"ceo_name": "Satya Nadella"},
-            ]
-
-            result = enrich_table(
-                conn,
-                source_table="companies",
-                input_columns={"company_name": "name"},
-                output_columns=["CEO name"],
-            )
+        _seed(conn, "companies", {"name": ["Google", "FakeCompany123", "Microsoft"]})
+
+        mock_batch.return_value = [
+            {"ceo_name": "Sundar Pichai"},
+            {"error": "Company not found"},
+            {"ceo_name": "Satya Nadella"},
+        ]
+
+        result = enrich_table(
+            conn,
+            source_table="companies",
+            input_columns={"company_name": "name"},
+            output_columns=["CEO name"],
+        )
 
         assert result.success_count == 2
         assert result.error_count == 1
         assert len(result.errors) == 1
         assert result.errors[0]["row"] == 1
 
-        df = result.result.fetchdf()
-        ceo_names = df["ceo_name"].tolist()
+        ceo_names = result.to_arrow().column("ceo_name").to_pylist()
         assert ceo_names[0] == "Sundar Pichai"
         assert ceo_names[1] is None
         assert ceo_names[2] == "Satya Nadella"
@@ -872,11 +1332,11 @@ class TestFindallTable:
         assert result.success_count == 3
         assert result.error_count == 0
 
-        df = result.result.fetchdf()
-        assert len(df) == 3
-        assert "name" in df.columns
-        assert "url" in df.columns
-        assert df["name"].tolist() == ["Apple Inc", "Google LLC", "Microsoft Corp"]
+        table = result.to_arrow()
+        assert table.num_rows == 3
+        assert "name" in table.column_names
+        assert "url" in table.column_names
+        assert table.column("name").to_pylist() == ["Apple Inc", "Google LLC", "Microsoft Corp"]
 
     def test_filters_out_non_matched(self, conn):
         """Should only include candidates with match_status='matched'."""
@@ -893,9 +1353,9 @@ class TestFindallTable:
         with mock.patch("parallel_web_tools.integrations.duckdb.findall.run_findall", return_value=mock_result):
             result = findall_table(conn, "test")
 
-        df = result.result.fetchdf()
-        assert len(df) == 1
-        assert df["name"].iloc[0] == "Matched"
+        table = result.to_arrow()
+        assert table.num_rows == 1
+        assert table.column("name")[0].as_py() == "Matched"
 
     def test_unpacks_output_enrichments(self, conn):
         """Should unpack output field into separate columns."""
@@ -929,13 +1389,13 @@ class TestFindallTable:
         with mock.patch("parallel_web_tools.integrations.duckdb.findall.run_findall", return_value=mock_result):
             result = findall_table(conn, "test")
 
-        df = result.result.fetchdf()
-        assert "capital_city" in df.columns
-        assert "world_cup_wins" in df.columns
-        assert "world_cup_check" in df.columns
-        assert df["capital_city"].iloc[0] == "Paris"
-        assert df["world_cup_wins"].iloc[0] == "2"  # Converted to string
-        assert "output" not in df.columns  # Raw output should be removed
+        table = result.to_arrow()
+        assert "capital_city" in table.column_names
+        assert "world_cup_wins" in table.column_names
+        assert "world_cup_check" in table.column_names
+        assert table.column("capital_city")[0].as_py() == "Paris"
+        assert table.column("world_cup_wins")[0].as_py() == "2"  # Converted to string
+        assert "output" not in table.column_names  # Raw output should be removed
 
     def test_strips_internal_fields(self, conn):
         """Should not include candidate_id, match_status, or basis columns."""
@@ -955,11 +1415,11 @@ class TestFindallTable:
         with mock.patch("parallel_web_tools.integrations.duckdb.findall.run_findall", return_value=mock_result):
             result = findall_table(conn, "test")
 
-        df = result.result.fetchdf()
-        assert "candidate_id" not in df.columns
-        assert "match_status" not in df.columns
-        assert "basis" not in df.columns
-        assert "name" in df.columns
+        table = result.to_arrow()
+        assert "candidate_id" not in table.column_names
+        assert "match_status" not in table.column_names
+        assert "basis" not in table.column_names
+        assert "name" in table.column_names
 
     def test_empty_candidates(self, conn):
         """Should handle empty results."""
@@ -987,8 +1447,8 @@ class TestFindallTable:
         with mock.patch("parallel_web_tools.integrations.duckdb.findall.run_findall", return_value=mock_result):
             findall_table(conn, "find EV companies", result_table="ev_companies")
 
-        df = conn.execute("SELECT * FROM ev_companies").fetchdf()
-        assert df["name"].iloc[0] == "Tesla"
+        table = pa.table(conn.sql("SELECT * FROM ev_companies"))
+        assert table.column("name")[0].as_py() == "Tesla"
 
     def test_passes_parameters(self, conn):
         """Should forward parameters to run_findall."""
@@ -1039,9 +1499,9 @@ class TestFindallTable:
         with mock.patch("parallel_web_tools.integrations.duckdb.findall.run_findall", return_value=mock_result):
             result = findall_table(conn, "test")
 
-        df = result.result.fetchdf()
-        assert df["tags"].iloc[0] == '["tech", "ai"]'
-        assert df["details"].iloc[0] == '{"founded": 2020}'
+        table = result.to_arrow()
+        assert table.column("tags")[0].as_py() == '["tech", "ai"]'
+        assert table.column("details")[0].as_py() == '{"founded": 2020}'
 
     def test_heterogeneous_candidates(self, conn):
         """Should handle matched candidates with different keys."""
@@ -1057,14 +1517,14 @@ class TestFindallTable:
         with mock.patch("parallel_web_tools.integrations.duckdb.findall.run_findall", return_value=mock_result):
             result = findall_table(conn, "test")
 
-        df = result.result.fetchdf()
-        assert len(df) == 2
+        table = result.to_arrow()
+        assert table.num_rows == 2
         # Alpha has url but no industry
-        assert df["url"].iloc[0] == "https://alpha.com"
-        assert df["industry"].iloc[0] is None
+        assert table.column("url")[0].as_py() == "https://alpha.com"
+        assert table.column("industry")[0].as_py() is None
         # Beta has industry but no url
-        assert df["url"].iloc[1] is None
-        assert df["industry"].iloc[1] == "Tech"
+        assert table.column("url")[1].as_py() is None
+        assert table.column("industry")[1].as_py() == "Tech"
 
     def test_default_generator_is_core(self, conn):
         """Should default to core generator for enrichment support."""
@@ -1,12 +1,15 @@
 """Tests for the core.batch module."""
 
 import json
-import os
 from types import SimpleNamespace
 from unittest import mock
 
 import pytest
+from parallel.resources.task_group import TaskGroupResource
 
+import parallel_web_tools.core.batch as batch
+import parallel_web_tools.core.credentials as credentials
+import parallel_web_tools.processors.json as json_processor
 from parallel_web_tools.core.auth import resolve_api_key
 from parallel_web_tools.core.batch import (
     build_output_schema,
@@ -20,6 +23,14 @@ from parallel_web_tools.core.batch import (
 )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _no_sleep():
+    """Skip the task group polling sleeps for every test in this module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(batch.time, "sleep", lambda *args: None)
+        yield
+
+
 class TestResolveApiKey:
     """Tests for resolve_api_key function."""
 
@@ -28,41 +39,33 @@ class TestResolveApiKey:
         result = resolve_api_key(api_key="test-key-123")
         assert result == "test-key-123"
 
-    def test_env_var_fallback(self):
+    def test_env_var_fallback(self, monkeypatch):
         """Should use PARALLEL_API_KEY env var when no explicit key. Env beats stored creds."""
-        with mock.patch.dict(os.environ, {"PARALLEL_API_KEY": "env-key-456"}):
-            with mock.patch("parallel_web_tools.core.credentials.get_selected_api_key", return_value="stored-key"):
-                result = resolve_api_key()
-                assert result == "env-key-456"
+        monkeypatch.setenv("PARALLEL_API_KEY", "env-key-456")
+        monkeypatch.setattr(credentials, "get_selected_api_key", lambda: "stored-key")
+
+        assert resolve_api_key() == "env-key-456"
 
-    def test_oauth_fallback(self):
+    def test_oauth_fallback(self, monkeypatch):
         """Should use stored OAuth credentials when no env var."""
-        with mock.patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("PARALLEL_API_KEY", None)
+        monkeypatch.delenv("PARALLEL_API_KEY", raising=False)
+        monkeypatch.setattr(credentials, "get_selected_api_key", lambda: "oauth-key-789")
 
-            with mock.patch("parallel_web_tools.core.credentials.get_selected_api_key") as mock_load:
-                mock_load.return_value = "oauth-key-789"
-                result = resolve_api_key()
-                assert result == "oauth-key-789"
+        assert resolve_api_key() == "oauth-key-789"
 
-    def test_no_key_raises_error(self):
+    def test_no_key_raises_error(self, monkeypatch):
         """Should raise ValueError when no API key found."""
-        with mock.patch.dict(os.environ, {}, clear=True):
-            os.environ.pop("PARALLEL_API_KEY", None)
-
-            with mock.patch("parallel_web_tools.core.credentials.get_selected_api_key") as mock_load:
-                mock_load.return_value = None
-
-                with pytest.raises(ValueError) as exc_info:
-                    resolve_api_key()
+        monkeypatch.delenv("PARALLEL_API_KEY", raising=False)
+        monkeypatch.setattr(credentials, "get_selected_api_key", lambda: None)
 
-                assert "Parallel API key required" in str(exc_info.value)
+        with pytest.raises(ValueError, match="Parallel API key required"):
+            resolve_api_key()
 
-    def test_explicit_key_takes_priority(self):
+    def test_explicit_key_takes_priority(self, monkeypatch):
         """Explicit key should override env var."""
-        with mock.patch.dict(os.environ, {"PARALLEL_API_KEY": "env-key"}):
-            result = resolve_api_key(api_key="explicit-key")
-            assert result == "explicit-key"
+        monkeypatch.setenv("PARALLEL_API_KEY", "env-key")
+
+        assert resolve_api_key(api_key="explicit-key") == "explicit-key"
 
 
 class TestBuildOutputSchema:
@@ -78,43 +81,24 @@ class TestBuildOutputSchema:
         assert schema["properties"]["ceo_name"]["description"] == "CEO name"
         assert "ceo_name" in schema["required"]
 
-    def test_column_with_parentheses(self):
-        """Parenthetical descriptions should be stripped from property name."""
-        schema = build_output_schema(["Founding year (YYYY format)"])
-
-        assert "founding_year" in schema["properties"]
-        assert schema["properties"]["founding_year"]["description"] == "Founding year (YYYY format)"
-
-    def test_column_with_brackets(self):
-        """Bracketed text should be stripped from property name."""
-        schema = build_output_schema(["Revenue [USD millions]"])
-
-        assert "revenue" in schema["properties"]
-        assert schema["properties"]["revenue"]["description"] == "Revenue [USD millions]"
-
-    def test_column_with_braces(self):
-        """Braced text should be stripped from property name."""
-        schema = build_output_schema(["Stock ticker {NYSE/NASDAQ}"])
-
-        assert "stock_ticker" in schema["properties"]
-
-    def test_column_starting_with_number(self):
-        """Columns starting with numbers should get 'col_' prefix."""
-        schema = build_output_schema(["2024 revenue"])
-
-        assert "col_2024_revenue" in schema["properties"]
-
-    def test_special_characters_removed(self):
-        """Special characters should be removed from property names."""
-        schema = build_output_schema(["CEO's name & title!"])
-
-        assert "ceos_name__title" in schema["properties"]
-
-    def test_empty_column_fallback(self):
-        """Empty column names should fallback to 'column'."""
-        schema = build_output_schema(["(just a description)"])
-
-        assert "column" in schema["properties"]
+    @pytest.mark.parametrize(
+        "column,expected",
+        [
+            pytest.param("Founding year (YYYY format)", "founding_year", id="parentheses_stripped"),
+            pytest.param("Revenue [USD millions]", "revenue", id="brackets_stripped"),
+            pytest.param("Stock ticker {NYSE/NASDAQ}", "stock_ticker", id="braces_stripped"),
+            pytest.param("2024 revenue", "col_2024_revenue", id="leading_number_prefixed"),
+            pytest.param("CEO's name & title!", "ceos_name__title", id="special_characters_removed"),
+            pytest.param("(just a description)", "column", id="empty_name_fallback"),
+            pytest.param("year-over-year growth", "year_over_year_growth", id="hyphens_to_underscores"),
+        ],
+    )
+    def test_property_name(self, column, expected):
+        """Annotations and invalid characters should be stripped from property names."""
+        schema = build_output_schema([column])
+
+        assert list(schema["properties"]) == [expected]
+        assert schema["properties"][expected]["description"] == column
 
     def test_multiple_columns(self):
         """Multiple columns should all be included."""
@@ -132,12 +116,6 @@ class TestBuildOutputSchema:
         assert "headquarters" in schema["properties"]
         assert len(schema["required"]) == 3
 
-    def test_hyphenated_names(self):
-        """Hyphens should be converted to underscores."""
-        schema = build_output_schema(["year-over-year growth"])
-
-        assert "year_over_year_growth" in schema["properties"]
-
     def test_empty_list(self):
         """Empty column list should return valid but empty schema."""
         schema = build_output_schema([])
@@ -147,471 +125,279 @@ class TestBuildOutputSchema:
         assert schema["required"] == []
 
 
-class TestExtractBasis:
-    """Tests for extract_basis function."""
-
-    def test_no_basis_attribute(self):
-        """Should return empty list when no basis attribute."""
-        output = SimpleNamespace(content={"result": "test"})
-
-        result = extract_basis(output)
-
-        assert result == []
-
-    def test_empty_basis(self):
-        """Should return empty list when basis is empty."""
-        output = SimpleNamespace(basis=[])
-
-        result = extract_basis(output)
-
-        assert result == []
-
-    def test_none_basis(self):
-        """Should return empty list when basis is None."""
-        output = SimpleNamespace(basis=None)
-
-        result = extract_basis(output)
-
-        assert result == []
-
-    def test_field_level_basis_with_citations(self):
-        """Should extract field-level basis with citations."""
-        citation = SimpleNamespace(
-            url="https://example.com",
-            excerpts=["excerpt 1", "excerpt 2"],
-        )
-        field_basis = SimpleNamespace(
-            field="ceo_name",
-            citations=[citation],
-            reasoning="Found on company website",
-            confidence="high",
-        )
-        output = SimpleNamespace(basis=[field_basis])
+_EXTRACT_BASIS_CASES = [
+    pytest.param(SimpleNamespace(content={"result": "test"}), [], id="no_basis_attribute"),
+    pytest.param(SimpleNamespace(basis=[]), [], id="empty_basis"),
+    pytest.param(SimpleNamespace(basis=None), [], id="none_basis"),
+    pytest.param(
+        SimpleNamespace(
+            basis=[
+                SimpleNamespace(
+                    field="ceo_name",
+                    citations=[SimpleNamespace(url="https://example.com", excerpts=["excerpt 1", "excerpt 2"])],
+                    reasoning="Found on company website",
+                    confidence="high",
+                )
+            ]
+        ),
+        [
+            {
+                "field": "ceo_name",
+                "citations": [{"url": "https://example.com", "excerpts": ["excerpt 1", "excerpt 2"]}],
+                "reasoning": "Found on company website",
+                "confidence": "high",
+            }
+        ],
+        id="field_level_basis_with_citations",
+    ),
+    pytest.param(
+        SimpleNamespace(basis=[SimpleNamespace(field="ceo_name", citations=None, reasoning=None, confidence=None)]),
+        [{"field": "ceo_name"}],
+        id="field_level_basis_without_optional_fields",
+    ),
+    pytest.param(
+        SimpleNamespace(
+            basis=[
+                SimpleNamespace(
+                    url="https://example.com/article",
+                    title="Article Title",
+                    excerpts=["relevant excerpt"],
+                )
+            ]
+        ),
+        [{"url": "https://example.com/article", "title": "Article Title", "excerpts": ["relevant excerpt"]}],
+        id="simple_basis_format",
+    ),
+    pytest.param(
+        SimpleNamespace(
+            basis=[SimpleNamespace(field="ceo_name", citations=[SimpleNamespace(url="https://example.com")])]
+        ),
+        [{"field": "ceo_name", "citations": [{"url": "https://example.com", "excerpts": []}]}],
+        id="citation_without_excerpts",
+    ),
+    pytest.param(
+        SimpleNamespace(
+            basis=[
+                SimpleNamespace(field="ceo_name", reasoning="reason 1"),
+                SimpleNamespace(field="founding_year", reasoning="reason 2"),
+            ]
+        ),
+        [
+            {"field": "ceo_name", "reasoning": "reason 1"},
+            {"field": "founding_year", "reasoning": "reason 2"},
+        ],
+        id="multiple_basis_entries",
+    ),
+    pytest.param(
+        SimpleNamespace(basis=[SimpleNamespace(), SimpleNamespace(field="ceo_name")]),
+        [{"field": "ceo_name"}],
+        id="empty_field_basis_skipped",
+    ),
+]
 
-        result = extract_basis(output)
 
-        assert len(result) == 1
-        assert result[0]["field"] == "ceo_name"
-        assert result[0]["citations"][0]["url"] == "https://example.com"
-        assert result[0]["citations"][0]["excerpts"] == ["excerpt 1", "excerpt 2"]
-        assert result[0]["reasoning"] == "Found on company website"
-        assert result[0]["confidence"] == "high"
-
-    def test_field_level_basis_without_optional_fields(self):
-        """Should handle basis without optional fields."""
-        field_basis = SimpleNamespace(
-            field="ceo_name",
-            citations=None,
-            reasoning=None,
-            confidence=None,
-        )
-        output = SimpleNamespace(basis=[field_basis])
+class TestExtractBasis:
+    """Tests for extract_basis function."""
 
-        result = extract_basis(output)
+    @pytest.mark.parametrize("output,expected", _EXTRACT_BASIS_CASES)
+    def test_extract_basis(self, output, expected):
+        """Should map each basis shape to its citation dicts."""
+        assert extract_basis(output) == expected
 
-        assert len(result) == 1
-        assert result[0]["field"] == "ceo_name"
-        assert "citations" not in result[0]
-        assert "reasoning" not in result[0]
-        assert "confidence" not in result[0]
-
-    def test_simple_basis_format(self):
-        """Should handle simpler basis format with url/title/excerpts."""
-        simple_basis = SimpleNamespace(
-            url="https://example.com/article",
-            title="Article Title",
-            excerpts=["relevant excerpt"],
-        )
-        output = SimpleNamespace(basis=[simple_basis])
 
-        result = extract_basis(output)
+@pytest.fixture
+def use_client(monkeypatch):
+    """Return a function that makes core.batch.create_client return the given client."""
 
-        assert len(result) == 1
-        assert result[0]["url"] == "https://example.com/article"
-        assert result[0]["title"] == "Article Title"
-        assert result[0]["excerpts"] == ["relevant excerpt"]
-
-    def test_citation_without_excerpts(self):
-        """Should handle citations without excerpts."""
-        citation = SimpleNamespace(url="https://example.com")
-        field_basis = SimpleNamespace(
-            field="ceo_name",
-            citations=[citation],
-        )
-        output = SimpleNamespace(basis=[field_basis])
+    def install(client):
+        monkeypatch.setattr(batch, "create_client", lambda *args, **kwargs: client)
+        return client
 
-        result = extract_basis(output)
+    return install
 
-        assert result[0]["citations"][0]["url"] == "https://example.com"
-        assert result[0]["citations"][0]["excerpts"] == []
 
-    def test_multiple_basis_entries(self):
-        """Should handle multiple basis entries."""
-        field_basis_1 = SimpleNamespace(field="ceo_name", reasoning="reason 1")
-        field_basis_2 = SimpleNamespace(field="founding_year", reasoning="reason 2")
-        output = SimpleNamespace(basis=[field_basis_1, field_basis_2])
+def _status(counts, num, active=False):
+    """Build a task group status response with the given run counts."""
+    return SimpleNamespace(
+        status=SimpleNamespace(task_run_status_counts=counts, num_task_runs=num, is_active=active),
+    )
 
-        result = extract_basis(output)
 
-        assert len(result) == 2
-        assert result[0]["field"] == "ceo_name"
-        assert result[1]["field"] == "founding_year"
+def _run_event(content, run_id="run_1", basis=()):
+    """Build a successful task_run.state event carrying ``content``."""
+    return SimpleNamespace(
+        type="task_run.state",
+        run=SimpleNamespace(run_id=run_id, error=None),
+        output=SimpleNamespace(content=content, basis=list(basis)),
+    )
 
-    def test_empty_field_basis_skipped(self):
-        """Should skip basis entries with no extractable data."""
-        empty_basis = SimpleNamespace()  # No attributes
-        valid_basis = SimpleNamespace(field="ceo_name")
-        output = SimpleNamespace(basis=[empty_basis, valid_basis])
 
-        result = extract_basis(output)
+@pytest.fixture
+def mock_parallel_client():
+    """Return a Parallel client stub wired for one finished run with no events.
 
-        assert len(result) == 1
-        assert result[0]["field"] == "ceo_name"
+    Tests override ``add_runs`` run ids, ``status`` and the ``events`` that
+    ``get_runs`` streams. Only ``add_runs`` is a mock, for call assertions; it
+    is autospecced from the SDK so calls must match the real signature.
+    """
+    add_runs = mock.create_autospec(TaskGroupResource, instance=True).add_runs
+    add_runs.return_value = SimpleNamespace(run_ids=["run_1"])
+    client = SimpleNamespace(status=_status({"completed": 1}, 1), events=[])
+    client.task_group = SimpleNamespace(
+        create=lambda **kwargs: SimpleNamespace(task_group_id="tgrp_123"),
+        add_runs=add_runs,
+        retrieve=lambda task_group_id: client.status,
+        get_runs=lambda task_group_id, **kwargs: client.events,
+    )
+    return client
 
 
 class TestEnrichBatch:
     """Tests for enrich_batch function."""
 
+    # Shared task_run.state events; tests only read them, so one instance each is enough
+    _EVENT_SUNDAR = _run_event({"ceo_name": "Sundar Pichai"})
+    _EVENT_SATYA = _run_event({"ceo_name": "Satya Nadella"}, run_id="run_2")
+    _EVENT_TEST_CEO = _run_event({"ceo_name": "Test"})
+    _EVENT_WITH_BASIS = _run_event(
+        {"ceo_name": "Test CEO"}, basis=[SimpleNamespace(field="ceo_name", reasoning="test")]
+    )
+    _EVENT_RUN_ERROR = SimpleNamespace(
+        type="task_run.state",
+        run=SimpleNamespace(run_id="run_1", error="API error occurred"),
+        output=None,
+    )
+
+    @pytest.fixture(autouse=True)
+    def _patch_client(self, use_client, mock_parallel_client):
+        """Route create_client to the shared mock."""
+        use_client(mock_parallel_client)
+
     def test_empty_inputs(self):
         """Should return empty list for empty inputs."""
         result = enrich_batch([], ["CEO name"])
 
         assert result == []
 
-    def test_successful_enrichment(self):
-        """Should return enriched results for valid inputs."""
-        # Create mock objects
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
+    def test_uses_given_client(self, mock_parallel_client, monkeypatch):
+        """Should enrich with a passed-in client instead of creating one."""
+        create_client = mock.MagicMock()
+        monkeypatch.setattr(batch, "create_client", create_client)
+        mock_parallel_client.task_group.add_runs.return_value.run_ids = ["run_1"]
+        mock_parallel_client.status = _status({"completed": 1, "failed": 0}, 1)
+        mock_parallel_client.events = [self._EVENT_SUNDAR]
 
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1", "run_2"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
+        result = enrich_batch([{"company_name": "Google"}], ["CEO name"], client=mock_parallel_client)
 
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 2, "failed": 0}
-        mock_status.status.num_task_runs = 2
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
+        assert result[0]["ceo_name"] == "Sundar Pichai"
+        create_client.assert_not_called()
 
-        # Mock the stream of events
-        event_1 = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(
-                content={"ceo_name": "Sundar Pichai"},
-                basis=[],
-            ),
-        )
-        event_2 = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_2", error=None),
-            output=SimpleNamespace(
-                content={"ceo_name": "Satya Nadella"},
-                basis=[],
-            ),
+    def test_successful_enrichment(self, mock_parallel_client):
+        """Should return enriched results for valid inputs."""
+        mock_client = mock_parallel_client
+        mock_client.task_group.add_runs.return_value.run_ids = ["run_1", "run_2"]
+        mock_client.status = _status({"completed": 2, "failed": 0}, 2)
+        mock_client.events = [self._EVENT_SUNDAR, self._EVENT_SATYA]
+
+        result = enrich_batch(
+            inputs=[
+                {"company_name": "Google"},
+                {"company_name": "Microsoft"},
+            ],
+            output_columns=["CEO name"],
+            api_key="test-key",
         )
-        mock_client.task_group.get_runs.return_value = [event_1, event_2]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):  # Skip sleeps
-                result = enrich_batch(
-                    inputs=[
-                        {"company_name": "Google"},
-                        {"company_name": "Microsoft"},
-                    ],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
 
         assert len(result) == 2
         assert result[0]["ceo_name"] == "Sundar Pichai"
         assert result[1]["ceo_name"] == "Satya Nadella"
 
-    def test_content_as_string_json(self):
-        """Should parse JSON string content."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
-
-        # Content as JSON string
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(
-                content='{"ceo_name": "Tim Cook"}',
-                basis=[],
-            ),
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            pytest.param({"ceo_name": "Tim Cook"}, {"ceo_name": "Tim Cook"}, id="dict"),
+            pytest.param('{"ceo_name": "Tim Cook"}', {"ceo_name": "Tim Cook"}, id="json_string"),
+            pytest.param("plain text response", {"result": "plain text response"}, id="invalid_json_string"),
+            pytest.param(12345, {"result": "12345"}, id="other_type"),
+        ],
+    )
+    def test_content_types(self, mock_parallel_client, content, expected):
+        """Should parse dict and JSON string content and wrap anything else as a string result."""
+        mock_parallel_client.events = [_run_event(content)]
+
+        result = enrich_batch(
+            inputs=[{"company_name": "Apple"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
+            include_basis=False,
         )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Apple"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
 
-        assert result[0]["ceo_name"] == "Tim Cook"
-
-    def test_content_as_invalid_json_string(self):
-        """Should handle invalid JSON string content."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
-
-        # Content as non-JSON string
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(
-                content="plain text response",
-                basis=[],
-            ),
-        )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Apple"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
-
-        assert result[0]["result"] == "plain text response"
-
-    def test_content_as_other_type(self):
-        """Should handle non-dict/non-string content."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
-
-        # Content as number
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(
-                content=12345,
-                basis=[],
-            ),
+        assert result[0] == expected
+
+    @pytest.mark.parametrize(
+        "include_basis,expected",
+        [
+            (True, {"ceo_name": "Test CEO", "basis": [{"field": "ceo_name", "reasoning": "test"}]}),
+            (False, {"ceo_name": "Test CEO"}),
+        ],
+    )
+    def test_include_basis(self, mock_parallel_client, include_basis, expected):
+        """Should attach extracted basis only when include_basis=True."""
+        mock_parallel_client.events = [self._EVENT_WITH_BASIS]
+
+        result = enrich_batch(
+            inputs=[{"company_name": "Test"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
+            include_basis=include_basis,
         )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Apple"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
-
-        assert result[0]["result"] == "12345"
-
-    def test_include_basis_true(self):
-        """Should include basis when include_basis=True."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
-
-        field_basis = SimpleNamespace(field="ceo_name", reasoning="test")
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(
-                content={"ceo_name": "Test CEO"},
-                basis=[field_basis],
-            ),
-        )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Test"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                    include_basis=True,
-                )
-
-        assert "basis" in result[0]
-        assert result[0]["basis"][0]["field"] == "ceo_name"
-
-    def test_include_basis_false(self):
-        """Should not include basis when include_basis=False."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
-
-        field_basis = SimpleNamespace(field="ceo_name", reasoning="test")
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(
-                content={"ceo_name": "Test CEO"},
-                basis=[field_basis],
-            ),
-        )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Test"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                    include_basis=False,
-                )
 
-        assert "basis" not in result[0]
+        assert result[0] == expected
 
-    def test_run_error_handling(self):
+    def test_run_error_handling(self, mock_parallel_client):
         """Should handle run errors."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
+        mock_client = mock_parallel_client
+        mock_client.status = _status({"completed": 0, "failed": 1}, 1)
 
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 0, "failed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
+        mock_client.events = [self._EVENT_RUN_ERROR]
 
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error="API error occurred"),
-            output=None,
+        result = enrich_batch(
+            inputs=[{"company_name": "Test"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
         )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Test"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
 
         assert "error" in result[0]
         assert "API error" in result[0]["error"]
 
-    def test_missing_result(self):
+    def test_missing_result(self, mock_parallel_client):
         """Should handle missing results for some run_ids."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1", "run_2"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 2
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
+        mock_client = mock_parallel_client
+        mock_client.task_group.add_runs.return_value.run_ids = ["run_1", "run_2"]
+        mock_client.status = _status({"completed": 1}, 2)
 
         # Only return event for run_1, not run_2
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(content={"ceo_name": "Test"}, basis=[]),
-        )
-        mock_client.task_group.get_runs.return_value = [event]
+        mock_client.events = [self._EVENT_TEST_CEO]
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "A"}, {"company_name": "B"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
+        result = enrich_batch(
+            inputs=[{"company_name": "A"}, {"company_name": "B"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
+        )
 
         assert result[0]["ceo_name"] == "Test"
         assert result[1]["error"] == "No result"
 
-    def test_no_run_ids_returned(self):
+    def test_no_run_ids_returned(self, mock_parallel_client):
         """Should handle case when no run_ids are returned."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = []
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Test"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
+        mock_client = mock_parallel_client
+        mock_client.task_group.add_runs.return_value.run_ids = []
+
+        result = enrich_batch(
+            inputs=[{"company_name": "Test"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
+        )
 
         assert len(result) == 1
         assert "error" in result[0]
@@ -619,7 +405,7 @@ class TestEnrichBatch:
 
     def test_exception_handling(self):
         """Should return errors for all inputs on exception."""
-        with mock.patch("parallel_web_tools.core.batch.create_client") as mock_create:
+        with mock.patch.object(batch, "create_client") as mock_create:
             mock_create.side_effect = Exception("Connection failed")
 
             result = enrich_batch(
@@ -633,76 +419,49 @@ class TestEnrichBatch:
         assert "error" in result[1]
         assert "Connection failed" in result[0]["error"]
 
-    def test_processor_passed_correctly(self):
+    def test_processor_passed_correctly(self, mock_parallel_client):
         """Should pass processor to run inputs."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
-
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
-
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
-
-        event = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(content={}, basis=[]),
+        mock_client = mock_parallel_client
+        # No run ids makes enrich_batch return straight after add_runs, skipping the poll
+        mock_client.task_group.add_runs.return_value.run_ids = []
+
+        enrich_batch(
+            inputs=[{"company_name": "Test"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
+            processor="pro-fast",
         )
-        mock_client.task_group.get_runs.return_value = [event]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                enrich_batch(
-                    inputs=[{"company_name": "Test"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                    processor="pro-fast",
-                )
 
         # Check that processor was passed correctly
         call_args = mock_client.task_group.add_runs.call_args
         assert call_args.kwargs["inputs"][0]["processor"] == "pro-fast"
 
-    def test_ignores_non_task_run_events(self):
-        """Should ignore events that are not task_run.state."""
-        mock_client = mock.MagicMock()
-        mock_task_group = mock.MagicMock()
-        mock_task_group.task_group_id = "tgrp_123"
-        mock_client.task_group.create.return_value = mock_task_group
+    def test_reuses_task_spec_for_same_output_columns(self, mock_parallel_client):
+        """Should build the task spec once per distinct output column list."""
+        add_runs = mock_parallel_client.task_group.add_runs
+        add_runs.return_value.run_ids = []
 
-        mock_add_response = mock.MagicMock()
-        mock_add_response.run_ids = ["run_1"]
-        mock_client.task_group.add_runs.return_value = mock_add_response
+        enrich_batch(inputs=[{"company_name": "A"}], output_columns=["CEO name"], api_key="test-key")
+        enrich_batch(inputs=[{"company_name": "B"}], output_columns=["CEO name"], api_key="test-key")
+        enrich_batch(inputs=[{"company_name": "C"}], output_columns=["Founding year"], api_key="test-key")
 
-        mock_status = mock.MagicMock()
-        mock_status.status.task_run_status_counts = {"completed": 1}
-        mock_status.status.num_task_runs = 1
-        mock_status.status.is_active = False
-        mock_client.task_group.retrieve.return_value = mock_status
+        specs = [call.kwargs["default_task_spec"] for call in add_runs.call_args_list]
+        assert specs[0] is specs[1]
+        assert specs[2] is not specs[0]
+        assert "founding_year" in specs[2]["output_schema"]["json_schema"]["properties"]
+
+    def test_ignores_non_task_run_events(self, mock_parallel_client):
+        """Should ignore events that are not task_run.state."""
+        mock_client = mock_parallel_client
 
         # Include various event types
-        event_other = SimpleNamespace(type="other.event")
-        event_valid = SimpleNamespace(
-            type="task_run.state",
-            run=SimpleNamespace(run_id="run_1", error=None),
-            output=SimpleNamespace(content={"ceo_name": "Test"}, basis=[]),
+        mock_client.events = [SimpleNamespace(type="other.event"), self._EVENT_TEST_CEO]
+
+        result = enrich_batch(
+            inputs=[{"company_name": "Test"}],
+            output_columns=["CEO name"],
+            api_key="test-key",
         )
-        mock_client.task_group.get_runs.return_value = [event_other, event_valid]
-
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                result = enrich_batch(
-                    inputs=[{"company_name": "Test"}],
-                    output_columns=["CEO name"],
-                    api_key="test-key",
-                )
 
         assert result[0]["ceo_name"] == "Test"
 
@@ -710,65 +469,108 @@ class TestEnrichBatch:
 class TestEnrichSingle:
     """Tests for enrich_single function."""
 
-    def test_delegates_to_enrich_batch(self):
-        """Should delegate to enrich_batch with single-item list."""
-        with mock.patch("parallel_web_tools.core.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"ceo_name": "Test CEO"}]
-
-            result = enrich_single(
-                input_data={"company_name": "Test"},
-                output_columns=["CEO name"],
-                api_key="test-key",
-                processor="lite-fast",
-                timeout=300,
-                include_basis=True,
+    @pytest.fixture
+    def mock_client(self, use_client):
+        """Install a client whose single task run finishes with a CEO name."""
+        client = mock.MagicMock()
+        client.task_run.create.return_value = SimpleNamespace(run_id="run_1")
+        client.task_run.result.return_value = SimpleNamespace(
+            output=SimpleNamespace(
+                content={"ceo_name": "Test CEO"},
+                basis=[SimpleNamespace(field="ceo_name", reasoning="test")],
             )
+        )
+        return use_client(client)
+
+    def test_uses_single_task_run(self, mock_client):
+        """Should run one task directly instead of creating a task group."""
+        result = enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+            api_key="test-key",
+            processor="lite-fast",
+            timeout=300,
+            include_basis=True,
+        )
 
-            mock_batch.assert_called_once_with(
-                [{"company_name": "Test"}],
-                ["CEO name"],
-                api_key="test-key",
-                processor="lite-fast",
-                timeout=300,
-                include_basis=True,
-                source="python",
-                previous_interaction_id=None,
-            )
-            assert result == {"ceo_name": "Test CEO"}
+        create_kwargs = mock_client.task_run.create.call_args.kwargs
+        assert create_kwargs["input"] == {"company_name": "Test"}
+        assert create_kwargs["processor"] == "lite-fast"
+        assert create_kwargs["task_spec"] == batch._build_task_spec(("CEO name",))
+        assert "previous_interaction_id" not in create_kwargs
+        mock_client.task_run.result.assert_called_once_with("run_1", api_timeout=300, timeout=330)
+        mock_client.task_group.create.assert_not_called()
+        assert result == {"ceo_name": "Test CEO", "basis": [{"field": "ceo_name", "reasoning": "test"}]}
+
+    def test_passes_previous_interaction_id(self, mock_client):
+        """Should forward previous_interaction_id to the task run."""
+        enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+            previous_interaction_id="int_123",
+        )
 
-    def test_empty_result_handling(self):
-        """Should return error dict when batch returns empty."""
-        with mock.patch("parallel_web_tools.core.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = []
+        assert mock_client.task_run.create.call_args.kwargs["previous_interaction_id"] == "int_123"
 
-            result = enrich_single(
-                input_data={"company_name": "Test"},
-                output_columns=["CEO name"],
-            )
+    def test_without_basis(self, mock_client):
+        """Should omit basis when include_basis=False."""
+        result = enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+            include_basis=False,
+        )
 
-            assert result == {"error": "No result"}
+        assert result == {"ceo_name": "Test CEO"}
 
-    def test_default_parameters(self):
+    def test_empty_result_handling(self, mock_client):
+        """Should return error dict when the run has no output content."""
+        mock_client.task_run.result.return_value = SimpleNamespace(output=SimpleNamespace(content=None))
+
+        result = enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+        )
+
+        assert result == {"error": "No result"}
+
+    def test_api_error_returns_error_dict(self, mock_client):
+        """Should return the exception message instead of raising."""
+        mock_client.task_run.result.side_effect = RuntimeError("run failed")
+
+        result = enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+        )
+
+        assert result == {"error": "run failed"}
+
+    def test_default_parameters(self, mock_client):
         """Should use default parameters."""
-        with mock.patch("parallel_web_tools.core.batch.enrich_batch") as mock_batch:
-            mock_batch.return_value = [{"result": "ok"}]
+        enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+        )
 
-            enrich_single(
-                input_data={"company_name": "Test"},
-                output_columns=["CEO name"],
-            )
+        assert mock_client.task_run.create.call_args.kwargs["processor"] == "lite-fast"
+        assert mock_client.task_run.result.call_args.kwargs["api_timeout"] == 300
 
-            call_kwargs = mock_batch.call_args.kwargs
-            assert call_kwargs.get("api_key") is None
-            assert call_kwargs.get("processor") == "lite-fast"
-            assert call_kwargs.get("timeout") == 300
-            assert call_kwargs.get("include_basis") is True
+    def test_http_timeout_covers_long_runs(self, mock_client):
+        """Should extend the HTTP read timeout past api_timeout, beyond the SDK's 600s default."""
+        enrich_single(
+            input_data={"company_name": "Test"},
+            output_columns=["CEO name"],
+            timeout=1800,
+        )
+
+        kwargs = mock_client.task_run.result.call_args.kwargs
+        assert kwargs["api_timeout"] == 1800
+        assert kwargs["timeout"] == 1800 + batch.RESULT_TIMEOUT_MARGIN
 
 
 class TestRunTasks:
     """Tests for run_tasks function with Parallel SDK."""
 
-    def test_run_tasks_basic(self):
+    def test_run_tasks_basic(self, use_client):
         """Should process batch tasks using the Parallel SDK and return results."""
         from pydantic import BaseModel
 
@@ -805,29 +607,144 @@ class TestRunTasks:
         )
         mock_client.task_group.get_runs.return_value = [mock_event1, mock_event2]
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):  # Speed up test
-                input_data = [
-                    {"company": "Anthropic"},
-                    {"company": "OpenAI"},
-                ]
+        use_client(mock_client)
 
-                results = run_tasks(input_data, InputModel, OutputModel, "lite-fast")
+        input_data = [
+            {"company": "Anthropic"},
+            {"company": "OpenAI"},
+        ]
+
+        results = run_tasks(input_data, InputModel, OutputModel, "lite-fast")
 
         assert len(results) == 2
         assert results[0]["company"] == "Anthropic"
         assert results[0]["ceo"] == "Dario Amodei"
         assert results[1]["company"] == "OpenAI"
         assert results[1]["ceo"] == "Sam Altman"
-        # Check batch_id and timestamp are added
+        # Check batch_id and timestamp are added, shared across the batch
         assert "batch_id" in results[0]
         assert "insertion_timestamp" in results[0]
+        assert results[0]["batch_id"] == results[1]["batch_id"]
+        assert results[0]["insertion_timestamp"] == results[1]["insertion_timestamp"]
+
+    def test_run_tasks_backs_off_between_polls(self, use_client):
+        """Should grow the sleep between status polls while the group is active."""
+        from pydantic import BaseModel
+
+        class InputModel(BaseModel):
+            company: str
+
+        class OutputModel(BaseModel):
+            ceo: str
+
+        mock_client = mock.MagicMock()
+        mock_client.task_group.create.return_value = mock.MagicMock(task_group_id="tgrp_123")
+        mock_client.task_group.add_runs.return_value = mock.MagicMock(run_ids=["run_1"])
+        mock_client.task_group.retrieve.side_effect = [
+            _status({"running": 1}, 1, active=True),
+            _status({"running": 1}, 1, active=True),
+            _status({"running": 1}, 1, active=True),
+            _status({"completed": 1}, 1),
+        ]
+        mock_client.task_group.get_runs.return_value = []
+        use_client(mock_client)
+
+        with mock.patch.object(batch.time, "sleep") as mock_sleep:
+            run_tasks([{"company": "Anthropic"}], InputModel, OutputModel)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 1.5, 2.25]
+
+    def test_run_tasks_stream_yields_results_lazily(self, use_client):
+        """Should return an iterator that reads run events only as it is consumed."""
+        from pydantic import BaseModel
+
+        class InputModel(BaseModel):
+            company: str
+
+        class OutputModel(BaseModel):
+            ceo: str
+
+        events_read = []
+
+        def get_runs(*args, **kwargs):
+            for company, ceo in [("Anthropic", "Dario Amodei"), ("OpenAI", "Sam Altman")]:
+                events_read.append(company)
+                yield SimpleNamespace(
+                    type="task_run.state",
+                    input=SimpleNamespace(input={"company": company}),
+                    output=SimpleNamespace(content={"ceo": ceo}),
+                )
+
+        mock_client = mock.MagicMock()
+        mock_client.task_group.create.return_value = mock.MagicMock(task_group_id="tgrp_123")
+        mock_client.task_group.add_runs.return_value = mock.MagicMock(run_ids=["run_1", "run_2"])
+        mock_client.task_group.retrieve.return_value = _status({"completed": 2}, 2)
+        mock_client.task_group.get_runs.side_effect = get_runs
+        use_client(mock_client)
+
+        rows = run_tasks([{"company": "Anthropic"}, {"company": "OpenAI"}], InputModel, OutputModel, stream=True)
+
+        assert events_read == []
+        assert next(rows)["ceo"] == "Dario Amodei"
+        assert events_read == ["Anthropic"]
+        assert [row["ceo"] for row in rows] == ["Sam Altman"]
+
+    def test_run_tasks_uses_given_client(self, monkeypatch):
+        """Should create, poll and read the group with a passed-in client instead of building one."""
+        from pydantic import BaseModel
+
+        class InputModel(BaseModel):
+            company: str
+
+        class OutputModel(BaseModel):
+            ceo: str
+
+        create_client = mock.MagicMock()
+        monkeypatch.setattr(batch, "create_client", create_client)
+        mock_client = mock.MagicMock()
+        mock_client.task_group.create.return_value = mock.MagicMock(task_group_id="tgrp_123")
+        mock_client.task_group.add_runs.return_value = mock.MagicMock(run_ids=["run_1"])
+        mock_client.task_group.retrieve.return_value = _status({"completed": 1}, 1)
+        mock_client.task_group.get_runs.return_value = [
+            SimpleNamespace(
+                type="task_run.state",
+                input=SimpleNamespace(input={"company": "Anthropic"}),
+                output=SimpleNamespace(content={"ceo": "Dario Amodei"}),
+            )
+        ]
+
+        results = run_tasks([{"company": "Anthropic"}], InputModel, OutputModel, client=mock_client)
+
+        assert [row["ceo"] for row in results] == ["Dario Amodei"]
+        create_client.assert_not_called()
+
+    def test_run_tasks_creates_one_client(self, monkeypatch):
+        """Should share one created client between creating the group and polling it."""
+        from pydantic import BaseModel
+
+        class InputModel(BaseModel):
+            company: str
+
+        class OutputModel(BaseModel):
+            ceo: str
+
+        mock_client = mock.MagicMock()
+        mock_client.task_group.create.return_value = mock.MagicMock(task_group_id="tgrp_123")
+        mock_client.task_group.add_runs.return_value = mock.MagicMock(run_ids=["run_1"])
+        mock_client.task_group.retrieve.return_value = _status({"completed": 1}, 1)
+        mock_client.task_group.get_runs.return_value = []
+        create_client = mock.MagicMock(return_value=mock_client)
+        monkeypatch.setattr(batch, "create_client", create_client)
+
+        run_tasks([{"company": "Anthropic"}], InputModel, OutputModel)
+
+        create_client.assert_called_once()
 
 
 class TestCreateTaskGroup:
     """Tests for create_task_group function."""
 
-    def test_creates_task_group_and_returns_info(self):
+    def test_creates_task_group_and_returns_info(self, use_client):
         """Should create a task group, add runs, and return info dict."""
         from pydantic import BaseModel
 
@@ -841,20 +758,21 @@ class TestCreateTaskGroup:
         mock_client.task_group.create.return_value = mock.MagicMock(task_group_id="tgrp_abc")
         mock_client.task_group.add_runs.return_value = mock.MagicMock(run_ids=["run_1", "run_2"])
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            result = create_task_group(
-                [{"company": "A"}, {"company": "B"}],
-                InputModel,
-                OutputModel,
-                processor="core-fast",
-            )
+        use_client(mock_client)
+
+        result = create_task_group(
+            [{"company": "A"}, {"company": "B"}],
+            InputModel,
+            OutputModel,
+            processor="core-fast",
+        )
 
         assert result["taskgroup_id"] == "tgrp_abc"
         assert result["num_runs"] == 2
         assert "tgrp_abc" in result["url"]
         assert "platform.parallel.ai" in result["url"]
 
-    def test_batches_large_inputs(self):
+    def test_batches_large_inputs(self, use_client):
         """Should add runs in batches of 100."""
         from pydantic import BaseModel
 
@@ -870,8 +788,9 @@ class TestCreateTaskGroup:
 
         input_data = [{"company": f"C{i}"} for i in range(250)]
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            result = create_task_group(input_data, InputModel, OutputModel)
+        use_client(mock_client)
+
+        result = create_task_group(input_data, InputModel, OutputModel)
 
         # 250 items / 100 batch size = 3 calls
         assert mock_client.task_group.add_runs.call_count == 3
@@ -881,7 +800,7 @@ class TestCreateTaskGroup:
 class TestGetTaskGroupStatus:
     """Tests for get_task_group_status function."""
 
-    def test_returns_status_info(self):
+    def test_returns_status_info(self, use_client):
         """Should return formatted status info."""
         mock_client = mock.MagicMock()
         mock_status = mock.MagicMock()
@@ -890,8 +809,9 @@ class TestGetTaskGroupStatus:
         mock_status.status.num_task_runs = 6
         mock_client.task_group.retrieve.return_value = mock_status
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            result = get_task_group_status("tgrp_test", api_key="test-key")
+        use_client(mock_client)
+
+        result = get_task_group_status("tgrp_test", api_key="test-key")
 
         assert result["taskgroup_id"] == "tgrp_test"
         assert result["status_counts"] == {"completed": 5, "failed": 1}
@@ -899,7 +819,7 @@ class TestGetTaskGroupStatus:
         assert result["num_runs"] == 6
         assert "tgrp_test" in result["url"]
 
-    def test_active_task_group(self):
+    def test_active_task_group(self, use_client):
         """Should report is_active=True for running groups."""
         mock_client = mock.MagicMock()
         mock_status = mock.MagicMock()
@@ -908,8 +828,9 @@ class TestGetTaskGroupStatus:
         mock_status.status.num_task_runs = 5
         mock_client.task_group.retrieve.return_value = mock_status
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            result = get_task_group_status("tgrp_active")
+        use_client(mock_client)
+
+        result = get_task_group_status("tgrp_active")
 
         assert result["is_active"] is True
 
@@ -917,7 +838,7 @@ class TestGetTaskGroupStatus:
 class TestPollTaskGroup:
     """Tests for poll_task_group function."""
 
-    def test_polls_until_complete_and_returns_results(self):
+    def test_polls_until_complete_and_returns_results(self, use_client):
         """Should poll until not active and return collected results."""
         mock_client = mock.MagicMock()
 
@@ -949,16 +870,16 @@ class TestPollTaskGroup:
         )
         mock_client.task_group.get_runs.return_value = [event_1, event_2]
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                results = poll_task_group("tgrp_poll", api_key="test-key")
+        use_client(mock_client)
+
+        results = poll_task_group("tgrp_poll", api_key="test-key")
 
         assert len(results) == 2
         assert results[0]["input"] == {"company": "A"}
         assert results[0]["output"] == {"ceo": "CEO A"}
         assert results[1]["output"] == {"ceo": "CEO B"}
 
-    def test_timeout_raises_error(self):
+    def test_timeout_raises_error(self, use_client):
         """Should raise TimeoutError when task group doesn't complete."""
         mock_client = mock.MagicMock()
         active_status = mock.MagicMock()
@@ -967,15 +888,15 @@ class TestPollTaskGroup:
         active_status.status.num_task_runs = 2
         mock_client.task_group.retrieve.return_value = active_status
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                with mock.patch("parallel_web_tools.core.batch.time.time") as mock_time:
-                    # Simulate time passing beyond timeout
-                    mock_time.side_effect = [0, 0, 100, 200]
-                    with pytest.raises(TimeoutError, match="timed out"):
-                        poll_task_group("tgrp_timeout", timeout=1)
+        use_client(mock_client)
+
+        with mock.patch.object(batch.time, "time") as mock_time:
+            # Simulate time passing beyond timeout
+            mock_time.side_effect = [0, 0, 100, 200]
+            with pytest.raises(TimeoutError, match="timed out"):
+                poll_task_group("tgrp_timeout", timeout=1)
 
-    def test_calls_on_progress(self):
+    def test_calls_on_progress(self, use_client):
         """Should call on_progress callback with counts."""
         mock_client = mock.MagicMock()
         done_status = mock.MagicMock()
@@ -987,17 +908,17 @@ class TestPollTaskGroup:
 
         progress_calls = []
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                poll_task_group(
-                    "tgrp_cb",
-                    on_progress=lambda c, f, t: progress_calls.append((c, f, t)),
-                )
+        use_client(mock_client)
+
+        poll_task_group(
+            "tgrp_cb",
+            on_progress=lambda c, f, t: progress_calls.append((c, f, t)),
+        )
 
         assert len(progress_calls) == 1
         assert progress_calls[0] == (3, 0, 3)
 
-    def test_handles_failed_runs(self):
+    def test_handles_failed_runs(self, use_client):
         """Should include error info for failed runs."""
         mock_client = mock.MagicMock()
         done_status = mock.MagicMock()
@@ -1014,9 +935,9 @@ class TestPollTaskGroup:
         )
         mock_client.task_group.get_runs.return_value = [event]
 
-        with mock.patch("parallel_web_tools.core.batch.create_client", return_value=mock_client):
-            with mock.patch("parallel_web_tools.core.batch.time.sleep"):
-                results = poll_task_group("tgrp_fail")
+        use_client(mock_client)
+
+        results = poll_task_group("tgrp_fail")
 
         assert len(results) == 1
         assert results[0]["error"] == "Processing failed"
@@ -1050,7 +971,7 @@ class TestProcessJson:
             enriched_columns=[Column("ceo", "CEO name")],
         )
 
-        with mock.patch("parallel_web_tools.processors.json.run_tasks") as mock_run:
+        with mock.patch.object(json_processor, "run_tasks") as mock_run:
             mock_run.return_value = [
                 {"company": "Google", "ceo": "Sundar Pichai"},
                 {"company": "Apple", "ceo": "Tim Cook"},
@@ -1084,7 +1005,7 @@ class TestProcessJson:
 
         expected_output = [{"company": "Google", "ceo": "Sundar Pichai"}]
 
-        with mock.patch("parallel_web_tools.processors.json.run_tasks") as mock_run:
+        with mock.patch.object(json_processor, "run_tasks") as mock_run:
             mock_run.return_value = expected_output
             process_json(schema)
 
@@ -1114,7 +1035,7 @@ class TestProcessJson:
             enriched_columns=[Column("ceo", "CEO name")],
         )
 
-        with mock.patch("parallel_web_tools.processors.json.create_task_group") as mock_create:
+        with mock.patch.object(json_processor, "create_task_group") as mock_create:
             mock_create.return_value = {"taskgroup_id": "tgrp_json_123"}
             result = process_json(schema, no_wait=True)
 
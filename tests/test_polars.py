@@ -46,20 +46,36 @@ class TestEnrichmentResult:
         assert result.errors == errors
         assert result.elapsed_time == 1.5
 
+    def test_to_arrow(self):
+        """Should convert the DataFrame to a pyarrow Table."""
+        df = pl.DataFrame({"name": ["Google", "Microsoft"]})
+        result = EnrichmentResult(result=df, success_count=2, error_count=0)
+
+        table = result.to_arrow()
+
+        assert table.column("name").to_pylist() == ["Google", "Microsoft"]
+
 
 class TestParallelEnrich:
     """Tests for parallel_enrich function."""
 
     def test_empty_dataframe(self):
-        """Should handle empty DataFrame."""
+        """Should return an empty DataFrame without building a schema or calling the API."""
         df = pl.DataFrame({"company": []})
 
-        result = parallel_enrich(
-            df,
-            input_columns={"company_name": "company"},
-            output_columns=["CEO name"],
-        )
+        with (
+            mock.patch("parallel_web_tools.integrations.polars.enrich.enrich_batch") as mock_batch,
+            mock.patch("parallel_web_tools.integrations.polars.enrich._output_property_names") as mock_schema,
+        ):
+            result = parallel_enrich(
+                df,
+                input_columns={"company_name": "company"},
+                output_columns=["CEO name"],
+            )
 
+        mock_batch.assert_not_called()
+        mock_schema.assert_not_called()
+        assert result.result is df
         assert result.result.is_empty()
         assert result.success_count == 0
         assert result.error_count == 0
@@ -181,8 +197,32 @@ class TestParallelEnrich:
             )
 
         assert "_basis" in result.result.columns
+        assert result.result.schema["_basis"] == pl.List(pl.Struct)
         basis_value = result.result["_basis"].to_list()[0]
-        assert basis_value == [{"field": "ceo_name", "reasoning": "test"}]
+        assert [{k: v for k, v in entry.items() if v is not None} for entry in basis_value] == [
+            {"field": "ceo_name", "reasoning": "test"}
+        ]
+
+    def test_basis_keeps_keys_first_seen_late(self):
+        """Should keep citation fields that only appear after Polars' inference window."""
+        df = pl.DataFrame({"company": [f"Company {i}" for i in range(150)]})
+        basis = [{"field": "ceo_name", "reasoning": "test"}]
+        cited = [{"field": "ceo_name", "citations": [{"url": "https://example.com", "excerpts": ["CEO"]}]}]
+
+        with mock.patch("parallel_web_tools.integrations.polars.enrich.enrich_batch") as mock_batch:
+            mock_batch.return_value = [{"ceo_name": "Test", "basis": basis}] * 149 + [
+                {"ceo_name": "Test", "basis": cited}
+            ]
+
+            result = parallel_enrich(
+                df,
+                input_columns={"company_name": "company"},
+                output_columns=["CEO name"],
+                include_basis=True,
+            )
+
+        last = result.result["_basis"].to_list()[-1][0]
+        assert last["citations"] == [{"url": "https://example.com", "excerpts": ["CEO"]}]
 
     def test_no_basis_when_disabled(self):
         """Should not include basis when include_basis=False."""
@@ -291,6 +331,18 @@ class TestParallelEnrich:
         assert inputs[0] == {"company_name": "Google"}
         assert inputs[1] == {}  # None value should result in empty dict entry
 
+    def test_empty_input_columns_sends_empty_inputs(self):
+        """Should send an empty input dict per row when no input columns are mapped."""
+        df = pl.DataFrame({"company": ["Google", "Apple"]})
+
+        with mock.patch("parallel_web_tools.integrations.polars.enrich.enrich_batch") as mock_batch:
+            mock_batch.return_value = [{"ceo_name": "A"}, {"ceo_name": "B"}]
+
+            result = parallel_enrich(df, input_columns={}, output_columns=["CEO name"])
+
+        assert mock_batch.call_args.kwargs["inputs"] == [{}, {}]
+        assert result.result["ceo_name"].to_list() == ["A", "B"]
+
     def test_converts_non_string_values(self):
         """Should convert non-string values to strings."""
         df = pl.DataFrame(
@@ -315,6 +367,22 @@ class TestParallelEnrich:
         assert inputs[0] == {"company_id": "123"}
         assert inputs[1] == {"company_id": "456"}
 
+    def test_non_castable_values_match_str(self):
+        """Should format floats and booleans like str(), dropping NULLs per row only."""
+        df = pl.DataFrame({"active": [True, None], "score": [1.5, 2.0]})
+
+        with mock.patch("parallel_web_tools.integrations.polars.enrich.enrich_batch") as mock_batch:
+            mock_batch.return_value = [{"summary": "A"}, {"summary": "B"}]
+
+            parallel_enrich(
+                df,
+                input_columns={"active": "active", "score": "score"},
+                output_columns=["Summary"],
+            )
+
+        inputs = mock_batch.call_args.kwargs["inputs"]
+        assert inputs == [{"active": "True", "score": "1.5"}, {"score": "2.0"}]
+
     def test_multiple_input_columns(self):
         """Should handle multiple input columns."""
         df = pl.DataFrame(
@@ -350,27 +418,19 @@ class TestParallelEnrich:
         df = pl.DataFrame({"company": ["Google"]})
 
         with mock.patch("parallel_web_tools.integrations.polars.enrich.enrich_batch") as mock_batch:
-            with mock.patch("parallel_web_tools.integrations.polars.enrich.build_output_schema") as mock_schema:
-                mock_schema.return_value = {
-                    "properties": {
-                        "ceo_name": {},
-                        "founding_year": {},
-                        "headquarters": {},
-                    }
+            mock_batch.return_value = [
+                {
+                    "ceo_name": "Sundar Pichai",
+                    "founding_year": "1998",
+                    "headquarters": "Mountain View",
                 }
-                mock_batch.return_value = [
-                    {
-                        "ceo_name": "Sundar Pichai",
-                        "founding_year": "1998",
-                        "headquarters": "Mountain View",
-                    }
-                ]
-
-                result = parallel_enrich(
-                    df,
-                    input_columns={"company_name": "company"},
-                    output_columns=["CEO name", "Founding year", "Headquarters"],
-                )
+            ]
+
+            result = parallel_enrich(
+                df,
+                input_columns={"company_name": "company"},
+                output_columns=["CEO name", "Founding year", "Headquarters"],
+            )
 
         assert "ceo_name" in result.result.columns
         assert "founding_year" in result.result.columns
@@ -391,6 +451,40 @@ class TestParallelEnrich:
 
         assert result.elapsed_time >= 0
 
+    def test_batch_size_splits_rows_and_keeps_order(self):
+        """Should enrich batch_size chunks separately and stitch results back in row order."""
+        df = pl.DataFrame({"company": ["A", "B", "C", "D", "E"]})
+
+        def fake_enrich(inputs, **kwargs):
+            return [{"ceo_name": f"CEO of {row['company_name']}"} for row in inputs]
+
+        with mock.patch(
+            "parallel_web_tools.integrations.polars.enrich.enrich_batch", side_effect=fake_enrich
+        ) as mock_batch:
+            result = parallel_enrich(
+                df,
+                input_columns={"company_name": "company"},
+                output_columns=["CEO name"],
+                batch_size=2,
+            )
+
+        chunk_sizes = sorted(len(call.kwargs["inputs"]) for call in mock_batch.call_args_list)
+        assert chunk_sizes == [1, 2, 2]
+        assert result.result["ceo_name"].to_list() == [f"CEO of {c}" for c in "ABCDE"]
+        assert result.success_count == 5
+
+    def test_invalid_batch_size_raises_error(self):
+        """Should reject a non-positive batch_size."""
+        df = pl.DataFrame({"company": ["Google"]})
+
+        with pytest.raises(ValueError, match="batch_size"):
+            parallel_enrich(
+                df,
+                input_columns={"company_name": "company"},
+                output_columns=["CEO name"],
+                batch_size=0,
+            )
+
 
 class TestParallelEnrichLazy:
     """Tests for parallel_enrich_lazy function."""
@@ -415,6 +509,25 @@ class TestParallelEnrichLazy:
         assert not isinstance(result.result, pl.LazyFrame)
         assert result.success_count == 2
 
+    def test_collects_with_streaming_engine(self):
+        """Should collect the LazyFrame on the streaming engine."""
+        lf = pl.DataFrame({"company": ["Google"]}).lazy()
+        collect = pl.LazyFrame.collect
+
+        with (
+            mock.patch.object(pl.LazyFrame, "collect", autospec=True, side_effect=collect) as mock_collect,
+            mock.patch("parallel_web_tools.integrations.polars.enrich.enrich_batch") as mock_batch,
+        ):
+            mock_batch.return_value = [{"ceo_name": "Sundar Pichai"}]
+
+            parallel_enrich_lazy(
+                lf,
+                input_columns={"company_name": "company"},
+                output_columns=["CEO name"],
+            )
+
+        mock_collect.assert_called_once_with(lf, engine="streaming")
+
     def test_passes_all_parameters(self):
         """Should pass all parameters to parallel_enrich."""
         lf = pl.DataFrame({"company": ["Google"]}).lazy()
@@ -1,10 +1,11 @@
 """Tests for the shared polling utility."""
 
+import asyncio
 from unittest import mock
 
 import pytest
 
-from parallel_web_tools.core.polling import TERMINAL_STATUSES, poll_until
+from parallel_web_tools.core.polling import TERMINAL_STATUSES, apoll_until, poll_until
 
 
 class TestTerminalStatuses:
@@ -86,6 +87,38 @@ class TestPollUntilRetryThenComplete:
 
         mock_sleep.assert_called_once_with(5)
 
+    def test_backs_off_up_to_max_poll_interval(self):
+        responses = iter([{"status": "running"}] * 4 + [{"status": "completed"}])
+
+        with mock.patch("parallel_web_tools.core.polling.time.sleep") as mock_sleep:
+            poll_until(
+                retrieve=lambda: next(responses),
+                extract_status=lambda r: r["status"],
+                fetch_result=lambda: "ok",
+                format_error=lambda r, s: "",
+                poll_interval=16,
+                max_poll_interval=30,
+                timeout=600,
+            )
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [16, 20, 25, 30]
+
+    def test_initial_delay_before_first_check(self):
+        retrieve = mock.Mock(return_value={"status": "completed"})
+
+        with mock.patch("parallel_web_tools.core.polling.time.sleep") as mock_sleep:
+            poll_until(
+                retrieve=retrieve,
+                extract_status=lambda r: r["status"],
+                fetch_result=lambda: "ok",
+                format_error=lambda r, s: "",
+                initial_delay=30,
+                timeout=600,
+            )
+
+        mock_sleep.assert_called_once_with(30)
+        retrieve.assert_called_once()
+
 
 class TestPollUntilTimeout:
     """Tests for poll_until timeout behavior."""
@@ -255,3 +288,46 @@ class TestPollUntilCustomTerminalStatuses:
             )
 
         assert result == "got it"
+
+
+class TestApollUntil:
+    """Tests for the async apoll_until counterpart."""
+
+    def test_polls_with_asyncio_sleep_until_completed(self):
+        statuses = iter(["running", "running", "completed"])
+
+        async def retrieve():
+            return {"status": next(statuses)}
+
+        async def fetch_result():
+            return "done"
+
+        with mock.patch("parallel_web_tools.core.polling.asyncio.sleep", new_callable=mock.AsyncMock) as mock_sleep:
+            result = asyncio.run(
+                apoll_until(
+                    retrieve=retrieve,
+                    extract_status=lambda r: r["status"],
+                    fetch_result=fetch_result,
+                    format_error=lambda r, s: "",
+                    poll_interval=8,
+                    max_poll_interval=10,
+                    timeout=60,
+                )
+            )
+
+        assert result == "done"
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [8, 10]
+
+    def test_raises_on_failure(self):
+        async def retrieve():
+            return {"status": "failed"}
+
+        with pytest.raises(RuntimeError, match="Task failed"):
+            asyncio.run(
+                apoll_until(
+                    retrieve=retrieve,
+                    extract_status=lambda r: r["status"],
+                    fetch_result=mock.AsyncMock(),
+                    format_error=lambda r, s: f"Task {s}",
+                )
+            )
@@ -1,16 +1,22 @@
 """Tests for the deep research functionality."""
 
+import asyncio
 import json
+import threading
+import time
 from unittest import mock
 
 import pytest
 from click.testing import CliRunner
 
+import parallel_web_tools.core.research as research
 from parallel_web_tools.cli.commands import _extract_executive_summary, main
 from parallel_web_tools.core.research import (
     RESEARCH_PROCESSORS,
     _build_task_spec,
+    _min_latency_seconds,
     _serialize_output,
+    arun_research,
     create_research_task,
     get_research_result,
     get_research_status,
@@ -33,6 +39,14 @@ def mock_parallel_client():
         yield mock_client
 
 
+@pytest.fixture(autouse=True)
+def _clear_terminal_cache():
+    """Don't let a finished run cached by one test answer another test's lookup."""
+    research._terminal_cache.clear()
+    yield
+    research._terminal_cache.clear()
+
+
 # =============================================================================
 # Core Research Function Tests
 # =============================================================================
@@ -121,6 +135,85 @@ class TestGetResearchStatus:
         assert result["status"] == "running"
         mock_parallel_client.task_run.retrieve.assert_called_once_with(run_id="trun_123")
 
+    def test_caches_terminal_status(self, mock_parallel_client):
+        """Should not hit the API again for a run that already finished."""
+        mock_parallel_client.task_run.retrieve.return_value = mock.MagicMock(status="completed")
+
+        first = get_research_status("trun_123")
+        second = get_research_status("trun_123")
+
+        assert first == second
+        assert second["status"] == "completed"
+        mock_parallel_client.task_run.retrieve.assert_called_once_with(run_id="trun_123")
+
+    def test_does_not_cache_active_status(self, mock_parallel_client):
+        """Should re-fetch the status while the run is still in progress."""
+        mock_parallel_client.task_run.retrieve.side_effect = [
+            mock.MagicMock(status="running"),
+            mock.MagicMock(status="completed"),
+        ]
+
+        assert get_research_status("trun_123")["status"] == "running"
+        assert get_research_status("trun_123")["status"] == "completed"
+        assert mock_parallel_client.task_run.retrieve.call_count == 2
+
+    def test_cache_is_keyed_by_api_key(self, mock_parallel_client):
+        """Should not serve a run cached under one API key to another key."""
+        mock_parallel_client.task_run.retrieve.return_value = mock.MagicMock(status="completed")
+
+        get_research_status("trun_123", api_key="key-a")
+        get_research_status("trun_123", api_key="key-b")
+        get_research_status("trun_123", api_key="key-a")
+
+        assert mock_parallel_client.task_run.retrieve.call_count == 2
+
+    def test_cache_evicts_least_recently_used(self, mock_parallel_client):
+        """Should keep at most _TERMINAL_CACHE_MAXSIZE runs, dropping the oldest."""
+        mock_parallel_client.task_run.retrieve.return_value = mock.MagicMock(status="completed")
+
+        with mock.patch.object(research, "_TERMINAL_CACHE_MAXSIZE", 2):
+            get_research_status("trun_1")
+            get_research_status("trun_2")
+            get_research_status("trun_1")  # cache hit, now most recently used
+            get_research_status("trun_3")  # evicts trun_2
+
+            assert [key[2] for key in research._terminal_cache] == ["trun_1", "trun_3"]
+            get_research_status("trun_2")
+
+        assert mock_parallel_client.task_run.retrieve.call_count == 4
+
+    def test_concurrent_calls_share_one_request(self, mock_parallel_client):
+        """Should coalesce a status lookup that arrives while one is in flight."""
+        results = []
+
+        def call():
+            results.append(get_research_status("trun_123"))
+
+        follower = threading.Thread(target=call)
+
+        def slow_retrieve(run_id):
+            # Start a second lookup while this one is still on the wire
+            follower.start()
+            time.sleep(0.2)
+            return mock.MagicMock(status="running")
+
+        mock_parallel_client.task_run.retrieve.side_effect = slow_retrieve
+
+        call()
+        follower.join(timeout=5)
+
+        assert [r["status"] for r in results] == ["running", "running"]
+        mock_parallel_client.task_run.retrieve.assert_called_once_with(run_id="trun_123")
+
+    def test_error_reaches_waiting_callers(self, mock_parallel_client):
+        """Should raise the request error and clear the in-flight entry."""
+        mock_parallel_client.task_run.retrieve.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            get_research_status("trun_123")
+
+        assert research._inflight_status == {}
+
 
 class TestGetResearchResult:
     """Tests for get_research_result function."""
@@ -141,6 +234,29 @@ class TestGetResearchResult:
         assert "output" in result
         assert result["output"]["content"]["text"] == "Research findings"
 
+    def test_caches_result(self, mock_parallel_client):
+        """Should fetch a completed run's result from the API only once."""
+        mock_parallel_client.task_run.result.return_value = mock.MagicMock(output={"content": "done"})
+
+        first = get_research_result("trun_123")
+        second = get_research_result("trun_123")
+
+        assert first == second
+        mock_parallel_client.task_run.result.assert_called_once_with(run_id="trun_123")
+
+    def test_mutating_result_does_not_corrupt_cache(self, mock_parallel_client):
+        """Should hand out independent copies of a cached result, including nested output."""
+        mock_parallel_client.task_run.result.return_value = mock.MagicMock(output={"content": "done"})
+
+        first = get_research_result("trun_123")
+        first["output"].pop("content")
+        second = get_research_result("trun_123")
+        second["output"]["content"] = "changed"
+        third = get_research_result("trun_123")
+
+        assert third["output"]["content"] == "done"
+        mock_parallel_client.task_run.result.assert_called_once_with(run_id="trun_123")
+
 
 class TestRunResearch:
     """Tests for run_research function."""
@@ -178,6 +294,45 @@ class TestRunResearch:
         assert result["status"] == "completed"
         assert "output" in result
 
+    def test_run_research_first_check_waits_for_processor_latency(self, mock_parallel_client):
+        """Should wait the processor's minimum latency before the first status check."""
+        mock_parallel_client.task_run.create.return_value = mock.MagicMock(run_id="trun_123")
+        mock_parallel_client.task_run.retrieve.side_effect = [
+            mock.MagicMock(status="running"),
+            mock.MagicMock(status="completed"),
+        ]
+        mock_parallel_client.task_run.result.return_value = mock.MagicMock(output={})
+
+        with mock.patch("parallel_web_tools.core.polling.time.sleep") as mock_sleep:
+            run_research("What is AI?", processor="pro-fast", poll_interval=45)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [30, 45]
+
+    def test_run_research_caps_first_check_delay(self, mock_parallel_client):
+        """Should not wait minutes before noticing a run on a slow processor failed."""
+        mock_parallel_client.task_run.create.return_value = mock.MagicMock(run_id="trun_123")
+        mock_parallel_client.task_run.retrieve.return_value = mock.MagicMock(status="failed", error="boom")
+
+        with (
+            mock.patch("parallel_web_tools.core.polling.time.sleep") as mock_sleep,
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            run_research("What is AI?", processor="ultra")
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [research._MAX_INITIAL_DELAY]
+
+    @pytest.mark.parametrize(
+        "processor,expected",
+        [("lite-fast", 10), ("pro-fast", 30), ("ultra-fast", 60), ("pro", 120), ("unknown", 0)],
+    )
+    def test_min_latency_seconds(self, processor, expected):
+        """Should look up the lower latency bound of a processor."""
+        assert _min_latency_seconds(processor) == expected
+
+    def test_every_processor_has_min_latency(self):
+        """Should keep the minimum latency table in step with RESEARCH_PROCESSORS."""
+        assert set(research._MIN_LATENCY_SECONDS) == set(RESEARCH_PROCESSORS)
+
     def test_run_research_timeout(self, mock_parallel_client):
         """Should raise TimeoutError when task doesn't complete."""
         mock_task = mock.MagicMock()
@@ -285,6 +440,61 @@ class TestRunResearch:
         assert ("completed", "trun_123") in statuses
 
 
+class TestArunResearch:
+    """Tests for the async arun_research function."""
+
+    @pytest.fixture
+    def mock_async_client(self):
+        """Patch create_async_client with an async-context-manager client mock."""
+        client = mock.MagicMock()
+        client.__aenter__.return_value = client
+        client.task_run.create = mock.AsyncMock(return_value=mock.MagicMock(run_id="trun_123", interaction_id="int_1"))
+        client.task_run.retrieve = mock.AsyncMock(
+            side_effect=[
+                mock.MagicMock(status="running", interaction_id=None),
+                mock.MagicMock(status="completed", interaction_id="int_1"),
+            ]
+        )
+        client.task_run.result = mock.AsyncMock(return_value=mock.MagicMock(output={"content": "Research complete"}))
+        with mock.patch("parallel_web_tools.core.research.create_async_client", return_value=client):
+            yield client
+
+    def test_arun_research_success(self, mock_async_client):
+        """Should create, poll and return the same result shape as run_research."""
+        statuses = []
+
+        with mock.patch("parallel_web_tools.core.polling.asyncio.sleep", new_callable=mock.AsyncMock) as mock_sleep:
+            result = asyncio.run(
+                arun_research(
+                    "What is AI?",
+                    processor="pro-fast",
+                    poll_interval=45,
+                    on_status=lambda status, run_id: statuses.append(status),
+                )
+            )
+
+        assert result == {
+            "run_id": "trun_123",
+            "interaction_id": "int_1",
+            "result_url": "https://platform.parallel.ai/play/deep-research/trun_123",
+            "status": "completed",
+            "output": {"content": "Research complete"},
+            "output_schema": "auto",
+        }
+        assert statuses == ["created", "running", "completed"]
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [30, 45]
+        mock_async_client.__aexit__.assert_awaited_once()
+
+    def test_arun_research_failed(self, mock_async_client):
+        """Should raise RuntimeError when the task fails."""
+        mock_async_client.task_run.retrieve.side_effect = None
+        mock_async_client.task_run.retrieve.return_value = mock.MagicMock(status="failed", error="boom")
+
+        with mock.patch("parallel_web_tools.core.polling.asyncio.sleep", new_callable=mock.AsyncMock):
+            with pytest.raises(RuntimeError, match="Research failed: boom"):
+                asyncio.run(arun_research("What is AI?"))
+
+
 class TestPollResearch:
     """Tests for poll_research function."""
 
@@ -307,6 +517,18 @@ class TestPollResearch:
         assert result["run_id"] == "trun_123"
         assert "output" in result
 
+    def test_poll_backs_off_with_max_poll_interval(self, mock_parallel_client):
+        """Should grow the wait between checks up to max_poll_interval."""
+        running = mock.MagicMock(status="running")
+        completed = mock.MagicMock(status="completed")
+        mock_parallel_client.task_run.retrieve.side_effect = [running, running, running, completed]
+        mock_parallel_client.task_run.result.return_value = mock.MagicMock(output={})
+
+        with mock.patch("parallel_web_tools.core.polling.time.sleep") as mock_sleep:
+            poll_research("trun_123", poll_interval=8, max_poll_interval=12)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [8, 10, 12]
+
 
 class TestResearchProcessors:
     """Tests for RESEARCH_PROCESSORS constant."""
@@ -682,6 +904,178 @@ class TestResearchPollCommand:
             assert result.exit_code == 0
             assert "Research Complete" in result.output
 
+    def test_research_poll_passes_max_poll_interval(self, runner, tmp_path, monkeypatch):
+        """Should forward --max-poll-interval to poll_research."""
+        monkeypatch.chdir(tmp_path)
+        with mock.patch("parallel_web_tools.cli.commands.poll_research") as mock_poll:
+            mock_poll.return_value = {
+                "run_id": "trun_123",
+                "status": "completed",
+                "output": {"content": {"text": "Research results here"}},
+            }
+
+            result = runner.invoke(main, ["research", "poll", "trun_123", "--max-poll-interval", "120"])
+
+        assert result.exit_code == 0
+        assert mock_poll.call_args.kwargs["max_poll_interval"] == 120
+
+
+class TestResearchRunBatchCommand:
+    """Tests for the research run-batch command."""
+
+    def test_runs_all_queries_and_saves_results(self, runner, tmp_path, monkeypatch):
+        """Should run every query in the file and save one result per task."""
+        monkeypatch.chdir(tmp_path)
+        queries = tmp_path / "queries.txt"
+        queries.write_text("First question\n\n# skipped\nSecond question\n")
+
+        async def fake_arun(query, **kwargs):
+            run_id = "trun_1" if query == "First question" else "trun_2"
+            return {"run_id": run_id, "status": "completed", "output": {"content": {"answer": query}}}
+
+        with mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun) as mock_arun:
+            result = runner.invoke(
+                main, ["research", "run-batch", str(queries), "-o", "out", "--max-poll-interval", "90"]
+            )
+
+        assert result.exit_code == 0, result.output
+        assert [c.args[0] for c in mock_arun.call_args_list] == ["First question", "Second question"]
+        assert mock_arun.call_args.kwargs["max_poll_interval"] == 90
+        assert json.loads((tmp_path / "out" / "trun_1.json").read_text())["output"]["content"] == {
+            "answer": "First question"
+        }
+        assert (tmp_path / "out" / "trun_2.json").exists()
+
+    def test_reports_failed_queries(self, runner, tmp_path, monkeypatch):
+        """Should save successful tasks and exit non-zero when any task fails."""
+        monkeypatch.chdir(tmp_path)
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Good question\nBad question\n")
+
+        async def fake_arun(query, **kwargs):
+            if query == "Bad question":
+                raise RuntimeError("Research failed: boom")
+            return {"run_id": "trun_ok", "status": "completed", "output": {"content": {}}}
+
+        with mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun):
+            result = runner.invoke(main, ["research", "run-batch", str(queries)])
+
+        assert result.exit_code == 4
+        assert "Bad question" in result.output
+        assert (tmp_path / "parallel-research" / "trun_ok.json").exists()
+
+    def test_cancelled_task_counts_as_failure(self, runner, tmp_path, monkeypatch):
+        """Should report a cancelled task as failed rather than trying to save it."""
+        monkeypatch.chdir(tmp_path)
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Good question\nCancelled question\n")
+
+        async def fake_arun(query, **kwargs):
+            if query == "Cancelled question":
+                raise asyncio.CancelledError()
+            return {"run_id": "trun_ok", "status": "completed", "output": {"content": {}}}
+
+        with mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun):
+            result = runner.invoke(main, ["research", "run-batch", str(queries)])
+
+        assert result.exit_code == 4
+        assert "Failed: Cancelled question" in result.output
+        assert (tmp_path / "parallel-research" / "trun_ok.json").exists()
+
+    def test_save_error_does_not_stop_other_results(self, runner, tmp_path, monkeypatch):
+        """Should count a result that cannot be saved as failed and still save the rest."""
+        monkeypatch.chdir(tmp_path)
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Existing question\nNew question\n")
+        (tmp_path / "parallel-research").mkdir()
+        (tmp_path / "parallel-research" / "trun_1.json").write_text("{}")
+
+        async def fake_arun(query, **kwargs):
+            run_id = "trun_1" if query == "Existing question" else "trun_2"
+            return {"run_id": run_id, "status": "completed", "output": {"content": {}}}
+
+        with mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun):
+            result = runner.invoke(main, ["research", "run-batch", str(queries)])
+
+        assert result.exit_code == 4
+        assert "Failed: Existing question: Refusing to overwrite" in result.output
+        assert (tmp_path / "parallel-research" / "trun_1.json").read_text() == "{}"
+        assert (tmp_path / "parallel-research" / "trun_2.json").exists()
+
+    def test_unwritable_result_does_not_stop_other_results(self, runner, tmp_path, monkeypatch):
+        """Should count a result whose /tmp fallback also fails as failed and still save the rest."""
+        monkeypatch.chdir(tmp_path)
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Unlucky question\nNew question\n")
+        real_open = open
+
+        def flaky_open(path, *args, **kwargs):
+            if str(path).endswith("trun_1.json"):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_open(path, *args, **kwargs)
+
+        async def fake_arun(query, **kwargs):
+            run_id = "trun_1" if query == "Unlucky question" else "trun_2"
+            return {"run_id": run_id, "status": "completed", "output": {"content": {}}}
+
+        with (
+            mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun),
+            mock.patch("builtins.open", flaky_open),
+        ):
+            result = runner.invoke(main, ["research", "run-batch", str(queries)])
+
+        assert result.exit_code == 4
+        assert "Failed: Unlucky question: [Errno 13] Permission denied" in result.output
+        assert (tmp_path / "parallel-research" / "trun_2.json").exists()
+
+    def test_json_prints_one_array(self, runner, tmp_path, monkeypatch):
+        """Should print a single JSON array with one document per query, in order."""
+        monkeypatch.chdir(tmp_path)
+        queries = tmp_path / "queries.txt"
+        queries.write_text("Good question\nBad question\n")
+
+        async def fake_arun(query, **kwargs):
+            if query == "Bad question":
+                raise RuntimeError("Research failed: boom")
+            return {"run_id": "trun_ok", "status": "completed", "output": {"content": {}}}
+
+        with mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun):
+            result = runner.invoke(main, ["research", "run-batch", str(queries), "--json"])
+
+        assert result.exit_code == 4
+        documents = json.loads(result.output)
+        assert documents[0]["run_id"] == "trun_ok"
+        assert documents[1]["error"]["query"] == "Bad question"
+
+    def test_interrupt_prints_poll_hint_per_created_task(self, runner, tmp_path):
+        """Should list every task created before Ctrl-C so it can be resumed."""
+        queries = tmp_path / "queries.txt"
+        queries.write_text("First question\nSecond question\n")
+
+        async def fake_arun(query, on_status, **kwargs):
+            run_id = "trun_1" if query == "First question" else "trun_2"
+            on_status("created", run_id)
+            await asyncio.sleep(0)
+            raise KeyboardInterrupt
+
+        with mock.patch("parallel_web_tools.cli.commands.arun_research", side_effect=fake_arun):
+            result = runner.invoke(main, ["research", "run-batch", str(queries)])
+
+        assert result.exit_code == 130
+        assert "Interrupted before task creation" not in result.output
+        assert "research poll trun_1" in result.output
+        assert "research poll trun_2" in result.output
+
+    def test_empty_file_is_usage_error(self, runner, tmp_path):
+        """Should reject a file with no queries."""
+        queries = tmp_path / "queries.txt"
+        queries.write_text("\n# nothing here\n")
+
+        result = runner.invoke(main, ["research", "run-batch", str(queries)])
+
+        assert result.exit_code == 2
+        assert "No queries found" in result.output
+
 
 class TestResearchProcessorsCommand:
     """Tests for the research processors command."""